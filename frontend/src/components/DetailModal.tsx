@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo, useRef } from 'react';
 import { X, Loader2, Trash2, Sparkles, GitMerge, Music } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { RadioGroup } from '@/components/ui/radio-group';
@@ -34,16 +34,19 @@ export function DetailModal({ artist, albumId, onClose, onDedupe, no_move, best_
     }
   }, [details]);
 
-  // Handle Escape key to close modal
+  // Handle Escape key to close modal. Parents usually pass an inline onClose, so read it
+  // through a ref and register the listener once per open instead of on every parent poll.
+  const onCloseRef = useRef(onClose);
+  onCloseRef.current = onClose;
   useEffect(() => {
     const handleEscape = (e: KeyboardEvent) => {
       if (e.key === 'Escape') {
-        onClose();
+        onCloseRef.current();
       }
     };
     window.addEventListener('keydown', handleEscape);
     return () => window.removeEventListener('keydown', handleEscape);
-  }, [onClose]);
+  }, []);
 
   const handleDedupe = async () => {
     setIsDeduping(true);
@@ -64,15 +67,21 @@ export function DetailModal({ artist, albumId, onClose, onDedupe, no_move, best_
     refetch();
   };
 
-  // Parse rationale into bullets
-  const rationaleItems = details?.rationale
-    ? details.rationale.split(';').filter(Boolean).map(s => s.trim())
-    : [];
-
-  const hasMergeTracks = details?.merge_list && details.merge_list.length > 0;
+  // Everything derived from `details` is computed once per payload, not on every
+  // edition click / track toggle re-render.
+  const { rationaleItems, hasMergeTracks, hasTracks, hasTrackCounts } = useMemo(
+    () => ({
+      // Parse rationale into bullets
+      rationaleItems: details?.rationale
+        ? details.rationale.split(';').filter(Boolean).map(s => s.trim())
+        : [],
+      hasMergeTracks: !!(details?.merge_list && details.merge_list.length > 0),
+      hasTracks: !!details?.editions?.some(e => e.tracks && e.tracks.length > 0),
+      hasTrackCounts: !!details?.editions?.some(e => (e.track_count ?? 0) > 0),
+    }),
+    [details]
+  );
   const selectedEditionIndex = parseInt(selectedEdition);
-  const hasTracks = details?.editions?.some(e => e.tracks && e.tracks.length > 0);
-  const hasTrackCounts = details?.editions?.some(e => (e.track_count ?? 0) > 0);
 
   return (
     <>
@@ -1,4 +1,4 @@
-import { memo, useState } from 'react';
+import { memo, useCallback, useMemo, useState, type MouseEvent } from 'react';
 import { Loader2, Trash2, Sparkles, FileSearch } from 'lucide-react';
 import { Checkbox } from '@/components/ui/checkbox';
 import { Button } from '@/components/ui/button';
@@ -19,20 +19,21 @@ interface DuplicateTableProps {
   listMode: ListMode;
 }
 
+const rowKeyOf = (dup: DuplicateCard) => `${dup.artist_key}||${dup.album_id}`;
+
+// Rows carry no click handlers of their own: one delegated listener on <tbody> resolves the row
+// from data-row-key and the control from data-row-action, so memo() can skip every row whose own
+// data did not change and rows cost no listener bindings.
 const TableRow = memo(function TableRow({
   dup,
+  rowKey,
   isSelected,
-  onSelect,
-  onOpen,
-  onDedupe,
   isDeduping,
   listMode,
 }: {
   dup: DuplicateCard;
+  rowKey: string;
   isSelected: boolean;
-  onSelect: () => void;
-  onOpen: () => void;
-  onDedupe: () => void;
   isDeduping: boolean;
   listMode: ListMode;
 }) {
@@ -49,12 +50,12 @@ const TableRow = memo(function TableRow({
         "group transition-colors cursor-pointer",
         isSelected ? "bg-primary/10" : "hover:bg-muted/50"
       )}
-      onClick={onOpen}
+      data-row-key={rowKey}
     >
-      <td className="px-3 py-3" onClick={(e) => e.stopPropagation()}>
+      <td className="px-3 py-3" data-row-action="">
         <Checkbox
           checked={isSelected}
-          onCheckedChange={onSelect}
+          data-row-action="select"
           aria-label={`Select ${dup.artist} - ${dup.best_title}`}
         />
       </td>
@@ -64,8 +65,11 @@ const TableRow = memo(function TableRow({
             <img
               src={dup.best_thumb}
               alt=""
+              width={40}
+              height={40}
               className="w-full h-full object-cover"
               loading="lazy"
+              decoding="async"
               onError={() => setCoverBroken(true)}
             />
           ) : (
@@ -136,12 +140,12 @@ const TableRow = memo(function TableRow({
           </td>
         </>
       )}
-      <td className="px-3 py-3" onClick={(e) => e.stopPropagation()}>
+      <td className="px-3 py-3" data-row-action="">
         {dup.no_move ? (
           <Button
             size="sm"
             variant="outline"
-            onClick={onOpen}
+            data-row-action="open"
             className="gap-1"
             title="Manual review required for this duplicate group"
           >
@@ -151,7 +155,7 @@ const TableRow = memo(function TableRow({
           <Button
             size="sm"
             variant="ghost"
-            onClick={onDedupe}
+            data-row-action="dedupe"
             disabled={isDeduping}
             className="gap-1 opacity-0 group-hover:opacity-100 transition-opacity"
           >
@@ -180,8 +184,22 @@ export const DuplicateTable = memo(function DuplicateTable({
   listMode,
 }: DuplicateTableProps) {
   const allSelected = duplicates.length > 0 && duplicates.every(
-    d => selectedIds.has(`${d.artist_key}||${d.album_id}`)
+    d => selectedIds.has(rowKeyOf(d))
   );
+  const byKey = useMemo(() => new Map(duplicates.map((d) => [rowKeyOf(d), d])), [duplicates]);
+
+  const handleBodyClick = useCallback((event: MouseEvent<HTMLTableSectionElement>) => {
+    const target = event.target as HTMLElement;
+    const row = target.closest<HTMLTableRowElement>('tr[data-row-key]');
+    const rowKey = row?.dataset.rowKey;
+    const dup = rowKey ? byKey.get(rowKey) : undefined;
+    if (!rowKey || !dup) return;
+    // Nearest data-row-action wins: a control's own action, or "" for the padding of a control cell.
+    const action = target.closest<HTMLElement>('[data-row-action]')?.dataset.rowAction;
+    if (action === undefined || action === 'open') onOpen(dup);
+    else if (action === 'select') onSelect(rowKey);
+    else if (action === 'dedupe') onDedupe(dup);
+  }, [byKey, onOpen, onSelect, onDedupe]);
 
   const handleSelectAll = () => {
     if (allSelected) {
@@ -246,17 +264,15 @@ export const DuplicateTable = memo(function DuplicateTable({
               </th>
             </tr>
           </thead>
-          <tbody className="divide-y divide-border">
+          <tbody className="divide-y divide-border" onClick={handleBodyClick}>
             {duplicates.map((dup) => {
-              const key = `${dup.artist_key}||${dup.album_id}`;
+              const key = rowKeyOf(dup);
               return (
                 <TableRow
                   key={key}
                   dup={dup}
+                  rowKey={key}
                   isSelected={selectedIds.has(key)}
-                  onSelect={() => onSelect(key)}
-                  onOpen={() => onOpen(dup)}
-                  onDedupe={() => onDedupe(dup)}
                   isDeduping={dedupingId === key}
                   listMode={listMode}
                 />
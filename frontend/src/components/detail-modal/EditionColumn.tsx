@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { memo, useState } from 'react';
 import { Crown, Copy, Check, Disc3, Database } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { RadioGroupItem } from '@/components/ui/radio-group';
@@ -14,7 +14,7 @@ interface EditionColumnProps {
   totalEditions: number;
 }
 
-export function EditionColumn({ edition, index, isSelected, totalEditions }: EditionColumnProps) {
+export const EditionColumn = memo(function EditionColumn({ edition, index, isSelected, totalEditions }: EditionColumnProps) {
   const [copied, setCopied] = useState(false);
   const [copiedMbid, setCopiedMbid] = useState(false);
   const [coverBroken, setCoverBroken] = useState(false);
@@ -71,6 +71,8 @@ export function EditionColumn({ edition, index, isSelected, totalEditions }: Edi
           <img
             src={edition.thumb_data || edition.thumb_url}
             alt=""
+            loading="lazy"
+            decoding="async"
             className="w-full h-full object-cover"
             onError={() => setCoverBroken(true)}
           />
@@ -166,4 +168,4 @@ export function EditionColumn({ edition, index, isSelected, totalEditions }: Edi
       </div>
     </div>
   );
-}
+});
@@ -0,0 +1,18 @@
+import { useEffect, useState } from 'react';
+
+/** Return `value` once it has stopped changing for `delay` ms (e.g. search-as-you-type). */
+export function useDebounce<T>(value: T, delay: number): T {
+  const [debouncedValue, setDebouncedValue] = useState<T>(value);
+
+  useEffect(() => {
+    const handler = setTimeout(() => {
+      setDebouncedValue(value);
+    }, delay);
+
+    return () => {
+      clearTimeout(handler);
+    };
+  }, [value, delay]);
+
+  return debouncedValue;
+}
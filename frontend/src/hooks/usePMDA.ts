@@ -137,6 +137,9 @@ export function useScanControls() {
   const invalidateQueries = () => {
     queryClient.invalidateQueries({ queryKey: ['duplicates'] });
     queryClient.invalidateQueries({ queryKey: ['dedupe-progress'] });
+    // Shared status pollers back off while idle; refetch so a new run shows up at once.
+    queryClient.invalidateQueries({ queryKey: ['scan-progress-shared'] });
+    queryClient.invalidateQueries({ queryKey: ['dedupe-progress-shared'] });
   };
 
   const startMutation = useMutation<
@@ -232,7 +235,20 @@ export function useDedupeActions() {
 
   const dedupeSelected = useMutation({
     mutationFn: (selected: string[]) => api.dedupeSelected(selected),
-    onSuccess: invalidateQueries,
+    onSuccess: (result) => {
+      if (!Array.isArray(result?.removed)) {
+        invalidateQueries();
+        return;
+      }
+      // Drop the deduped cards from the cached list instead of refetching every card;
+      // the regular duplicates poll reconciles anything else later.
+      const removed = new Set(result.removed);
+      queryClient.setQueriesData<DuplicateCard[]>({ queryKey: ['duplicates'] }, (old) =>
+        old?.filter((d) => !removed.has(`${d.artist_key}||${d.album_id}`))
+      );
+      queryClient.invalidateQueries({ queryKey: ['dedupe-progress'] });
+      queryClient.invalidateQueries({ queryKey: ['scan-history'] });
+    },
   });
 
   const dedupeAll = useMutation({
@@ -0,0 +1,159 @@
+import { useQueryClient, type QueryClient } from '@tanstack/react-query';
+import { useEffect, useSyncExternalStore } from 'react';
+import {
+  getProgressEventsUrl,
+  type DuplicateCard,
+  type DuplicatesDeltaEvent,
+  type ProgressEvent,
+} from '@/lib/api';
+
+/**
+ * One EventSource on /api/events shared by every component that shows scan/dedupe progress.
+ * Each pushed event invalidates the matching progress queries, so /api/progress and /api/dedupe
+ * are only refetched when counters actually move (and right away when a job finishes).
+ * "duplicates" events carry the cards of groups found by the running scan; they are merged into
+ * the cached scan list so the Unduper grows without refetching every card.
+ * While the stream is down (proxy buffering, 503 when all stream slots are taken, non-admin
+ * sessions) `connected` stays false and callers keep polling as before.
+ */
+
+let source: EventSource | null = null;
+let subscribers = 0;
+let connected = false;
+let lastEvent: ProgressEvent | null = null;
+let activeClient: QueryClient | null = null;
+const listeners = new Set<() => void>();
+
+function setConnected(next: boolean) {
+  if (connected === next) return;
+  connected = next;
+  listeners.forEach((listener) => listener());
+}
+
+function scanMoved(prev: ProgressEvent | null, next: ProgressEvent): boolean {
+  return !prev
+    || prev.scanning !== next.scanning
+    || prev.scan_paused !== next.scan_paused
+    || prev.scan_progress !== next.scan_progress
+    || prev.scan_total !== next.scan_total
+    || prev.scan_step_progress !== next.scan_step_progress
+    || prev.scan_artists_processed !== next.scan_artists_processed;
+}
+
+function dedupeMoved(prev: ProgressEvent | null, next: ProgressEvent): boolean {
+  return !prev
+    || prev.deduping !== next.deduping
+    || prev.dedupe_progress !== next.dedupe_progress
+    || prev.dedupe_total !== next.dedupe_total;
+}
+
+function handleMessage(ev: MessageEvent<string>) {
+  let next: ProgressEvent;
+  try {
+    next = JSON.parse(ev.data) as ProgressEvent;
+  } catch {
+    return;
+  }
+  const prev = lastEvent;
+  lastEvent = next;
+  setConnected(true);
+  const client = activeClient;
+  if (!client) return;
+  if (scanMoved(prev, next)) {
+    client.invalidateQueries({ queryKey: ['scan-progress-shared'] });
+    client.invalidateQueries({ queryKey: ['scan-progress'] });
+  }
+  if (dedupeMoved(prev, next)) {
+    client.invalidateQueries({ queryKey: ['dedupe-progress-shared'] });
+    client.invalidateQueries({ queryKey: ['dedupe-progress'] });
+  }
+  if (prev?.scanning && !next.scanning) {
+    // Deltas stop with the scan; pick up the final (AI-merged, persisted) list once.
+    client.invalidateQueries({ queryKey: ['duplicates'] });
+  }
+}
+
+const cardKey = (card: DuplicateCard) => `${card.artist_key}||${card.album_id}`;
+
+function handleDuplicates(ev: MessageEvent<string>) {
+  let delta: DuplicatesDeltaEvent;
+  try {
+    delta = JSON.parse(ev.data) as DuplicatesDeltaEvent;
+  } catch {
+    return;
+  }
+  const client = activeClient;
+  if (!client) return;
+  if (delta.reset) {
+    client.invalidateQueries({ queryKey: ['duplicates', 'scan'] });
+    return;
+  }
+  if (!delta.cards?.length) return;
+  client.setQueriesData<DuplicateCard[]>({ queryKey: ['duplicates', 'scan'] }, (old) => {
+    if (!old) return old;
+    const incoming = new Map(delta.cards.map((card) => [cardKey(card), card]));
+    const merged = old.map((card) => {
+      const key = cardKey(card);
+      const updated = incoming.get(key);
+      if (!updated) return card;
+      incoming.delete(key);
+      return updated;
+    });
+    return incoming.size ? [...merged, ...incoming.values()] : merged;
+  });
+}
+
+function openSource() {
+  if (source || typeof EventSource === 'undefined') return;
+  const es = new EventSource(getProgressEventsUrl());
+  es.onmessage = handleMessage;
+  es.addEventListener('duplicates', handleDuplicates);
+  es.onerror = () => {
+    setConnected(false);
+    lastEvent = null;
+    // The browser retries dropped connections itself; a non-200 answer (503, 401) closes the
+    // stream for good, so release it and let callers poll.
+    if (es.readyState === EventSource.CLOSED && source === es) {
+      source = null;
+    }
+  };
+  source = es;
+}
+
+function closeSource() {
+  source?.close();
+  source = null;
+  lastEvent = null;
+  setConnected(false);
+}
+
+function subscribe(listener: () => void) {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+function getConnected() {
+  return connected;
+}
+
+/** Keep the shared progress stream open while mounted; returns whether events are flowing. */
+export function useProgressEvents(): boolean {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    activeClient = queryClient;
+    subscribers += 1;
+    openSource();
+    return () => {
+      subscribers -= 1;
+      if (subscribers <= 0) {
+        subscribers = 0;
+        closeSource();
+      }
+    };
+  }, [queryClient]);
+
+  return useSyncExternalStore(subscribe, getConnected, getConnected);
+}
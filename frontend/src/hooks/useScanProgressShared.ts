@@ -3,8 +3,17 @@ import { useCallback, useEffect, useRef } from 'react';
 import { getScanProgress, getDedupeProgress, type ScanProgress, type DedupeProgress } from '@/lib/api';
 import { buildScanPipelineSteps } from '@/lib/scanPipeline';
 import { buildScanPresentationModel } from '@/lib/scanPresentation';
+import { useProgressEvents } from '@/hooks/useProgressEvents';
 import { toast } from 'sonner';
 
+/** Poll interval used while neither a scan nor a dedupe is running. */
+const IDLE_POLL_INTERVAL = 5000;
+/**
+ * Poll interval for a running job while the /api/events stream is up: counter moves and
+ * completion arrive as events, polling only refreshes the detail fields in between.
+ */
+const STREAMING_BUSY_POLL_INTERVAL = 5000;
+
 interface UseScanProgressSharedOptions {
   /** Poll interval in ms (default: 2000) */
   pollInterval?: number;
@@ -24,12 +33,19 @@ export function useScanProgressShared(options: UseScanProgressSharedOptions = {}
   const wasDedupingRef = useRef(false);
   const hasToastedRef = useRef(false);
   const hasDedupeToastedRef = useRef(false);
+  const streaming = useProgressEvents();
+  // Idle tabs stop polling entirely while the event stream is connected.
+  const refetchIntervalFor = (busy: boolean | undefined): number | false => {
+    if (streaming) return busy ? Math.max(pollInterval, STREAMING_BUSY_POLL_INTERVAL) : false;
+    return busy ? pollInterval : Math.max(pollInterval, IDLE_POLL_INTERVAL);
+  };
 
   // Scan progress query
   const { data: progress, isLoading, error } = useQuery<ScanProgress>({
     queryKey: ['scan-progress-shared'],
     queryFn: getScanProgress,
-    refetchInterval: pollInterval,
+    // Only poll at full rate while a scan is running; idle status changes slowly.
+    refetchInterval: (query) => refetchIntervalFor(query.state.data?.scanning),
     staleTime: 1000,
     retry: 1,
   });
@@ -38,7 +54,7 @@ export function useScanProgressShared(options: UseScanProgressSharedOptions = {}
   const { data: dedupeProgress } = useQuery<DedupeProgress>({
     queryKey: ['dedupe-progress-shared'],
     queryFn: getDedupeProgress,
-    refetchInterval: pollInterval,
+    refetchInterval: (query) => refetchIntervalFor(query.state.data?.deduping),
     staleTime: 1000,
     retry: 1,
   });
@@ -399,6 +415,9 @@ export function useScanProgressShared(options: UseScanProgressSharedOptions = {}
     // Last scan summary
     lastScanSummary: progress?.last_scan_summary,
     
+    // True while /api/events is connected (progress and duplicate deltas are pushed)
+    streaming,
+
     // Actions
     refresh,
   };
@@ -683,7 +683,8 @@ export interface Track {
 }
 
 export interface Edition {
-  thumb_data: string;
+  /** Inline data URI; only sent when the edition has no cover URL in the Files index. */
+  thumb_data?: string | null;
   thumb_url?: string;
   title_raw: string;
   size: number;
@@ -712,7 +713,9 @@ export interface DuplicateDetails {
 }
 
 export interface MovedItem {
-  thumb_data: string;
+  /** Album id of the edition that was kept (load its cover via thumb_url). */
+  best_album_id: number | null;
+  thumb_url?: string;
   artist: string;
   title_raw: string;
   size: number;
@@ -727,6 +730,8 @@ export interface DedupeResult {
   /** When backend runs dedupe in background: "started" and moved=[] */
   status?: string;
   message?: string;
+  /** Selection keys ("artist_key||album_id") whose groups were deduped (POST /dedupe/selected). */
+  removed?: string[];
 }
 
 export interface PMDAConfig {
@@ -3655,6 +3660,33 @@ export async function getScanProgress(): Promise<ScanProgress> {
   return fetchApi<ScanProgress>('/api/progress');
 }
 
+/** Counters pushed by the /api/events SSE stream whenever scan or dedupe progress moves. */
+export interface ProgressEvent {
+  scanning: boolean;
+  scan_paused: boolean;
+  scan_progress: number;
+  scan_total: number;
+  scan_step_progress: number;
+  scan_artists_processed: number;
+  deduping: boolean;
+  dedupe_progress: number;
+  dedupe_total: number;
+}
+
+/** Named "duplicates" event on /api/events: cards for groups found by the running scan. */
+export interface DuplicatesDeltaEvent {
+  seq: number;
+  /** True when groups were dropped before this stream sent them: reload getDuplicates() instead. */
+  reset: boolean;
+  cards: DuplicateCard[];
+}
+
+/** URL of the scan/dedupe progress event stream (EventSource; auth rides on the session cookie). */
+export function getProgressEventsUrl(): string {
+  const base = API_BASE_URL || '';
+  return `${base}/api/events`;
+}
+
 export async function getCacheControlMetrics(force: boolean = false): Promise<CacheControlMetrics> {
   return fetchApi<CacheControlMetrics>(`/api/statistics/cache-control${force ? '?force=true' : ''}`);
 }
@@ -18,6 +18,7 @@ import { type TrackInfo } from '@/components/library/AudioPlayer';
 import { usePlayback } from '@/contexts/PlaybackContext';
 import { FormatBadge } from '@/components/FormatBadge';
 import { useToast } from '@/hooks/use-toast';
+import { useDebounce } from '@/hooks/use-debounce';
 import { cn } from '@/lib/utils';
 import * as api from '@/lib/api';
 import { AspectRatio } from '@/components/ui/aspect-ratio';
@@ -196,23 +197,6 @@ function IssueBadges({ album, className }: { album: AlbumInfo; className?: strin
   );
 }
 
-// Debounce hook
-function useDebounce<T>(value: T, delay: number): T {
-  const [debouncedValue, setDebouncedValue] = useState<T>(value);
-
-  useEffect(() => {
-    const handler = setTimeout(() => {
-      setDebouncedValue(value);
-    }, delay);
-
-    return () => {
-      clearTimeout(handler);
-    };
-  }, [value, delay]);
-
-  return debouncedValue;
-}
-
 export default function LibraryBrowser() {
   const navigate = useNavigate();
   const [searchParams] = useSearchParams();
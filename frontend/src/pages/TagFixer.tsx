@@ -1,4 +1,5 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useMemo, useRef } from 'react';
+import { useVirtualizer } from '@tanstack/react-virtual';
 import { Search, Music, Loader2, Tag, Filter } from 'lucide-react';
 import { Input } from '@/components/ui/input';
 import { Button } from '@/components/ui/button';
@@ -6,6 +7,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/com
 import { Badge } from '@/components/ui/badge';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { useToast } from '@/hooks/use-toast';
+import { useDebounce } from '@/hooks/use-debounce';
 
 interface MissingTagAlbum {
   album_id: number;
@@ -19,8 +21,9 @@ export default function TagFixer() {
   const [loading, setLoading] = useState(false);
   const [scanning, setScanning] = useState(false);
   const [albums, setAlbums] = useState<MissingTagAlbum[]>([]);
-  const [filteredAlbums, setFilteredAlbums] = useState<MissingTagAlbum[]>([]);
   const [searchQuery, setSearchQuery] = useState('');
+  // Filter once per typing pause instead of re-rendering the whole list on every keystroke.
+  const debouncedSearchQuery = useDebounce(searchQuery, 150);
   const [filterArtist, setFilterArtist] = useState<string>('all');
   const [artists, setArtists] = useState<string[]>([]);
   const { toast } = useToast();
@@ -33,7 +36,6 @@ export default function TagFixer() {
         const data = await response.json();
         const list = data.albums || [];
         setAlbums(list);
-        setFilteredAlbums(list);
         const uniqueArtists = Array.from(new Set(list.map((a: MissingTagAlbum) => a.artist_name))).sort() as string[];
         setArtists(uniqueArtists);
         if (showToast) {
@@ -62,22 +64,36 @@ export default function TagFixer() {
     loadMissingTags(false);
   }, [loadMissingTags]);
 
-  useEffect(() => {
-    let filtered = albums;
-    
-    if (searchQuery) {
-      filtered = filtered.filter(a =>
-        a.album_title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        a.artist_name.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-    
-    if (filterArtist !== 'all') {
-      filtered = filtered.filter(a => a.artist_name === filterArtist);
-    }
-    
-    setFilteredAlbums(filtered);
-  }, [searchQuery, filterArtist, albums]);
+  // Lowercase each album's searchable fields once per list, not once per album per keystroke.
+  const searchIndex = useMemo(
+    () =>
+      albums.map((a) => ({
+        album: a,
+        haystack: `${a.album_title}\n${a.artist_name}`.toLowerCase(),
+      })),
+    [albums]
+  );
+
+  // Derived during render (no effect + second state update), so each search costs one render pass.
+  const filteredAlbums = useMemo(() => {
+    const q = debouncedSearchQuery.trim().toLowerCase();
+    if (!q && filterArtist === 'all') return albums;
+    return searchIndex
+      .filter((entry) =>
+        (!q || entry.haystack.includes(q)) &&
+        (filterArtist === 'all' || entry.album.artist_name === filterArtist)
+      )
+      .map((entry) => entry.album);
+  }, [albums, searchIndex, debouncedSearchQuery, filterArtist]);
+
+  // Only the visible cards (plus overscan) are mounted, so large libraries keep a bounded DOM.
+  const albumsListRef = useRef<HTMLDivElement>(null);
+  const rowVirtualizer = useVirtualizer({
+    count: filteredAlbums.length,
+    getScrollElement: () => albumsListRef.current,
+    estimateSize: () => 132,
+    overscan: 6,
+  });
 
   return (
     <div className="pmda-page-shell pmda-page-stack">
@@ -127,36 +143,55 @@ export default function TagFixer() {
         )}
 
         {filteredAlbums.length > 0 ? (
-          <div className="grid gap-4">
-            {filteredAlbums.map((album) => (
-              <Card key={album.album_id}>
-                <CardHeader>
-                  <div className="flex items-start justify-between">
-                    <div className="flex-1 min-w-0">
-                      <CardTitle className="truncate">{album.album_title}</CardTitle>
-                      <CardDescription>
-                        {album.artist_name} {album.year && `• ${album.year}`}
-                      </CardDescription>
-                    </div>
-                    <div className="flex items-center gap-2 shrink-0">
-                      {album.missing_tags.length > 0 && (
-                        <Badge variant="outline" className="gap-1">
-                          <Tag className="w-3 h-3" />
-                          {album.missing_tags.length} missing
-                        </Badge>
-                      )}
-                    </div>
+          <div ref={albumsListRef} className="max-h-[70vh] overflow-y-auto">
+            <div style={{ height: `${rowVirtualizer.getTotalSize()}px`, width: '100%', position: 'relative' }}>
+              {rowVirtualizer.getVirtualItems().map((virtualRow) => {
+                const album = filteredAlbums[virtualRow.index];
+                return (
+                  <div
+                    key={album.album_id}
+                    data-index={virtualRow.index}
+                    ref={rowVirtualizer.measureElement}
+                    style={{
+                      position: 'absolute',
+                      top: 0,
+                      left: 0,
+                      width: '100%',
+                      transform: `translateY(${virtualRow.start}px)`,
+                    }}
+                    className="pb-4 pr-1"
+                  >
+                    <Card>
+                      <CardHeader>
+                        <div className="flex items-start justify-between">
+                          <div className="flex-1 min-w-0">
+                            <CardTitle className="truncate">{album.album_title}</CardTitle>
+                            <CardDescription>
+                              {album.artist_name} {album.year && `• ${album.year}`}
+                            </CardDescription>
+                          </div>
+                          <div className="flex items-center gap-2 shrink-0">
+                            {album.missing_tags.length > 0 && (
+                              <Badge variant="outline" className="gap-1">
+                                <Tag className="w-3 h-3" />
+                                {album.missing_tags.length} missing
+                              </Badge>
+                            )}
+                          </div>
+                        </div>
+                      </CardHeader>
+                      <CardContent>
+                        {album.missing_tags.length > 0 && (
+                          <div className="text-xs text-muted-foreground">
+                            Missing: {album.missing_tags.join(', ')}
+                          </div>
+                        )}
+                      </CardContent>
+                    </Card>
                   </div>
-                </CardHeader>
-                <CardContent>
-                  {album.missing_tags.length > 0 && (
-                    <div className="text-xs text-muted-foreground">
-                      Missing: {album.missing_tags.join(', ')}
-                    </div>
-                  )}
-                </CardContent>
-              </Card>
-            ))}
+                );
+              })}
+            </div>
           </div>
         ) : albums.length === 0 ? (
           <Card>
@@ -1,9 +1,10 @@
-import { useState, useMemo, useCallback, useEffect, useRef } from 'react';
+import { useState, useMemo, useCallback, useEffect, useRef, useDeferredValue } from 'react';
 import { Trash2, Loader2, GitMerge, Undo2, Disc3, Search } from 'lucide-react';
 import { toast } from 'sonner';
 import { useQueryClient } from '@tanstack/react-query';
 import { useSearchParams } from 'react-router-dom';
 import { SearchInput } from '@/components/SearchInput';
+import { useDebounce } from '@/hooks/use-debounce';
 import { ListModeToggle, type ListMode } from '@/components/ListModeToggle';
 import { DuplicateTable } from '@/components/DuplicateTable';
 import { DetailModal } from '@/components/DetailModal';
@@ -66,6 +67,10 @@ function DedupeCurrentGroupCard({ group }: { group: DedupeCurrentGroup }) {
   );
 }
 
+// Stable fallback while the first poll is in flight: a fresh `[]` per render would invalidate the
+// search index / filter / pagination memos and re-render every row on each tick.
+const NO_DUPLICATES: DuplicateCardType[] = [];
+
 export default function Unduper() {
   const [searchParams] = useSearchParams();
   const reviewScanId = useMemo(() => {
@@ -87,12 +92,13 @@ export default function Unduper() {
   const [reviewMovesFilter, setReviewMovesFilter] = useState<'all' | 'active' | 'restored'>('all');
   const [selectedReviewMove, setSelectedReviewMove] = useState<ScanMove | null>(null);
 
-  // Data hooks (refetch duplicates every 2s during scan so list grows as artists finish, 1s during dedupe)
-  const { progress: scanProgress, dedupeProgress } = useScanProgressShared({ pollInterval: 2500 });
+  // Data hooks: during a scan the list grows from /api/events "duplicates" deltas when the stream is
+  // up (slow poll as a safety net), otherwise by refetching every 3.5s; 2s during dedupe.
+  const { progress: scanProgress, dedupeProgress, streaming } = useScanProgressShared({ pollInterval: 2500 });
   const duplicateSource: 'scan' | 'all' = (scanProgress?.scanning || dedupeProgress?.deduping) ? 'scan' : 'all';
-  const { data: duplicates = [], isLoading: loadingDuplicates } = useDuplicates({
+  const { data: duplicates = NO_DUPLICATES, isLoading: loadingDuplicates } = useDuplicates({
     source: duplicateSource,
-    refetchInterval: scanProgress?.scanning ? 3500 : dedupeProgress?.deduping ? 2000 : 12000,
+    refetchInterval: scanProgress?.scanning ? (streaming ? 30000 : 3500) : dedupeProgress?.deduping ? 2000 : 12000,
   });
   const { data: libraryStats, error: libraryStatsError } = useQuery({
     queryKey: ['library-stats'],
@@ -130,16 +136,35 @@ export default function Unduper() {
     localStorage.setItem('pmda-list-mode', mode);
   };
 
-  // Filter duplicates by search
+  // Filter duplicates by search (debounced: the input stays responsive, the list filters once typing pauses)
+  const debouncedSearchQuery = useDebounce(searchQuery, 200);
+  // Re-render the filtered list as a low-priority update so a large list never blocks typing.
+  const deferredSearchQuery = useDeferredValue(debouncedSearchQuery);
+  // Lowercase each card's searchable fields once per list, not once per card per keystroke.
+  const searchIndex = useMemo(
+    () =>
+      duplicates.map((d) => ({
+        card: d,
+        artist: d.artist.toLowerCase(),
+        title: d.best_title.toLowerCase(),
+      })),
+    [duplicates]
+  );
+  // While the query only grows (typing more characters), narrow the previous matches instead of
+  // rescanning every card: anything that did not match "abc" cannot match "abcd".
+  const lastSearchRef = useRef<{ index: typeof searchIndex; query: string; entries: typeof searchIndex } | null>(null);
   const filteredDuplicates = useMemo(() => {
-    if (!searchQuery.trim()) return duplicates;
-    const query = searchQuery.toLowerCase();
-    return duplicates.filter(
-      (d) =>
-        d.artist.toLowerCase().includes(query) ||
-        d.best_title.toLowerCase().includes(query)
-    );
-  }, [duplicates, searchQuery]);
+    if (!deferredSearchQuery.trim()) {
+      lastSearchRef.current = null;
+      return duplicates;
+    }
+    const query = deferredSearchQuery.toLowerCase();
+    const last = lastSearchRef.current;
+    const candidates = last && last.index === searchIndex && query.startsWith(last.query) ? last.entries : searchIndex;
+    const entries = candidates.filter((entry) => entry.artist.includes(query) || entry.title.includes(query));
+    lastSearchRef.current = { index: searchIndex, query, entries };
+    return entries.map((entry) => entry.card);
+  }, [duplicates, searchIndex, deferredSearchQuery]);
 
   // Pagination (totalPages must be after filteredDuplicates)
   const totalPages = Math.ceil(filteredDuplicates.length / ITEMS_PER_PAGE);
@@ -154,6 +179,8 @@ export default function Unduper() {
     return filteredDuplicates.slice(start, start + ITEMS_PER_PAGE);
   }, [filteredDuplicates, currentPage]);
 
+  const handleCloseDetail = useCallback(() => setSelectedDuplicate(null), []);
+
   // Reset to page 1 when search changes
   const handleSearch = (query: string) => {
     setSearchQuery(query);
@@ -615,7 +642,7 @@ export default function Unduper() {
         <DetailModal
           artist={selectedDuplicate.artist_key}
           albumId={selectedDuplicate.album_id}
-          onClose={() => setSelectedDuplicate(null)}
+          onClose={handleCloseDetail}
           onDedupe={handleModalDedupe}
           no_move={selectedDuplicate.no_move}
           best_title={selectedDuplicate.best_title}
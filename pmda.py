@@ -68,6 +68,7 @@ import unicodedata
 import xml.etree.ElementTree as ET
 
 import requests
+from urllib3.util.retry import Retry
 import musicbrainzngs
 try:
     from cryptography.fernet import Fernet, InvalidToken
@@ -132,6 +133,47 @@ def colour(txt: str, code: str) -> str:
     return f"{code}{txt}{ANSI_RESET}"
 
 # ────────────────────── Robust cross‑device move helper ──────────────────────
+_COPY_RANGE_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.EPERM,
+}
+
+
+def _copy2_kernel(src, dst, *, follow_symlinks=True):
+    """
+    shutil.copy2 drop-in that first tries os.copy_file_range: the kernel then clones extents
+    (btrfs/XFS reflink) or asks the server to copy (NFS 4.2, SMB3) instead of streaming the
+    data through this host. Falls back to copy2 when the filesystem pair doesn't support it.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None or not follow_symlinks and os.path.islink(src):
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    size = 0
+    copied = 0
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            while copied < size:
+                n = copy_range(fsrc.fileno(), fdst.fileno(), min(size - copied, 1 << 30))
+                if n <= 0:
+                    break
+                copied += n
+    except OSError as e:
+        if e.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+            raise
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    if copied == 0 and size > 0:
+        # Some FUSE/CIFS/overlay filesystems answer 0 instead of raising when they can't do it
+        # (CPython's own fast-copy path guards the same way): fall back to a plain copy.
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    if copied < size:
+        # Never report success on a short copy: safe_move deletes the source afterwards.
+        raise OSError(errno.EIO, f"copy_file_range stopped after {copied} of {size} bytes", str(src))
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
 def safe_move(src: str, dst: str):
     """
     Move *src* → *dst* de façon robuste, y compris entre volumes (EXDEV).
@@ -141,16 +183,23 @@ def safe_move(src: str, dst: str):
     """
     src_path = Path(src)
     dst_path = Path(dst)
-    dst_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # 1) Fast path: atomic rename when on same device
+    # 1) Fast path: atomic rename when on same device (callers usually created the parent
+    #    already, so only mkdir when the rename says it is missing)
     try:
-        os.replace(src, dst)
+        try:
+            os.replace(src, dst)
+        except FileNotFoundError:
+            if not src_path.exists():
+                raise
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(src, dst)
         return
     except OSError as exc:
         if exc.errno != errno.EXDEV:
             logging.warning("safe_move(): os.replace failed (%s) – falling back to copy", exc)
         # continue to copy fallback
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
 
     # 2) Choose a non‑clobbering destination (in case of leftovers)
     final_dst = dst_path
@@ -163,12 +212,14 @@ def safe_move(src: str, dst: str):
         final_dst = parent / f"{base} ({n})"
         logging.warning("safe_move(): destination exists, using %s", final_dst)
 
-    # 3) Copy (dir or single file)
+    # 3) Copy (dir or single file). _copy2_kernel tries copy_file_range (reflink / server-side
+    #    copy) and otherwise falls back to copy2, which still uses sendfile on Linux and fcopyfile
+    #    on macOS, so large FLACs never go through a Python buffer.
     try:
         if src_path.is_dir():
-            shutil.copytree(src_path, final_dst, dirs_exist_ok=False)
+            shutil.copytree(src_path, final_dst, dirs_exist_ok=False, copy_function=_copy2_kernel)
         else:
-            shutil.copy2(src_path, final_dst)
+            _copy2_kernel(src_path, final_dst)
     except Exception as copy_err:
         logging.error("safe_move(): copy failed %s → %s – %s", src_path, final_dst, copy_err)
         raise
@@ -210,6 +261,23 @@ try:
     import redis as redis_lib
 except ImportError:
     redis_lib = None
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz, process as rapidfuzz_process
+except ImportError:
+    rapidfuzz_fuzz = None  # type: ignore[assignment]
+    rapidfuzz_process = None  # type: ignore[assignment]
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None  # type: ignore[assignment]
 try:
     from watchdog.events import FileSystemEventHandler
     from watchdog.observers import Observer
@@ -219,12 +287,41 @@ except ImportError:
 
 
 from flask import Flask, request, jsonify, send_from_directory, redirect, Response, send_file, g, after_this_request, has_request_context
+from flask.json.provider import DefaultJSONProvider
 
 from pmda_ai.openai_auth_service import OpenAIAuthService
 from pmda_ai.selector import select_provider_id
 
 app = Flask(__name__)
 
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """
+    jsonify() backed by orjson when it is installed: the duplicate-card and progress payloads
+    are large and polled continuously. Output matches the stdlib provider (sorted keys,
+    Flask's date handling); anything orjson refuses, or pretty-printed output, goes through
+    the stdlib path unchanged.
+    """
+
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    ) if orjson is not None else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.get("indent") is None:
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._ORJSON_OPTIONS).decode("utf-8")
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
 # Path to integrated frontend build (self-hosted: one container = backend + UI)
 _FRONTEND_DIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "dist")
 _HAS_STATIC_UI = os.path.isdir(_FRONTEND_DIST)
@@ -677,6 +774,7 @@ _QUIET_REQUEST_PATHS = (
     "/api/progress",
     "/api/incomplete-albums/scan/progress",
     "/api/dedupe",
+    "/api/events",
     "/api/duplicates",
     "/api/library/improve-all/progress",
     "/api/lidarr/add-incomplete-albums/progress",
@@ -724,11 +822,7 @@ def _purge_invalid_edition(edition: dict):
             artist_hint=str(edition.get("artist") or ""),
             album_hint=str(edition.get("title_raw") or src_folder.name or ""),
         )
-        dst = base_dst
-        counter = 1
-        while dst.exists():                                            # avoid clashes
-            dst = base_dst.parent / f"{base_dst.name} ({counter})"
-            counter += 1
+        dst = _next_available_folder_path(base_dst)                    # avoid clashes
         dst.parent.mkdir(parents=True, exist_ok=True)
 
         # Move (or copy‑then‑delete) the folder ----------------------
@@ -740,8 +834,7 @@ def _purge_invalid_edition(edition: dict):
             return
 
         size_mb = folder_size(dst) // (1024 * 1024)
-        increment_stat("removed_dupes", 1)
-        increment_stat("space_saved", size_mb)
+        increment_stats({"removed_dupes": 1, "space_saved": size_mb})
 
         # Tech‑data are irrelevant (all zero), but we still log them
         notify_discord(
@@ -838,6 +931,18 @@ def _parse_int(val, default: int | None = None) -> int | None:
     except (TypeError, ValueError):
         return default
 
+def _auto_scan_threads() -> int:
+    """
+    Default scan worker count. Scan workers mostly wait on disk, tag reads and HTTP,
+    not on the CPU, so oversubscribe the cores (capped like ThreadPoolExecutor's default).
+    """
+    return max(1, min(32, 2 * (os.cpu_count() or 2)))
+
+def _parse_scan_threads(val) -> int:
+    """SCAN_THREADS: a positive int, or "auto"/invalid → _auto_scan_threads()."""
+    n = _parse_int(val)
+    return max(1, n) if n is not None else _auto_scan_threads()
+
 def _parse_path_map(val) -> dict[str, str]:
     """
     Accept either a dict, a JSON string or a CSV string of ``SRC:DEST`` pairs.
@@ -1092,6 +1197,20 @@ AI_GLOBAL_MAX_CALLS_PER_DAY = max(
     0,
     int(os.getenv("PMDA_AI_GLOBAL_MAX_CALLS_PER_DAY", "0") or "0"),
 )
+# Proactive request pacing for AI providers (0 = unpaced). Unlike the legacy caps above,
+# pacing never blocks a call: it only delays dispatch to stay under provider RPM/TPM limits.
+AI_MAX_REQUESTS_PER_MINUTE = max(
+    0,
+    int(os.getenv("PMDA_AI_MAX_REQUESTS_PER_MINUTE", "0") or "0"),
+)
+AI_MAX_TOKENS_PER_MINUTE = max(
+    0,
+    int(os.getenv("PMDA_AI_MAX_TOKENS_PER_MINUTE", "0") or "0"),
+)
+AI_RATE_LIMIT_MAX_RETRIES = max(
+    0,
+    min(10, int(os.getenv("PMDA_AI_RATE_LIMIT_MAX_RETRIES", "3") or "3")),
+)
 
 # Pricing is expressed in micro-USD (1 USD = 1_000_000 micro-USD).
 # Rows can be overridden in DB (ai_pricing_catalog) without code changes.
@@ -2571,7 +2690,7 @@ merged = {
     "PLEX_HOST":      _get("PLEX_HOST",      default="",                                cast=str),
     "PLEX_TOKEN":     _get("PLEX_TOKEN",     default="",                                cast=str),
     "SECTION_ID": SECTION_IDS[0] if SECTION_IDS else 0,
-    "SCAN_THREADS":   _get("SCAN_THREADS",   default=os.cpu_count() or 4,               cast=_parse_int),
+    "SCAN_THREADS":   _get("SCAN_THREADS",   default="auto",                           cast=_parse_scan_threads),
     "PATH_MAP":       _parse_path_map(_get("PATH_MAP", default={})),
     "DUPE_ROOT":      _get("DUPE_ROOT", default="/dupes", cast=str),
     "LOG_LEVEL":      _get("LOG_LEVEL",      default="INFO").upper(),
@@ -3178,6 +3297,9 @@ if not PLEX_CONFIGURED:
 DUPE_ROOT = Path(str(merged.get("DUPE_ROOT", "/dupes") or "").strip() or "/dupes")
 # WebUI always listens on container port 5005 inside the container
 WEBUI_PORT = 5005
+# Request worker threads for the production WSGI server (waitress). Scans and dedupe run in
+# their own background threads, so this only bounds concurrent HTTP requests.
+WEBUI_HTTP_THREADS = max(2, min(64, int(os.getenv("PMDA_HTTP_THREADS", "16") or "16")))
 
 
 def _paths_rw_status() -> dict:
@@ -7386,6 +7508,76 @@ def _ai_guardrail_precheck_safe(**kwargs: Any) -> tuple[bool, str, dict[str, Any
     return True, "", {}
 
 
+_ai_pacing_lock = threading.Lock()
+_ai_pacing_next_at = 0.0
+# Allow up to this many seconds of budget to be spent in a burst before pacing kicks in.
+_AI_PACING_BURST_SEC = 10.0
+# Rate limits and dropped connections only. Timeouts are not retried: the request already used
+# its whole budget, and a retry would bill another full-length call.
+_AI_RETRYABLE_ERROR_NAMES = {
+    "RateLimitError",
+    "APIConnectionError",
+    "ResourceExhausted",
+}
+
+
+def _ai_estimate_request_tokens(system_msg: str, user_msg: str, max_tokens: int) -> int:
+    """Rough prompt+completion token estimate (~4 chars per token) for TPM pacing."""
+    return (len(system_msg or "") + len(user_msg or "")) // 4 + max(0, int(max_tokens or 0))
+
+
+def _ai_pacing_wait(estimated_tokens: int, deadline: float | None = None) -> None:
+    """
+    Reserve a slot under AI_MAX_REQUESTS_PER_MINUTE / AI_MAX_TOKENS_PER_MINUTE and sleep until due.
+    Both limits share one schedule; each request advances it by the larger of its RPM and TPM cost.
+    When the slot would only come after *deadline* (time.monotonic()), nothing is reserved and
+    TimeoutError is raised instead of sending a request the caller no longer waits for.
+    """
+    global _ai_pacing_next_at
+    rpm = int(getattr(sys.modules[__name__], "AI_MAX_REQUESTS_PER_MINUTE", 0) or 0)
+    tpm = int(getattr(sys.modules[__name__], "AI_MAX_TOKENS_PER_MINUTE", 0) or 0)
+    if rpm <= 0 and tpm <= 0:
+        return
+    cost = 0.0
+    if rpm > 0:
+        cost = max(cost, 60.0 / rpm)
+    if tpm > 0:
+        cost = max(cost, 60.0 * max(1, int(estimated_tokens or 0)) / tpm)
+    with _ai_pacing_lock:
+        now = time.monotonic()
+        scheduled = max(float(_ai_pacing_next_at or 0.0), now - _AI_PACING_BURST_SEC)
+        if deadline is not None and scheduled >= deadline:
+            raise TimeoutError("AI pacing slot is past the call deadline")
+        _ai_pacing_next_at = scheduled + cost
+    wait = scheduled - now
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _ai_pacing_penalize(seconds: float) -> None:
+    """Push the shared schedule out after a provider rate-limit so other threads back off too."""
+    global _ai_pacing_next_at
+    if seconds <= 0:
+        return
+    with _ai_pacing_lock:
+        _ai_pacing_next_at = max(float(_ai_pacing_next_at or 0.0), time.monotonic() + seconds)
+
+
+def _ai_error_is_retryable(exc: Exception) -> bool:
+    """True for 429 rate limits and connection drops; never for quota exhaustion or timeouts."""
+    text = str(exc or "").strip().lower()
+    if "insufficient_quota" in text or "quota exceeded" in text or "billing" in text:
+        return False
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    if type(exc).__name__ in _AI_RETRYABLE_ERROR_NAMES:
+        return True
+    return "rate limit" in text or "rate_limit" in text
+
+
 def call_ai_provider(
     provider: str,
     model: str,
@@ -7395,9 +7587,68 @@ def call_ai_provider(
     *,
     analysis_type: str,
     request_timeout_sec: float | None = None,
+    deadline: float | None = None,
 ) -> str:
     """
-    Call the configured provider (text endpoint) and persist token/cost usage.
+    Call the configured provider (text endpoint) with request pacing and
+    exponential backoff on rate limits and connection errors.
+    *deadline* (time.monotonic()) bounds pacing waits and retries; it defaults to
+    now + request_timeout_sec when a request timeout is given.
+    """
+    estimated_tokens = _ai_estimate_request_tokens(system_msg, user_msg, max_tokens)
+    max_retries = int(getattr(sys.modules[__name__], "AI_RATE_LIMIT_MAX_RETRIES", 3) or 0)
+    if deadline is None and request_timeout_sec is not None:
+        deadline = time.monotonic() + max(0.0, float(request_timeout_sec))
+    attempt = 0
+    while True:
+        _ai_pacing_wait(estimated_tokens, deadline)
+        attempt_timeout = request_timeout_sec
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("AI call deadline passed before the request was sent")
+            attempt_timeout = min(float(request_timeout_sec), remaining) if request_timeout_sec is not None else remaining
+        try:
+            return _call_ai_provider_once(
+                provider,
+                model,
+                system_msg,
+                user_msg,
+                max_tokens,
+                analysis_type=analysis_type,
+                request_timeout_sec=attempt_timeout,
+            )
+        except Exception as e:
+            if attempt >= max_retries or not _ai_error_is_retryable(e):
+                raise
+            backoff = min(60.0, 1.0 * (2.0 ** attempt)) * (0.8 + random.random() * 0.4)
+            _ai_pacing_penalize(backoff)
+            if deadline is not None and time.monotonic() + backoff >= deadline:
+                raise
+            attempt += 1
+            logging.warning(
+                "[AI] transient error during %s (%s); retrying in %.1fs (attempt %d/%d)",
+                str(analysis_type or "other"),
+                _log_preview_text(str(e), 160),
+                backoff,
+                attempt,
+                max_retries,
+            )
+            time.sleep(backoff)
+
+
+def _call_ai_provider_once(
+    provider: str,
+    model: str,
+    system_msg: str,
+    user_msg: str,
+    max_tokens: int = 256,
+    *,
+    analysis_type: str,
+    request_timeout_sec: float | None = None,
+) -> str:
+    """
+    Single call to the configured provider (text endpoint); persists token/cost usage.
     """
     started_at = time.time()
     response_obj: Any = None
@@ -7993,6 +8244,8 @@ def _call_ai_provider_bounded(
     timeout_val = max(5.0, float(timeout_sec or 0.0))
     started = time.perf_counter()
     pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pmda-ai-bounded")
+    # The worker can't be stopped once we give up on it; the shared deadline makes it stop
+    # pacing and retrying at the same moment instead of sending requests nobody reads.
     fut = pool.submit(
         call_ai_provider,
         provider,
@@ -8002,6 +8255,7 @@ def _call_ai_provider_bounded(
         int(max_tokens or 0),
         analysis_type=analysis_type,
         request_timeout_sec=max(5.0, timeout_val - 2.0),
+        deadline=time.monotonic() + timeout_val,
     )
     try:
         reply = fut.result(timeout=timeout_val)
@@ -8589,7 +8843,7 @@ def _run_path_verification(path_map: dict, db_file: str, samples: int):
                     try:
                         p = Path(host_root)
                         if p.exists() and p.is_dir():
-                            audio_count = sum(1 for _ in p.rglob("*") if AUDIO_RE.search(_.name))
+                            audio_count = sum(1 for _ in p.rglob("*") if _is_audio_name(_.name))
                             if audio_count > 0:
                                 results.append({
                                     "plex_root": plex_root,
@@ -8731,6 +8985,21 @@ def _discover_bindings_by_content(path_map: dict, db_file: str, music_root: str,
     return (discovered_map, results)
 
 
+def _find_files_by_name(base: Path, names: set[str]) -> dict[str, list[Path]]:
+    """
+    Locate files named in *names* anywhere under *base* with a single directory walk
+    (instead of one recursive glob per name). Unreadable directories are skipped.
+    """
+    found: dict[str, list[Path]] = {}
+    if not names:
+        return found
+    for dirpath, _dirnames, filenames in os.walk(base, onerror=lambda e: logging.debug("Deep filename search: %s", e)):
+        for fname in filenames:
+            if fname in names:
+                found.setdefault(fname, []).append(Path(dirpath) / fname)
+    return found
+
+
 def _discover_one_binding(plex_root: str, db_file: str, music_root: str, samples: int):
     """
     Resolve a single plex_root: find which subdir of music_root contains the sampled files.
@@ -8784,18 +9053,15 @@ def _discover_one_binding(plex_root: str, db_file: str, music_root: str, samples
         # Fallback: recursive search by filename (same idea as _cross_check_bindings repair)
         logging.debug("Discover one: no match in immediate children of %s – trying recursive search", music_root)
         candidate_counts: dict[str, int] = {}
-        for _, rel in enumerate(rels):
-            fname = os.path.basename(rel)
-            try:
-                for found in music_path.rglob(fname):
-                    # Infer host root: go up as many levels as rel has parts
-                    root = found
-                    for _ in Path(rel).parts:
-                        root = root.parent
-                    root_str = str(root)
-                    candidate_counts[root_str] = candidate_counts.get(root_str, 0) + 1
-            except OSError as e:
-                logging.debug("Discover one rglob for %s: %s", fname, e)
+        found_by_name = _find_files_by_name(music_path, {os.path.basename(rel) for rel in rels})
+        for rel in rels:
+            for found in found_by_name.get(os.path.basename(rel), ()):
+                # Infer host root: go up as many levels as rel has parts
+                root = found
+                for _ in Path(rel).parts:
+                    root = root.parent
+                root_str = str(root)
+                candidate_counts[root_str] = candidate_counts.get(root_str, 0) + 1
         if candidate_counts:
             best_path, best_count = max(candidate_counts.items(), key=lambda kv: kv[1])
             logging.info("Discover one: recursive search found best root %s with %d/%d matches", best_path, best_count, total)
@@ -8920,9 +9186,9 @@ def _cross_check_bindings(raise_on_abort: bool = True):
         if not candidate_counts:
             logging.debug("Immediate child scan found nothing – performing deep filename search")
             missing_target = len(missing)
+            found_by_name = _find_files_by_name(search_base, {os.path.basename(rel) for _, rel in missing})
             for _, rel in missing:
-                fname = os.path.basename(rel)
-                for found in search_base.rglob(fname):
+                for found in found_by_name.get(os.path.basename(rel), ()):
                     root = found
                     for _ in Path(rel).parts:
                         root = root.parent
@@ -8979,14 +9245,35 @@ def _cross_check_bindings(raise_on_abort: bool = True):
 
 
 # ───────────────────────────────── OTHER CONSTANTS ──────────────────────────────────
-AUDIO_RE    = re.compile(r"\.(flac|ape|alac|wav|m4a|aac|mp3|ogg|opus|dsf|aif|aiff|wma|mp4|m4b|m4p|aifc)$", re.I)
+_AUDIO_EXTS = frozenset({
+    "flac", "ape", "alac", "wav", "m4a", "aac", "mp3", "ogg", "opus",
+    "dsf", "aif", "aiff", "wma", "mp4", "m4b", "m4p", "aifc",
+})
+
+
+def _is_audio_name(name: str) -> bool:
+    """True when *name* ends in an audio extension (plain suffix-set lookup, no regex per directory entry)."""
+    i = name.rfind(".")
+    return i >= 0 and name[i + 1:].lower() in _AUDIO_EXTS
 # Derive format scores from user preference order
 FMT_SCORE   = {ext: len(FORMAT_PREFERENCE)-i for i, ext in enumerate(FORMAT_PREFERENCE)}
 OVERLAP_MIN = 0.85  # 85% track-title overlap minimum
 
 # ───────────────────────────────── STATE DB SETUP ──────────────────────────────────
+def _open_db(path: str, timeout: float = 5.0, **kwargs: Any) -> sqlite3.Connection:
+    """
+    sqlite3.connect() for PMDA's own state/cache DBs with the same PRAGMAs as _state_connect()
+    (WAL, synchronous=NORMAL, temp_store=MEMORY). *timeout* is SQLite's busy timeout and keeps
+    sqlite3's 5 s default. Rows stay plain tuples (unlike _state_connect()).
+    """
+    con = sqlite3.connect(path, timeout=timeout, **kwargs)
+    _configure_state_connection(con, timeout=timeout)
+    con.row_factory = None
+    return con
+
+
 def init_state_db():
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     # Enable WAL mode up‑front to allow concurrent reads/writes
     con.execute("PRAGMA journal_mode=WAL;")
     con.commit()
@@ -9125,6 +9412,8 @@ def init_state_db():
         ("confidence", "INTEGER"),
         ("created_at", "REAL"),
         ("updated_at", "REAL"),
+        ("edition_hash", "TEXT"),
+        ("best_edition_fp", "TEXT"),
     ):
         if col not in dupe_ai_cols:
             try:
@@ -9134,6 +9423,7 @@ def init_state_db():
     try:
         cur.execute("CREATE INDEX IF NOT EXISTS idx_dupe_ai_cache_artist ON dupe_ai_cache(artist)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_dupe_ai_cache_updated ON dupe_ai_cache(updated_at DESC)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_dupe_ai_cache_edition_hash ON dupe_ai_cache(artist, edition_hash)")
     except sqlite3.OperationalError:
         pass
 
@@ -10359,7 +10649,7 @@ def migrate_settings_from_state_db():
         if not STATE_DB_FILE.exists():
             return
         # Check legacy settings in state.db
-        con_state = sqlite3.connect(str(STATE_DB_FILE))
+        con_state = _open_db(str(STATE_DB_FILE))
         cur_state = con_state.cursor()
         cur_state.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='settings'")
         if not cur_state.fetchone():
@@ -10551,94 +10841,86 @@ def _auth_guard():
 
     return jsonify({"error": "Forbidden: admin access required"}), 403
 
+_stats_db_lock = threading.Lock()
+_stats_db_con: Optional[sqlite3.Connection] = None
+_stats_db_path: Optional[str] = None
+
+
+def _stats_db_conn() -> sqlite3.Connection:
+    """
+    Shared state.db connection for the stats counters. Callers must hold _stats_db_lock;
+    the connection is opened once (autocommit, WAL) and reopened if STATE_DB_FILE changes.
+    """
+    global _stats_db_con, _stats_db_path
+    path = str(STATE_DB_FILE)
+    if _stats_db_con is not None and _stats_db_path == path:
+        return _stats_db_con
+    if _stats_db_con is not None:
+        try:
+            _stats_db_con.close()
+        except Exception:
+            pass
+    con = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    _configure_state_connection(con, timeout=30)
+    con.row_factory = None
+    # Legacy databases may not have the stats table yet; create it once per connection.
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS stats (
+            key   TEXT PRIMARY KEY,
+            value INTEGER
+        )
+    """)
+    _stats_db_con = con
+    _stats_db_path = path
+    return con
+
+
 def get_stat(key: str) -> int:
-    con = sqlite3.connect(str(STATE_DB_FILE))
-    cur = con.cursor()
-    try:
-        cur.execute("SELECT value FROM stats WHERE key = ?", (key,))
-    except sqlite3.OperationalError as e:
-        # Legacy databases may not have the stats table yet; create it lazily and retry once.
-        if "no such table: stats" in str(e):
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS stats (
-                    key   TEXT PRIMARY KEY,
-                    value INTEGER
-                )
-            """)
-            con.commit()
-            cur.execute("SELECT value FROM stats WHERE key = ?", (key,))
-        else:
-            con.close()
-            raise
-    row = cur.fetchone()
-    con.close()
+    with _stats_db_lock:
+        row = _stats_db_conn().execute("SELECT value FROM stats WHERE key = ?", (key,)).fetchone()
     return row[0] if row else 0
 
 def set_stat(key: str, value: int):
-    con = sqlite3.connect(str(STATE_DB_FILE))
-    cur = con.cursor()
-    try:
-        cur.execute("UPDATE stats SET value = ? WHERE key = ?", (value, key))
-    except sqlite3.OperationalError as e:
-        # If stats table does not exist yet (legacy DB), create it and insert the row.
-        if "no such table: stats" in str(e):
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS stats (
-                    key   TEXT PRIMARY KEY,
-                    value INTEGER
-                )
-            """)
-            con.commit()
-            cur.execute("INSERT OR REPLACE INTO stats(key, value) VALUES(?, ?)", (key, value))
-        else:
-            con.close()
-            raise
-    con.commit()
-    con.close()
+    with _stats_db_lock:
+        _stats_db_conn().execute(
+            "INSERT INTO stats(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+_STATS_INCREMENT_SQL = "INSERT INTO stats(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = value + excluded.value"
+
 
 def increment_stat(key: str, delta: int):
     """Atomically add *delta* to a stat counter. Creates the row if it does not exist (upsert)."""
-    con = _state_connect(timeout=30)
-    con.execute("PRAGMA busy_timeout=30000;")
-    cur = con.cursor()
-    try:
-        cur.execute(
-            "INSERT INTO stats(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = value + ?",
-            (key, delta, delta),
-        )
-    except sqlite3.OperationalError as e:
-        # If stats table does not exist yet (legacy DB), create it and retry once.
-        if "no such table: stats" in str(e):
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS stats (
-                    key   TEXT PRIMARY KEY,
-                    value INTEGER
-                )
-            """)
-            con.commit()
-            cur.execute(
-                "INSERT INTO stats(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = value + ?",
-                (key, delta, delta),
-            )
-        else:
-            con.close()
+    with _stats_db_lock:
+        _stats_db_conn().execute(_STATS_INCREMENT_SQL, (key, delta))
+
+def increment_stats(deltas: Dict[str, int]):
+    """increment_stat() for several counters in one transaction (e.g. removed_dupes + space_saved)."""
+    if not deltas:
+        return
+    with _stats_db_lock:
+        con = _stats_db_conn()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.executemany(_STATS_INCREMENT_SQL, list(deltas.items()))
+        except Exception:
+            con.execute("ROLLBACK")
             raise
-    con.commit()
-    con.close()
+        con.execute("COMMIT")
 
 def get_last_completed_scan_id() -> Optional[int]:
     """Return the scan_id of the last completed scan, or None. Used by Library and Tag Fixer to read from scan_editions."""
-    con = sqlite3.connect(str(STATE_DB_FILE))
-    cur = con.cursor()
-    cur.execute("PRAGMA table_info(settings)")
-    cols = [r[1] for r in cur.fetchall()]
-    # If PRAGMA table_info returns no rows, the table does not exist (legacy DB); otherwise it does.
-    if not cols:
-        row = None
-    else:
-        cur.execute("SELECT value FROM settings WHERE key = 'last_completed_scan_id'")
-        row = cur.fetchone()
-    con.close()
+    with STATE_POOL.acquire() as con:
+        cur = con.cursor()
+        cur.execute("PRAGMA table_info(settings)")
+        cols = [r[1] for r in cur.fetchall()]
+        # If PRAGMA table_info returns no rows, the table does not exist (legacy DB); otherwise it does.
+        if not cols:
+            row = None
+        else:
+            cur.execute("SELECT value FROM settings WHERE key = 'last_completed_scan_id'")
+            row = cur.fetchone()
     if not row or not row[0]:
         return None
     try:
@@ -10667,7 +10949,7 @@ def _normalize_root_path(raw_path: str | Path | None) -> str:
 def _files_source_roots_fetch(*, enabled_only: bool = False) -> list[dict]:
     rows: list[dict] = []
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=15)
+        con = _open_db(str(STATE_DB_FILE), timeout=15)
         con.row_factory = sqlite3.Row
         cur = con.cursor()
         query = """
@@ -10790,7 +11072,7 @@ def _winner_source_row() -> Optional[dict]:
 
 def _ensure_files_source_roots_seeded() -> None:
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute("SELECT COUNT(*) FROM files_source_roots")
         existing = int((cur.fetchone() or [0])[0] or 0)
@@ -10867,7 +11149,7 @@ def _pipeline_bootstrap_status() -> dict[str, Any]:
         return None
 
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=15)
+        con = _open_db(str(STATE_DB_FILE), timeout=15)
         con.row_factory = sqlite3.Row
         cur = con.cursor()
         cur.execute(
@@ -10904,7 +11186,7 @@ def _has_completed_full_scan() -> bool:
     if not bool(status.get("bootstrap_required")):
         return True
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         cur.execute(
             """
@@ -10924,7 +11206,7 @@ def _has_completed_full_scan() -> bool:
 
 def _pipeline_bootstrap_refresh_from_history() -> None:
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         con.row_factory = sqlite3.Row
         cur = con.cursor()
         cur.execute("SELECT bootstrap_required FROM pipeline_bootstrap_state WHERE id = 1")
@@ -10983,7 +11265,7 @@ def _pipeline_bootstrap_mark_full_completed(scan_id: int, completed_at: float |
         return
     now = float(completed_at or time.time())
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute(
             """
@@ -11008,7 +11290,7 @@ def _pipeline_bootstrap_mark_full_completed(scan_id: int, completed_at: float |
 def _pipeline_bootstrap_reset() -> None:
     now = time.time()
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute(
             """
@@ -11157,7 +11439,7 @@ def _files_source_roots_replace(roots_payload: list[dict], *, winner_source_root
     for row in rows_clean:
         row["is_winner_root"] = 1 if _normalize_root_path(row.get("path")) == winner_path else 0
 
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+    con = _open_db(str(STATE_DB_FILE), timeout=20)
     cur = con.cursor()
     persisted_ids: list[int] = []
     try:
@@ -11244,55 +11526,45 @@ def ensure_dedupe_scan_id() -> None:
         if state.get("scan_id") is not None:
             return
         start_time = time.time()
-        con = sqlite3.connect(str(STATE_DB_FILE))
-        cur = con.cursor()
-        cur.execute("PRAGMA table_info(scan_history)")
-        cols = [r[1] for r in cur.fetchall()]
-        if "entry_type" in cols:
-            cur.execute("""
-                INSERT INTO scan_history
-                (start_time, albums_scanned, artists_total, ai_enabled, mb_enabled, auto_move_enabled, status, entry_type)
-                VALUES (?, 0, 0, 0, 0, 0, 'running', 'dedupe')
-            """, (start_time,))
-        else:
-            cur.execute("""
-                INSERT INTO scan_history
-                (start_time, albums_scanned, artists_total, ai_enabled, mb_enabled, auto_move_enabled, status)
-                VALUES (?, 0, 0, 0, 0, 0, 'running')
-            """, (start_time,))
-        scan_id = cur.lastrowid
-        con.commit()
-        con.close()
+        with STATE_POOL.acquire() as con, con:
+            cur = con.cursor()
+            cur.execute("PRAGMA table_info(scan_history)")
+            cols = [r[1] for r in cur.fetchall()]
+            if "entry_type" in cols:
+                cur.execute("""
+                    INSERT INTO scan_history
+                    (start_time, albums_scanned, artists_total, ai_enabled, mb_enabled, auto_move_enabled, status, entry_type)
+                    VALUES (?, 0, 0, 0, 0, 0, 'running', 'dedupe')
+                """, (start_time,))
+            else:
+                cur.execute("""
+                    INSERT INTO scan_history
+                    (start_time, albums_scanned, artists_total, ai_enabled, mb_enabled, auto_move_enabled, status)
+                    VALUES (?, 0, 0, 0, 0, 0, 'running')
+                """, (start_time,))
+            scan_id = cur.lastrowid
         state["scan_id"] = scan_id
 
 
 def update_dedupe_scan_summary(scan_id: int, space_saved_mb: int, albums_moved: int) -> None:
     """Update a dedupe-only scan_history row with end time and stats. No-op if row is not entry_type='dedupe'."""
-    con = sqlite3.connect(str(STATE_DB_FILE))
-    cur = con.cursor()
-    cur.execute("PRAGMA table_info(scan_history)")
-    cols = [r[1] for r in cur.fetchall()]
-    if "entry_type" not in cols:
-        con.close()
-        return
-    cur.execute("SELECT entry_type FROM scan_history WHERE scan_id = ?", (scan_id,))
-    row = cur.fetchone()
-    if not row or row[0] != "dedupe":
-        con.close()
-        return
-    end_time = time.time()
-    cur.execute(
-        "SELECT start_time FROM scan_history WHERE scan_id = ?", (scan_id,)
-    )
-    start_row = cur.fetchone()
-    duration_seconds = int(end_time - start_row[0]) if start_row else 0
-    cur.execute("""
-        UPDATE scan_history
-        SET end_time = ?, duration_seconds = ?, space_saved_mb = ?, albums_moved = ?, status = 'completed'
-        WHERE scan_id = ?
-    """, (end_time, duration_seconds, space_saved_mb, albums_moved, scan_id))
-    con.commit()
-    con.close()
+    with STATE_POOL.acquire() as con, con:
+        cur = con.cursor()
+        cur.execute("PRAGMA table_info(scan_history)")
+        cols = [r[1] for r in cur.fetchall()]
+        if "entry_type" not in cols:
+            return
+        cur.execute("SELECT entry_type, start_time FROM scan_history WHERE scan_id = ?", (scan_id,))
+        row = cur.fetchone()
+        if not row or row[0] != "dedupe":
+            return
+        end_time = time.time()
+        duration_seconds = int(end_time - row[1]) if row[1] is not None else 0
+        cur.execute("""
+            UPDATE scan_history
+            SET end_time = ?, duration_seconds = ?, space_saved_mb = ?, albums_moved = ?, status = 'completed'
+            WHERE scan_id = ?
+        """, (end_time, duration_seconds, space_saved_mb, albums_moved, scan_id))
 
 
 _scheduler_lock = threading.Lock()
@@ -11342,6 +11614,106 @@ def _state_connect(timeout: float = 30.0) -> sqlite3.Connection:
     return _configure_state_connection(con, timeout=timeout, readonly=False)
 
 
+class SQLitePool:
+    """
+    Small thread-safe pool of long-lived SQLite connections for one database file.
+
+    Connections are configured once (by *connect_fn*) and handed out LIFO so the most
+    recently used page cache stays hot. When *path_fn* starts returning a different key
+    (e.g. the DB file was switched), idle connections are dropped and reopened lazily.
+    *max_age_sec* bounds how long a connection is reused (needed for immutable Plex
+    connections, which never notice external writes).
+    """
+
+    def __init__(
+        self,
+        path_fn: Callable[[], Any],
+        connect_fn: Callable[[], sqlite3.Connection],
+        *,
+        max_idle: int = 8,
+        max_age_sec: float | None = None,
+    ):
+        self._path_fn = path_fn
+        self._connect_fn = connect_fn
+        self._max_idle = max(1, int(max_idle))
+        self._max_age_sec = max_age_sec
+        self._lock = threading.Lock()
+        self._key: Any = None
+        self._idle: list[tuple[sqlite3.Connection, float]] = []
+
+    def _close_all_locked(self) -> None:
+        while self._idle:
+            con, _born = self._idle.pop()
+            try:
+                con.close()
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._close_all_locked()
+
+    @contextmanager
+    def acquire(self):
+        key = self._path_fn()
+        con = None
+        born = 0.0
+        now = time.monotonic()
+        with self._lock:
+            if key != self._key:
+                self._close_all_locked()
+                self._key = key
+            while self._idle:
+                con, born = self._idle.pop()
+                if self._max_age_sec is not None and now - born > self._max_age_sec:
+                    try:
+                        con.close()
+                    except Exception:
+                        pass
+                    con = None
+                    continue
+                break
+        if con is None:
+            con = self._connect_fn()
+            born = now
+        healthy = True
+        try:
+            yield con
+        except sqlite3.Error:
+            healthy = False
+            raise
+        finally:
+            try:
+                if con.in_transaction:
+                    con.rollback()
+            except Exception:
+                healthy = False
+            keep = False
+            if healthy:
+                with self._lock:
+                    if key == self._key and len(self._idle) < self._max_idle:
+                        self._idle.append((con, born))
+                        keep = True
+            if not keep:
+                try:
+                    con.close()
+                except Exception:
+                    pass
+
+
+def _state_pool_connect() -> sqlite3.Connection:
+    con = _state_connect(timeout=10)
+    try:
+        # Pooled connections live long enough for a larger page cache to pay off (16 MiB each).
+        con.execute("PRAGMA cache_size=-16384")
+    except sqlite3.Error:
+        pass
+    return con
+
+
+STATE_POOL = SQLitePool(lambda: str(STATE_DB_FILE), _state_pool_connect)
+
+
 def _state_connect_readonly(timeout: float = 10.0) -> sqlite3.Connection:
     try:
         con = sqlite3.connect(
@@ -14182,8 +14554,9 @@ _scheduler_paused = _scheduler_get_paused_from_db()
 
 # ───────────────────────────────── CACHE DB SETUP ──────────────────────────────────
 def init_cache_db():
-    con = sqlite3.connect(str(CACHE_DB_FILE))
-    # Enable WAL mode for concurrent reads/writes (same as state.db)
+    con = _open_db(str(CACHE_DB_FILE))
+    # Enable WAL mode for concurrent reads/writes (same as state.db). journal_mode is
+    # persistent per file; per-connection PRAGMAs are applied in _cache_db_conn().
     con.execute("PRAGMA journal_mode=WAL;")
     con.commit()
     cur = con.cursor()
@@ -14204,8 +14577,33 @@ def init_cache_db():
             cur.execute("ALTER TABLE audio_cache ADD COLUMN acoustid_fingerprint TEXT")
         if "acoustid_duration" not in cols:
             cur.execute("ALTER TABLE audio_cache ADD COLUMN acoustid_duration REAL")
+        if "head_hash" not in cols:
+            cur.execute("ALTER TABLE audio_cache ADD COLUMN head_hash BLOB")
     except sqlite3.OperationalError:
         pass
+    # Folder-level analyse_format result, keyed by a cheap folder signature so
+    # unchanged albums skip the per-file lookups entirely.
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS audio_folder_cache (
+            path        TEXT PRIMARY KEY,
+            sig         TEXT,
+            ext         TEXT,
+            bit_rate    INTEGER,
+            sample_rate INTEGER,
+            bit_depth   INTEGER,
+            file_count  INTEGER
+        )
+    """)
+    # Folder size + primary format for save_scan_to_db, filled by the scan's folder walk and
+    # validated by directory mtimes (see _folder_meta_dirs_unchanged) instead of a full walk.
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS folder_meta (
+            path           TEXT PRIMARY KEY,
+            sig            TEXT,
+            size_bytes     INTEGER,
+            primary_format TEXT
+        )
+    """)
     # Table for caching MusicBrainz release-group info (by MBID)
     cur.execute("""
         CREATE TABLE IF NOT EXISTS musicbrainz_cache (
@@ -14255,13 +14653,35 @@ def init_cache_db():
     con.commit()
     con.close()
 
+_cache_db_local = threading.local()
+_cache_db_write_lock = threading.Lock()
+
+
+def _cache_db_conn() -> sqlite3.Connection:
+    """
+    Return this thread's persistent cache.db connection (opened on first use).
+    The audio_cache lookups run once per probed file, so reusing the connection
+    avoids an open/close and PRAGMA setup per file. Reopened if CACHE_DB_FILE changes.
+    """
+    path = str(CACHE_DB_FILE)
+    con = getattr(_cache_db_local, "con", None)
+    if con is not None and getattr(_cache_db_local, "path", None) == path:
+        return con
+    if con is not None:
+        try:
+            con.close()
+        except Exception:
+            pass
+    con = _open_db(path, timeout=30, isolation_level=None)
+    _cache_db_local.con = con
+    _cache_db_local.path = path
+    return con
+
+
 def get_cached_info(path: str, mtime: int) -> Optional[tuple[int, int, int]]:
-    # Open with a 30-second timeout so that concurrent reads/writes don't immediately error
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute("SELECT bit_rate, sample_rate, bit_depth, mtime FROM audio_cache WHERE path = ?", (path,))
-    row = cur.fetchone()
-    con.close()
+    row = _cache_db_conn().execute(
+        "SELECT bit_rate, sample_rate, bit_depth, mtime FROM audio_cache WHERE path = ?", (path,)
+    ).fetchone()
     if row:
         br, sr, bd, cached_mtime = row
         if cached_mtime == mtime:
@@ -14269,30 +14689,290 @@ def get_cached_info(path: str, mtime: int) -> Optional[tuple[int, int, int]]:
     return None
 
 def set_cached_info(path: str, mtime: int, bit_rate: int, sample_rate: int, bit_depth: int):
-    # Open with a 30-second timeout so concurrent writes wait instead of "database is locked"
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute("""
-        INSERT INTO audio_cache(path, mtime, bit_rate, sample_rate, bit_depth)
-        VALUES (?, ?, ?, ?, ?)
-        ON CONFLICT(path) DO UPDATE SET
-            mtime      = excluded.mtime,
-            bit_rate   = excluded.bit_rate,
-            sample_rate = excluded.sample_rate,
-            bit_depth  = excluded.bit_depth
-    """, (path, mtime, bit_rate, sample_rate, bit_depth))
-    con.commit()
-    con.close()
+    # Serialize writers in-process so scan threads queue on a cheap lock instead of
+    # piling up on SQLite's busy handler.
+    con = _cache_db_conn()
+    with _cache_db_write_lock:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.execute("""
+                INSERT INTO audio_cache(path, mtime, bit_rate, sample_rate, bit_depth)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    mtime      = excluded.mtime,
+                    bit_rate   = excluded.bit_rate,
+                    sample_rate = excluded.sample_rate,
+                    bit_depth  = excluded.bit_depth,
+                    head_hash  = NULL
+            """, (path, mtime, bit_rate, sample_rate, bit_depth))
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
+
+_AUDIO_HEAD_HASH_BYTES = 65536
+
+
+def _audio_header_offsets(fh, head: bytes, size: int) -> list[int]:
+    """
+    Offsets past the first _AUDIO_HEAD_HASH_BYTES where stream parameters live: the first MPEG
+    frame after a large ID3v2 tag (embedded art), or an MP4 moov atom placed after mdat.
+    """
+    offsets: list[int] = []
+    if head[:3] == b"ID3" and len(head) >= 10:
+        tag_size = ((head[6] & 0x7F) << 21) | ((head[7] & 0x7F) << 14) | ((head[8] & 0x7F) << 7) | (head[9] & 0x7F)
+        audio_start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+        if len(head) - 4096 < audio_start < size:
+            offsets.append(audio_start)
+    elif head[4:8] == b"ftyp":
+        pos = 0
+        for _ in range(64):
+            if pos + 8 > size:
+                break
+            fh.seek(pos)
+            hdr = fh.read(16)
+            atom_size = int.from_bytes(hdr[:4], "big")
+            if atom_size == 1 and len(hdr) >= 16:
+                atom_size = int.from_bytes(hdr[8:16], "big")
+            elif atom_size == 0:
+                atom_size = size - pos
+            if hdr[4:8] == b"moov":
+                if pos + 8 > len(head):
+                    offsets.append(pos)
+                break
+            if atom_size < 8:
+                break
+            pos += atom_size
+    return offsets
+
+
+def _file_head_hash(path: str) -> bytes | None:
+    """
+    8-byte content fingerprint of *path* for the audio cache: its size, first and last 64 KiB,
+    and 64 KiB at the audio frames / moov atom when those sit past the head (MP3 with a large
+    ID3v2 tag, M4A with moov after mdat). xxh3 when xxhash is installed, blake2b otherwise;
+    None when the file can't be read.
+    """
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    try:
+        with open(path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            head = fh.read(_AUDIO_HEAD_HASH_BYTES)
+            hasher.update(size.to_bytes(8, "little"))
+            hasher.update(head)
+            for offset in _audio_header_offsets(fh, head, size):
+                fh.seek(offset)
+                hasher.update(offset.to_bytes(8, "little"))
+                hasher.update(fh.read(_AUDIO_HEAD_HASH_BYTES))
+            if size > len(head):
+                fh.seek(max(len(head), size - _AUDIO_HEAD_HASH_BYTES))
+                hasher.update(fh.read(_AUDIO_HEAD_HASH_BYTES))
+    except OSError:
+        return None
+    return hasher.digest()
+
+
+def get_cached_info_many(entries: list[tuple[str, int]]) -> dict[str, tuple[int, int, int]]:
+    """
+    Batched get_cached_info: one SELECT for a folder's (path, mtime) pairs.
+    Returns {path: (bit_rate, sample_rate, bit_depth)} for rows whose mtime still matches.
+    A row whose mtime changed but whose head_hash still matches the file (mtime touched by a
+    backup/copy, content unchanged) is also a hit; its mtime is refreshed.
+    """
+    if not entries:
+        return {}
+    wanted = {path: mtime for path, mtime in entries}
+    placeholders = ",".join("?" for _ in wanted)
+    rows = _cache_db_conn().execute(
+        f"SELECT path, bit_rate, sample_rate, bit_depth, mtime, head_hash FROM audio_cache WHERE path IN ({placeholders})",
+        list(wanted),
+    ).fetchall()
+    out: dict[str, tuple[int, int, int]] = {}
+    refreshed: list[tuple] = []
+    for path, br, sr, bd, cached_mtime, head_hash in rows:
+        mtime = wanted.get(path)
+        if mtime == cached_mtime:
+            out[path] = (br, sr, bd)
+        elif head_hash and _file_head_hash(path) == bytes(head_hash):
+            out[path] = (br, sr, bd)
+            refreshed.append((path, mtime, br, sr, bd, bytes(head_hash)))
+    if refreshed:
+        try:
+            set_cached_info_many(refreshed)
+        except sqlite3.Error:
+            logging.debug("audio_cache mtime refresh failed", exc_info=True)
+    return out
+
+_AUDIO_CACHE_UPSERT_SQL = """
+    INSERT INTO audio_cache(path, mtime, bit_rate, sample_rate, bit_depth, head_hash)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        mtime      = excluded.mtime,
+        bit_rate   = excluded.bit_rate,
+        sample_rate = excluded.sample_rate,
+        bit_depth  = excluded.bit_depth,
+        head_hash  = excluded.head_hash
+"""
+
+_AUDIO_FOLDER_CACHE_UPSERT_SQL = """
+    INSERT INTO audio_folder_cache(path, sig, ext, bit_rate, sample_rate, bit_depth, file_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        sig         = excluded.sig,
+        ext         = excluded.ext,
+        bit_rate    = excluded.bit_rate,
+        sample_rate = excluded.sample_rate,
+        bit_depth   = excluded.bit_depth,
+        file_count  = excluded.file_count
+"""
+
+
+def set_cached_info_many(rows: list[tuple[str, int, int, int, int, bytes | None]]):
+    """Batched set_cached_info: upsert (path, mtime, bit_rate, sample_rate, bit_depth, head_hash) rows in one transaction."""
+    if not rows:
+        return
+    pending = getattr(_cache_db_local, "pending_files", None)
+    if pending is not None:
+        pending.extend(rows)
+        return
+    _audio_cache_flush_rows(rows, [])
+
+
+def get_cached_folder_info(path: str, sig: str) -> Optional[tuple[str, int, int, int]]:
+    """Return (ext, bit_rate, sample_rate, bit_depth) for a folder whose signature is unchanged."""
+    row = _cache_db_conn().execute(
+        "SELECT sig, ext, bit_rate, sample_rate, bit_depth FROM audio_folder_cache WHERE path = ?", (path,)
+    ).fetchone()
+    if row and row[0] == sig:
+        return (str(row[1] or ""), int(row[2] or 0), int(row[3] or 0), int(row[4] or 0))
+    return None
+
+def set_cached_folder_info(path: str, sig: str, ext: str, bit_rate: int, sample_rate: int, bit_depth: int, file_count: int):
+    row = (path, sig, ext, bit_rate, sample_rate, bit_depth, file_count)
+    pending = getattr(_cache_db_local, "pending_folders", None)
+    if pending is not None:
+        pending.append(row)
+        return
+    con = _cache_db_conn()
+    with _cache_db_write_lock:
+        con.execute(_AUDIO_FOLDER_CACHE_UPSERT_SQL, row)
+
+
+_audio_cache_writer_lock = threading.Lock()
+_audio_cache_writer_thread: Optional[threading.Thread] = None
+_audio_cache_writer_stop_event = threading.Event()
+_audio_cache_write_queue: Queue[Any] = Queue()
+_AUDIO_CACHE_WRITER_BATCH_ROWS = 500
+
+
+def _audio_cache_flush_rows(file_rows: list[tuple], folder_rows: list[tuple]) -> None:
+    if not file_rows and not folder_rows:
+        return
+    con = _cache_db_conn()
+    with _cache_db_write_lock:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            if file_rows:
+                con.executemany(_AUDIO_CACHE_UPSERT_SQL, file_rows)
+            if folder_rows:
+                con.executemany(_AUDIO_FOLDER_CACHE_UPSERT_SQL, folder_rows)
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
+
+def _audio_cache_writer_loop() -> None:
+    """Single cache.db writer: drain queued (file_rows, folder_rows) batches and commit them together."""
+    while True:
+        if _audio_cache_writer_stop_event.is_set() and _audio_cache_write_queue.empty():
+            break
+        try:
+            item = _audio_cache_write_queue.get(timeout=0.4)
+        except Empty:
+            continue
+        items = [item]
+        n_rows = len(item[0]) + len(item[1])
+        while n_rows < _AUDIO_CACHE_WRITER_BATCH_ROWS:
+            try:
+                nxt = _audio_cache_write_queue.get_nowait()
+            except Empty:
+                break
+            items.append(nxt)
+            n_rows += len(nxt[0]) + len(nxt[1])
+        file_rows = [row for f, _d in items for row in f]
+        folder_rows = [row for _f, d in items for row in d]
+        try:
+            _audio_cache_flush_rows(file_rows, folder_rows)
+        except sqlite3.Error:
+            logging.debug("audio cache flush failed (%d files, %d folders)", len(file_rows), len(folder_rows), exc_info=True)
+        for _ in items:
+            _audio_cache_write_queue.task_done()
+
+
+def _start_audio_cache_writer_if_needed() -> None:
+    global _audio_cache_writer_thread
+    with _audio_cache_writer_lock:
+        if _audio_cache_writer_thread is not None and _audio_cache_writer_thread.is_alive():
+            return
+        _audio_cache_writer_stop_event.clear()
+        _audio_cache_writer_thread = threading.Thread(
+            target=_audio_cache_writer_loop,
+            daemon=True,
+            name="audio-cache-writer",
+        )
+        _audio_cache_writer_thread.start()
+
+
+def _stop_audio_cache_writer() -> None:
+    _audio_cache_writer_stop_event.set()
+    with _audio_cache_writer_lock:
+        t = _audio_cache_writer_thread
+    if t is not None and t.is_alive():
+        t.join(timeout=5.0)
+
+
+def _audio_cache_writes_wait_for_idle(max_wait_sec: float = 10.0) -> None:
+    deadline = time.time() + max(0.0, float(max_wait_sec or 0.0))
+    while time.time() < deadline:
+        unfinished = int(getattr(_audio_cache_write_queue, "unfinished_tasks", 0) or 0)
+        if unfinished <= 0:
+            return
+        time.sleep(0.05)
+
+
+@contextmanager
+def _buffered_audio_cache_writes():
+    """
+    Hold this thread's audio_cache / audio_folder_cache writes and hand them to the
+    audio-cache-writer thread on exit, so scan workers never wait on the cache.db
+    write lock (one transaction per batch instead of one per folder).
+    Nested use is a no-op; only the outermost block flushes.
+    """
+    if getattr(_cache_db_local, "pending_files", None) is not None:
+        yield
+        return
+    _cache_db_local.pending_files = []
+    _cache_db_local.pending_folders = []
+    try:
+        yield
+    finally:
+        file_rows = _cache_db_local.pending_files
+        folder_rows = _cache_db_local.pending_folders
+        _cache_db_local.pending_files = None
+        _cache_db_local.pending_folders = None
+        if file_rows or folder_rows:
+            _start_audio_cache_writer_if_needed()
+            _audio_cache_write_queue.put_nowait((file_rows, folder_rows))
 
 
 def get_cached_acoustid(path: str) -> Optional[tuple[float, str]]:
     """Return (duration, fingerprint) from cache if present. Otherwise None."""
     try:
-        con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-        cur = con.cursor()
-        cur.execute("SELECT acoustid_duration, acoustid_fingerprint FROM audio_cache WHERE path = ?", (path,))
-        row = cur.fetchone()
-        con.close()
+        row = _cache_db_conn().execute(
+            "SELECT acoustid_duration, acoustid_fingerprint FROM audio_cache WHERE path = ?", (path,)
+        ).fetchone()
     except Exception:
         return None
     if row and row[0] is not None and row[1]:
@@ -14302,20 +14982,24 @@ def get_cached_acoustid(path: str) -> Optional[tuple[float, str]]:
 
 def set_cached_acoustid(path: str, duration: float, fingerprint: str):
     """Store AcousticID fingerprint and duration for a track path. Creates row if missing."""
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute(
-        "UPDATE audio_cache SET acoustid_fingerprint = ?, acoustid_duration = ? WHERE path = ?",
-        (fingerprint, duration, path),
-    )
-    if cur.rowcount == 0:
-        cur.execute(
-            """INSERT INTO audio_cache(path, mtime, bit_rate, sample_rate, bit_depth, acoustid_fingerprint, acoustid_duration)
-               VALUES (?, 0, 0, 0, 0, ?, ?)""",
-            (path, fingerprint, duration),
-        )
-    con.commit()
-    con.close()
+    con = _cache_db_conn()
+    with _cache_db_write_lock:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            cur = con.execute(
+                "UPDATE audio_cache SET acoustid_fingerprint = ?, acoustid_duration = ? WHERE path = ?",
+                (fingerprint, duration, path),
+            )
+            if cur.rowcount == 0:
+                con.execute(
+                    """INSERT INTO audio_cache(path, mtime, bit_rate, sample_rate, bit_depth, acoustid_fingerprint, acoustid_duration)
+                       VALUES (?, 0, 0, 0, 0, ?, ?)""",
+                    (path, fingerprint, duration),
+                )
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
 
 
 init_cache_db()
@@ -16082,7 +16766,7 @@ def _read_sqlite_cache_metrics() -> dict:
     if not CACHE_DB_FILE.exists():
         return out
     try:
-        con = sqlite3.connect(str(CACHE_DB_FILE), timeout=5)
+        con = _open_db(str(CACHE_DB_FILE), timeout=5)
         cur = con.cursor()
         if _sqlite_table_exists(cur, "audio_cache"):
             out["audio_cache_rows"] = _sqlite_scalar(cur, "SELECT COUNT(*) FROM audio_cache")
@@ -16127,7 +16811,7 @@ def _read_state_cache_metrics() -> dict:
     if not STATE_DB_FILE.exists():
         return out
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=5)
+        con = _open_db(str(STATE_DB_FILE), timeout=5)
         cur = con.cursor()
         if _sqlite_table_exists(cur, "files_album_scan_cache"):
             out["files_album_scan_cache_rows"] = _sqlite_scalar(cur, "SELECT COUNT(*) FROM files_album_scan_cache")
@@ -16519,7 +17203,7 @@ def _record_files_pending_change(
     if source_id_int <= 0:
         source_id_int = int(_source_id_for_path(folder_key) or 0)
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         cur.execute(
             """
@@ -16623,7 +17307,7 @@ def _files_watcher_should_ignore_folder_key(folder_key: str) -> bool:
 def _list_files_pending_changes(limit: int = 10000) -> list[dict]:
     out: list[dict] = []
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         cur.execute(
             """
@@ -16662,7 +17346,7 @@ def _clear_files_pending_changes(folder_paths: list[str]) -> int:
         return 0
     removed = 0
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         cur.executemany("DELETE FROM files_pending_changes WHERE folder_path = ?", [(p,) for p in cleaned])
         removed = int(cur.rowcount or 0)
@@ -16676,7 +17360,7 @@ def _clear_files_pending_changes(folder_paths: list[str]) -> int:
 def _folder_has_audio_files(folder: Path) -> bool:
     try:
         for p in folder.iterdir():
-            if p.is_file() and AUDIO_RE.search(p.name):
+            if p.is_file() and _is_audio_name(p.name):
                 return True
     except Exception:
         return False
@@ -16701,7 +17385,7 @@ def _resolve_album_folders_from_event_path(raw_path: str) -> list[str]:
     lowered = path.name.lower()
     path_exists = path.exists()
     if path_exists and path.is_file():
-        if AUDIO_RE.search(path.name):
+        if _is_audio_name(path.name):
             candidates.append(path.parent)
         elif lowered.startswith(("cover", "folder", "front", "album", "artwork")):
             candidates.append(path.parent)
@@ -16724,7 +17408,7 @@ def _resolve_album_folders_from_event_path(raw_path: str) -> list[str]:
     else:
         # Deleted/moved paths are often no longer present on disk when watchdog fires.
         # Infer best-effort album folder from the event path itself.
-        if AUDIO_RE.search(path.name):
+        if _is_audio_name(path.name):
             candidates.append(path.parent)
         elif lowered.startswith(("cover", "folder", "front", "album", "artwork")):
             candidates.append(path.parent)
@@ -17089,7 +17773,7 @@ def _auto_changed_only_scan_loop() -> None:
 
             # Require some pending changes.
             try:
-                con = sqlite3.connect(str(STATE_DB_FILE), timeout=5)
+                con = _open_db(str(STATE_DB_FILE), timeout=5)
                 cur = con.cursor()
                 cur.execute("SELECT COUNT(*) FROM files_pending_changes")
                 pending = int((cur.fetchone() or [0])[0] or 0)
@@ -18546,12 +19230,12 @@ def _files_index_read_counts() -> tuple[int, int, int]:
         return (0, 0, 0)
     try:
         with conn.cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM files_artists")
-            artists = int(cur.fetchone()[0] or 0)
-            cur.execute("SELECT COUNT(*) FROM files_albums")
-            albums = int(cur.fetchone()[0] or 0)
-            cur.execute("SELECT COUNT(*) FROM files_tracks")
-            tracks = int(cur.fetchone()[0] or 0)
+            cur.execute(
+                "SELECT (SELECT COUNT(*) FROM files_artists), "
+                "(SELECT COUNT(*) FROM files_albums), "
+                "(SELECT COUNT(*) FROM files_tracks)"
+            )
+            artists, albums, tracks = (int(v or 0) for v in cur.fetchone())
             return (artists, albums, tracks)
     except Exception:
         return (0, 0, 0)
@@ -27310,7 +27994,7 @@ def _reco_record_event(conn, session_id: str, track_id: int, event_type: str, pl
 
 # ----- Run summary tracking ---------------------------------------------------
 def _count_rows(table: str) -> int:
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     cur.execute(f"SELECT COUNT(*) FROM {table}")
     n = cur.fetchone()[0]
@@ -27411,6 +28095,7 @@ atexit.register(_shutdown_ffprobe_pool)
 # Shutdown scheduler loop on exit
 atexit.register(_stop_scheduler)
 atexit.register(_stop_ai_usage_worker)
+atexit.register(_stop_audio_cache_writer)
 atexit.register(_stop_files_watcher_manager)
 atexit.register(_stop_files_watcher)
 
@@ -27542,24 +28227,17 @@ def get_mb_queue() -> MusicBrainzQueue:
 
 # --- MusicBrainz cache helpers ---
 def get_cached_mb_info(mbid: str) -> dict | None:
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute("SELECT info_json FROM musicbrainz_cache WHERE mbid = ?", (mbid,))
-    row = cur.fetchone()
-    con.close()
+    row = _cache_db_conn().execute("SELECT info_json FROM musicbrainz_cache WHERE mbid = ?", (mbid,)).fetchone()
     if row:
         return json.loads(row[0])
     return None
 
 def set_cached_mb_info(mbid: str, info: dict):
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute(
-        "INSERT OR REPLACE INTO musicbrainz_cache (mbid, info_json, created_at) VALUES (?, ?, ?)",
-        (mbid, json.dumps(info), int(time.time()))
-    )
-    con.commit()
-    con.close()
+    with _cache_db_write_lock:
+        _cache_db_conn().execute(
+            "INSERT OR REPLACE INTO musicbrainz_cache (mbid, info_json, created_at) VALUES (?, ?, ?)",
+            (mbid, json.dumps(info), int(time.time()))
+        )
 
 
 def get_cached_mb_album_lookup(artist_norm: str, album_norm: str) -> tuple[str | None, dict | None]:
@@ -27569,14 +28247,10 @@ def get_cached_mb_album_lookup(artist_norm: str, album_norm: str) -> tuple[str |
     - ("", None) = cached as "no MusicBrainz ID found"
     - (mbid, info_dict) = cached as found (info_dict may be None if only mbid was stored)
     """
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute(
+    row = _cache_db_conn().execute(
         "SELECT mbid, info_json FROM musicbrainz_album_lookup WHERE artist_norm = ? AND album_norm = ?",
         (artist_norm, album_norm),
-    )
-    row = cur.fetchone()
-    con.close()
+    ).fetchone()
     if row is None:
         return (None, None)
     mbid_val, info_json = row[0], row[1]
@@ -27588,15 +28262,12 @@ def get_cached_mb_album_lookup(artist_norm: str, album_norm: str) -> tuple[str |
 
 def set_cached_mb_album_lookup(artist_norm: str, album_norm: str, mbid: str | None, info: dict | None):
     """Cache result of artist+album lookup. mbid None or '' = not found."""
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute(
-        """INSERT OR REPLACE INTO musicbrainz_album_lookup (artist_norm, album_norm, mbid, info_json, created_at)
-           VALUES (?, ?, ?, ?, ?)""",
-        (artist_norm, album_norm, mbid or "", json.dumps(info) if info else None, int(time.time())),
-    )
-    con.commit()
-    con.close()
+    with _cache_db_write_lock:
+        _cache_db_conn().execute(
+            """INSERT OR REPLACE INTO musicbrainz_album_lookup (artist_norm, album_norm, mbid, info_json, created_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            (artist_norm, album_norm, mbid or "", json.dumps(info) if info else None, int(time.time())),
+        )
 
 
 def _provider_cache_norm(value: str) -> str:
@@ -27621,18 +28292,14 @@ def get_cached_provider_album_lookup(provider: str, artist_name: str, album_titl
     if not provider_key or not artist_norm or not album_norm:
         return (None, None)
     now = int(time.time())
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute(
+    row = _cache_db_conn().execute(
         """
         SELECT status, payload_json, expires_at
         FROM provider_album_lookup
         WHERE provider = ? AND artist_norm = ? AND album_norm = ?
         """,
         (provider_key, artist_norm, album_norm),
-    )
-    row = cur.fetchone()
-    con.close()
+    ).fetchone()
     if row is None:
         return (None, None)
     status = str(row[0] or "").strip().lower()
@@ -27640,14 +28307,11 @@ def get_cached_provider_album_lookup(provider: str, artist_name: str, album_titl
     expires_at = int(row[2] or 0)
     if expires_at and expires_at < now:
         try:
-            con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-            cur = con.cursor()
-            cur.execute(
-                "DELETE FROM provider_album_lookup WHERE provider = ? AND artist_norm = ? AND album_norm = ?",
-                (provider_key, artist_norm, album_norm),
-            )
-            con.commit()
-            con.close()
+            with _cache_db_write_lock:
+                _cache_db_conn().execute(
+                    "DELETE FROM provider_album_lookup WHERE provider = ? AND artist_norm = ? AND album_norm = ?",
+                    (provider_key, artist_norm, album_norm),
+                )
         except Exception:
             pass
         return (None, None)
@@ -27686,18 +28350,15 @@ def set_cached_provider_album_lookup(
     now = int(time.time())
     expires_at = now + int(ttl)
     payload_json = json.dumps(payload) if (status_norm == "found" and isinstance(payload, dict)) else None
-    con = sqlite3.connect(str(CACHE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    cur.execute(
-        """
-        INSERT OR REPLACE INTO provider_album_lookup
-        (provider, artist_norm, album_norm, status, payload_json, created_at, expires_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (provider_key, artist_norm, album_norm, status_norm, payload_json, now, expires_at),
-    )
-    con.commit()
-    con.close()
+    with _cache_db_write_lock:
+        _cache_db_conn().execute(
+            """
+            INSERT OR REPLACE INTO provider_album_lookup
+            (provider, artist_norm, album_norm, status, payload_json, created_at, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (provider_key, artist_norm, album_norm, status_norm, payload_json, now, expires_at),
+        )
 
 
 def fetch_provider_album_lookup_cached(
@@ -27748,6 +28409,7 @@ state = {
     "dedupe_last_write": None,  # {"path": str, "at": float} after each move to /dupes
     # duplicates: { artist_name: [ { artist, album_id, best, losers } ] }
     "duplicates": {},
+    "duplicates_version": 0,  # bumped on in-place edits of "duplicates" (see _cached_card_list)
     # Scan details tracking
     "scan_artists_processed": 0,      # Nombre d'artistes traités
     "scan_artists_total": 0,          # Total d'artistes
@@ -27888,6 +28550,36 @@ state = {
     "scan_player_sync_message": "",
 }
 lock = threading.Lock()
+# Wakes /api/events streams when scan/dedupe counters or the scanning/deduping flags move.
+# The counter lets a stream notice notifications sent while it was busy writing, not waiting.
+_progress_event_cond = threading.Condition()
+_progress_event_generation = 0
+
+
+def _notify_progress_event() -> None:
+    """Push-notify open /api/events streams. Call after releasing `lock`."""
+    global _progress_event_generation
+    with _progress_event_cond:
+        _progress_event_generation += 1
+        _progress_event_cond.notify_all()
+
+
+# Duplicate groups found by the running scan, oldest first, as (seq, artist_name, groups).
+# /api/events streams them as "duplicates" deltas so the Unduper appends cards instead of
+# refetching the whole list. deque.append and next() on itertools.count are atomic, so the
+# scan loop publishes without taking `lock`. Cleared when a scan starts and ends.
+_SCAN_GROUP_EVENTS: deque = deque(maxlen=5000)
+_scan_group_event_seq = itertools.count(1)
+
+
+def _publish_scan_group_event(artist_name: str, groups: list[dict]) -> None:
+    _SCAN_GROUP_EVENTS.append((next(_scan_group_event_seq), artist_name, groups))
+
+
+def _clear_scan_group_events() -> None:
+    _SCAN_GROUP_EVENTS.clear()
+
+
 files_index_lock = threading.Lock()
 _files_watcher_lock = threading.Lock()
 _files_watcher_observer = None
@@ -27915,17 +28607,151 @@ def plex_connect() -> sqlite3.Connection:
     journal/WAL files on the Plex volume (which is mounted read-only in PMDA
     and can otherwise produce disk I/O errors on some filesystems).
     """
-    # Open the Plex database in read-only + immutable mode to avoid write errors
-    con = sqlite3.connect(f"file:{PLEX_DB_FILE}?mode=ro&immutable=1", uri=True, timeout=30)
+    # Open the Plex database in read-only + immutable mode to avoid write errors.
+    # check_same_thread=False: PLEX_POOL hands the same connection to different threads
+    # (one at a time), which the default same-thread check would reject.
+    con = sqlite3.connect(
+        f"file:{PLEX_DB_FILE}?mode=ro&immutable=1",
+        uri=True,
+        timeout=30,
+        check_same_thread=False,
+    )
     con.text_factory = lambda b: b.decode("utf-8", "surrogateescape")
+    # Read-only tuning: refuse writes outright, keep temp b-trees (GROUP BY/ORDER BY) in memory,
+    # read pages through mmap (shared with the OS page cache) instead of read() syscalls and give
+    # each connection a 32 MiB private page cache. Rows stay plain tuples.
+    try:
+        con.execute("PRAGMA query_only=1")
+        con.execute("PRAGMA temp_store=MEMORY")
+        con.execute("PRAGMA mmap_size=1073741824")
+        con.execute("PRAGMA cache_size=-32768")
+    except sqlite3.Error as e:
+        logging.debug("plex_connect: read-only PRAGMAs not applied: %s", e)
+    return con
+
+
+_plex_read_local = threading.local()
+_plex_read_generation = 0
+
+
+def _plex_read_conn() -> sqlite3.Connection:
+    """
+    Thread-local Plex DB connection for scan workers, so each worker opens the Plex DB
+    once per scan instead of once per artist. The connection is immutable (no change
+    detection), so _reset_plex_read_connections() must be called when a new scan plan
+    is built; connections are reopened lazily afterwards.
+    """
+    key = (str(PLEX_DB_FILE or ""), _plex_read_generation)
+    con = getattr(_plex_read_local, "con", None)
+    if con is not None and getattr(_plex_read_local, "key", None) == key:
+        return con
+    if con is not None:
+        try:
+            con.close()
+        except Exception:
+            pass
+    con = plex_connect()
+    _plex_read_local.con = con
+    _plex_read_local.key = key
     return con
 
 
+def _reset_plex_read_connections() -> None:
+    """Invalidate every worker's cached Plex connection (they reopen on next use)."""
+    global _plex_read_generation
+    _plex_read_generation += 1
+
+
+# Short-lived reuse only: Plex connections are immutable and won't see Plex's own writes.
+PLEX_POOL = SQLitePool(
+    lambda: (str(PLEX_DB_FILE or ""), _plex_read_generation),
+    lambda: plex_connect(),
+    max_age_sec=60.0,
+)
+
+
 # ───────────────────────────────── UTILITIES ──────────────────────────────────
+# Keep-alive connections to Plex, shared by plex_api() callers (refresh/retire pools run up to 8
+# requests at once), instead of a new TCP/TLS handshake per call. Connection drops on a reused
+# socket are retried quickly; HTTP status retries stay with the callers (see _plex_retire).
+# The token is still sent per request because PLEX_TOKEN can change from Settings at runtime.
+_PLEX_HTTP = requests.Session()
+_PLEX_HTTP_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, read=1, backoff_factor=0.1, raise_on_status=False),
+)
+_PLEX_HTTP.mount("http://", _PLEX_HTTP_ADAPTER)
+_PLEX_HTTP.mount("https://", _PLEX_HTTP_ADAPTER)
+
+
 def plex_api(path: str, method: str = "GET", **kw):
     headers = kw.pop("headers", {})
     headers["X-Plex-Token"] = PLEX_TOKEN
-    return requests.request(method, f"{PLEX_HOST}{path}", headers=headers, timeout=60, **kw)
+    return _PLEX_HTTP.request(method, f"{PLEX_HOST}{path}", headers=headers, timeout=60, **kw)
+
+# Shared pool for retiring Plex metadata of moved losers (trash + delete are independent per item).
+_PLEX_RETIRE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="plex-retire")
+_PLEX_RETRY_STATUSES = {409, 429, 500, 502, 503, 504}
+
+
+def _plex_retire(album_id: int, attempts: int = 3) -> None:
+    """
+    Trash then delete one Plex metadata item, retrying transient statuses with short backoff
+    (replaces the fixed 0.3s sleep between the two calls).
+    """
+    for path, method in ((f"/library/metadata/{album_id}/trash", "PUT"), (f"/library/metadata/{album_id}", "DELETE")):
+        for attempt in range(max(1, attempts)):
+            resp = plex_api(path, method=method)
+            status = int(getattr(resp, "status_code", 0) or 0)
+            if status not in _PLEX_RETRY_STATUSES or attempt == attempts - 1:
+                break
+            time.sleep(0.3 * (2 ** attempt))
+
+
+# Above this many artists, one section-wide refresh is cheaper than per-artist path refreshes.
+PLEX_REFRESH_BATCH_THRESHOLD = 50
+
+
+def _plex_refresh_artists(artists, section_ids=None, *, empty_trash: bool = True, caller: str = "plex") -> None:
+    """
+    Refresh the Plex artist folders touched by a dedupe/restore, then empty each section's trash once.
+    Path refreshes run concurrently; large batches collapse into one refresh per section.
+    """
+    artists = sorted({str(a) for a in (artists or []) if str(a or "").strip()})
+    if not artists or not (PLEX_HOST and PLEX_TOKEN):
+        return
+    if section_ids is None:
+        section_ids = [SECTION_ID]
+    section_ids = [sid for sid in section_ids if sid not in (None, "")]
+    requests_to_send: list[tuple[str, str]] = []
+    for sid in section_ids:
+        if len(artists) > PLEX_REFRESH_BATCH_THRESHOLD:
+            requests_to_send.append((f"/library/sections/{sid}/refresh", f"section {sid}"))
+            continue
+        for artist in artists:
+            letter = quote_plus(artist[0].upper())
+            art_enc = quote_plus(artist)
+            requests_to_send.append(
+                (f"/library/sections/{sid}/refresh?path=/music/matched/{letter}/{art_enc}", f"artist={artist} section={sid}")
+            )
+
+    def _refresh(item: tuple[str, str]) -> None:
+        path, label = item
+        try:
+            plex_api(path, method="GET")
+        except Exception as e:
+            logging.warning("%s: plex refresh failed for %s: %s", caller, label, e)
+
+    with ThreadPoolExecutor(max_workers=min(6, max(1, len(requests_to_send)))) as pool:
+        list(pool.map(_refresh, requests_to_send))
+    if empty_trash:
+        for sid in section_ids:
+            try:
+                plex_api(f"/library/sections/{sid}/emptyTrash", method="PUT")
+            except Exception as e:
+                logging.warning("%s: plex emptyTrash failed for section %s: %s", caller, sid, e)
+
 
 # ──────────────────────────────── Discord notifications ────────────────────────────────
 def notify_discord(content: str):
@@ -28146,7 +28972,23 @@ def build_dupe_destination(
     return DUPE_ROOT / letter / artist / album
 
 def folder_size(p: Path) -> int:
-    return sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+    """Total size in bytes of regular files under *p* (os.scandir walk; unreadable dirs are skipped)."""
+    total = 0
+    stack = [str(p)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
 
 def safe_folder_size(p: Path) -> int:
     """Return folder size in bytes, or 0 if path missing or not readable."""
@@ -28160,6 +29002,12 @@ def safe_folder_size(p: Path) -> int:
 def score_format(ext: str) -> int:
     return FMT_SCORE.get(ext.lower(), 0)
 
+# Precompiled patterns shared by the album-title normalizers below.
+_ALBUM_ELLIPSIS_TAIL_RE = re.compile(r"(?:\.{3,})+\s*$")
+_ALBUM_PAREN_RE = re.compile(r"[\(\[][^(\)\]]*[\)\]]")
+
+
+@lru_cache(maxsize=65536)
 def norm_album(title: str) -> str:
     """
     Normalise an album title for duplicate grouping.
@@ -28170,9 +29018,9 @@ def norm_album(title: str) -> str:
     """
     raw = (title or "").strip()
     raw = raw.replace("…", "...")
-    raw = re.sub(r"(?:\.{3,})+\s*$", "", raw).strip() or raw
+    raw = _ALBUM_ELLIPSIS_TAIL_RE.sub("", raw).strip() or raw
     # Remove any content in parentheses or brackets
-    cleaned = re.sub(r"[\(\[][^(\)\]]*[\)\]]", "", raw)
+    cleaned = _ALBUM_PAREN_RE.sub("", raw)
     cleaned = " ".join(cleaned.split()).lower()
 
     if len(cleaned) >= 3:
@@ -28206,6 +29054,7 @@ def strip_parenthetical_suffixes(s: str) -> str:
     return out.strip()
 
 
+@lru_cache(maxsize=65536)
 def norm_album_for_dedup(title: str, normalize_parenthetical: bool) -> str:
     """
     Normalise an album title for duplicate grouping, with optional parenthetical handling.
@@ -28215,7 +29064,7 @@ def norm_album_for_dedup(title: str, normalize_parenthetical: bool) -> str:
     """
     raw = (title or "").strip()
     raw = raw.replace("…", "...")
-    raw = re.sub(r"(?:\.{3,})+\s*$", "", raw).strip() or raw
+    raw = _ALBUM_ELLIPSIS_TAIL_RE.sub("", raw).strip() or raw
     if normalize_parenthetical:
         raw = strip_parenthetical_suffixes(raw) or raw
     cleaned = " ".join(raw.split()).lower()
@@ -28307,6 +29156,25 @@ def _dupe_extract_edition_tokens(title: str) -> list[str]:
     return out[:20]
 
 
+_DUPE_LOOSE_BRACKET_RE = re.compile(r"\[[^\]]*\]")
+_DUPE_LOOSE_PAREN_RE = re.compile(r"\([^)]*\)")
+_DUPE_LOOSE_SEPARATOR_RE = re.compile(r"[_•·]+")
+_DUPE_LOOSE_HIRES_RES = (
+    re.compile(r"\b\d{1,2}\s*[-/]\s*\d{2,3}(?:\.\d)?\b"),  # 24-96, 16/44.1
+    re.compile(r"\b\d{3,4}\s*kbps\b"),
+    re.compile(r"\b\d{1,2}\s*[- ]?bit\b"),
+    re.compile(r"\b\d{2,3}(?:\.\d)?\s*khz\b"),
+)
+_DUPE_LOOSE_DROP_WORD_RES = tuple(
+    re.compile(rf"\\b{re.escape(w)}\\b")
+    for w in sorted((_DUPE_NOISE_WORDS | _DUPE_EDITION_MARKERS) - _DUPE_CONTENT_MARKERS, key=len, reverse=True)
+)
+_DUPE_LOOSE_CATALOG_RE = re.compile(r"\b[a-z]{2,6}[- ]?\d{2,6}\b")
+_DUPE_LOOSE_QUOTES_RE = re.compile(r"[\"'`]")
+_DUPE_LOOSE_PUNCT_RE = re.compile(r"[^\w\s]+")
+
+
+@lru_cache(maxsize=65536)
 def norm_album_for_dedup_loose(title: str) -> str:
     """
     Aggressive title normalization for dupe candidate grouping.
@@ -28317,34 +29185,31 @@ def norm_album_for_dedup_loose(title: str) -> str:
     if not raw:
         return "__untitled__"
     raw = raw.replace("…", "...")
-    raw = re.sub(r"(?:\.{3,})+\s*$", "", raw).strip() or raw
+    raw = _ALBUM_ELLIPSIS_TAIL_RE.sub("", raw).strip() or raw
 
     s = raw.replace("_", " ")
     # Drop bracketed segments entirely (often pure noise).
-    s = re.sub(r"\[[^\]]*\]", " ", s)
+    s = _DUPE_LOOSE_BRACKET_RE.sub(" ", s)
     # Drop parenthetical segments (keep tokens separately via _dupe_extract_edition_tokens()).
-    s = re.sub(r"\([^)]*\)", " ", s)
+    s = _DUPE_LOOSE_PAREN_RE.sub(" ", s)
 
     low = s.lower()
     # Normalize separators
-    low = re.sub(r"[_•·]+", " ", low)
+    low = _DUPE_LOOSE_SEPARATOR_RE.sub(" ", low)
     # Remove common hi-res / bitrate markers
-    low = re.sub(r"\b\d{1,2}\s*[-/]\s*\d{2,3}(?:\.\d)?\b", " ", low)  # 24-96, 16/44.1
-    low = re.sub(r"\b\d{3,4}\s*kbps\b", " ", low)
-    low = re.sub(r"\b\d{1,2}\s*[- ]?bit\b", " ", low)
-    low = re.sub(r"\b\d{2,3}(?:\.\d)?\s*khz\b", " ", low)
+    for pattern in _DUPE_LOOSE_HIRES_RES:
+        low = pattern.sub(" ", low)
 
     # Remove noise words + edition markers, but keep content markers (live, soundtrack, etc.)
-    drop_words = (_DUPE_NOISE_WORDS | _DUPE_EDITION_MARKERS) - _DUPE_CONTENT_MARKERS
-    for w in sorted(drop_words, key=len, reverse=True):
-        low = re.sub(rf"\\b{re.escape(w)}\\b", " ", low)
+    for pattern in _DUPE_LOOSE_DROP_WORD_RES:
+        low = pattern.sub(" ", low)
 
     # Strip catalog-like tokens (heuristic): ABC-1234, abc1234, etc.
-    low = re.sub(r"\b[a-z]{2,6}[- ]?\d{2,6}\b", " ", low)
+    low = _DUPE_LOOSE_CATALOG_RE.sub(" ", low)
 
     # Collapse punctuation and whitespace
-    low = re.sub(r"[\"'`]", "", low)
-    low = re.sub(r"[^\w\s]+", " ", low)
+    low = _DUPE_LOOSE_QUOTES_RE.sub("", low)
+    low = _DUPE_LOOSE_PUNCT_RE.sub(" ", low)
     low = " ".join(low.split()).strip()
 
     if len(low) >= 3:
@@ -28380,14 +29245,177 @@ def derive_album_title(plex_title: str, meta: Dict[str, str], folder: Path, albu
     return (f"Untitled Album #{album_id}", "placeholder")
 
 def get_primary_format(folder: Path) -> str:
-    try:
-        for f in folder.rglob("*"):
-            if AUDIO_RE.search(f.name):
-                return f.suffix[1:].upper()
-    except OSError as e:
-        logging.debug("get_primary_format I/O error for %s: %s", folder, e)
+    """Extension (upper-case) of the first audio file under *folder*; stops at the first match."""
+    stack = [str(folder)]
+    while stack:
+        current = stack.pop()
+        subdirs: list[str] = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif _is_audio_name(entry.name) and entry.is_file():
+                            return os.path.splitext(entry.name)[1][1:].upper()
+                    except OSError:
+                        continue
+        except OSError as e:
+            logging.debug("get_primary_format I/O error for %s: %s", current, e)
+            continue
+        stack.extend(reversed(subdirs))
     return "UNKNOWN"
 
+
+def _walk_folder_meta(folder: Path) -> tuple[list[Path], int, str] | None:
+    """
+    One os.scandir walk of *folder* returning (audio_files, size_bytes, dir_sig). audio_files are
+    in _list_audio_files order; dir_sig records the mtime of every directory in the tree (see
+    _folder_meta_dirs_unchanged). None when *folder* itself can't be read.
+    """
+    audio_files: list[Path] = []
+    total = 0
+    dirs: list[list] = []
+    stack: list[tuple[str, int | None]] = [(str(folder), None)]
+    while stack:
+        current, mtime_ns = stack.pop()
+        subdirs: list[tuple[str, int]] = []
+        try:
+            if mtime_ns is None:
+                mtime_ns = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                            if _is_audio_name(entry.name):
+                                audio_files.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            if current == str(folder):
+                return None
+            continue
+        dirs.append([os.path.relpath(current, folder), mtime_ns])
+        stack.extend(reversed(subdirs))
+    return audio_files, total, json.dumps(dirs)
+
+
+def _folder_meta_dirs_unchanged(folder: Path, dir_sig: str) -> bool:
+    """
+    True while every directory recorded in *dir_sig* keeps its mtime: one stat per directory,
+    no listing. Adding, removing or renaming files or sub-folders at any depth bumps the mtime
+    of their parent directory; in-place rewrites of existing files are not detected.
+    """
+    try:
+        dirs = json.loads(dir_sig or "")
+        for rel, mtime_ns in dirs:
+            if os.stat(os.path.join(str(folder), rel)).st_mtime_ns != mtime_ns:
+                return False
+    except (OSError, ValueError, TypeError):
+        return False
+    return bool(dirs)
+
+
+def _store_folder_meta(key: str, dir_sig: str, size_bytes: int, primary: str) -> None:
+    try:
+        with _cache_db_write_lock:
+            _cache_db_conn().execute(
+                """
+                INSERT INTO folder_meta(path, sig, size_bytes, primary_format) VALUES (?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    sig            = excluded.sig,
+                    size_bytes     = excluded.size_bytes,
+                    primary_format = excluded.primary_format
+                """,
+                (key, dir_sig, size_bytes, primary),
+            )
+    except sqlite3.Error:
+        logging.debug("folder_meta write failed for %s", key, exc_info=True)
+
+
+def _list_audio_files_recording_meta(folder: Path) -> list[Path]:
+    """
+    _list_audio_files() for the scan loop: the same walk also records the folder's size and
+    primary format in folder_meta, so save_scan_to_db() reads them without touching the disk.
+    """
+    walked = _walk_folder_meta(folder)
+    if walked is None:
+        return []
+    audio_files, size_bytes, dir_sig = walked
+    primary = audio_files[0].suffix[1:].upper() if audio_files else "UNKNOWN"
+    _store_folder_meta(str(folder), dir_sig, size_bytes, primary)
+    return audio_files
+
+
+def cached_folder_meta(folder: Path) -> tuple[int, str]:
+    """
+    (size_bytes, primary_format) for *folder*, served from cache.db's folder_meta (filled by the
+    scan walk) while no directory in the tree changed mtime. Missing folders return
+    (0, "UNKNOWN") and lose their row.
+    """
+    key = str(folder)
+    try:
+        row = _cache_db_conn().execute(
+            "SELECT sig, size_bytes, primary_format FROM folder_meta WHERE path = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error:
+        row = None
+    if row and _folder_meta_dirs_unchanged(folder, row[0]):
+        return (int(row[1] or 0), str(row[2] or "UNKNOWN"))
+    walked = _walk_folder_meta(folder)
+    if walked is None:
+        if row is not None or not os.path.lexists(key):
+            _forget_folder_meta([key])
+        return (0, "UNKNOWN")
+    audio_files, size_bytes, dir_sig = walked
+    primary = audio_files[0].suffix[1:].upper() if audio_files else "UNKNOWN"
+    _store_folder_meta(key, dir_sig, size_bytes, primary)
+    return (size_bytes, primary)
+
+
+def _forget_folder_meta(paths: list[str]) -> None:
+    """Delete folder_meta rows for *paths*."""
+    if not paths:
+        return
+    try:
+        with _cache_db_write_lock:
+            _cache_db_conn().executemany("DELETE FROM folder_meta WHERE path = ?", [(p,) for p in paths])
+    except sqlite3.Error:
+        logging.debug("folder_meta delete failed", exc_info=True)
+
+
+def prune_folder_meta() -> int:
+    """Drop folder_meta rows whose folder no longer exists (moved to /dupes, deleted, renamed)."""
+    try:
+        rows = _cache_db_conn().execute("SELECT path FROM folder_meta").fetchall()
+    except sqlite3.Error:
+        return 0
+    gone = [str(r[0]) for r in rows if r[0] and not os.path.isdir(str(r[0]))]
+    _forget_folder_meta(gone)
+    if gone:
+        logging.debug("prune_folder_meta: dropped %d stale folder(s)", len(gone))
+    return len(gone)
+
+
+def _edition_primary_format(e: dict) -> str:
+    """
+    Primary format of an edition dict, memoized in e['primary_fmt'] (set by scan_duplicates)
+    so cards and DB writes don't re-walk the folder for every best/loser.
+    """
+    fmt = e.get("primary_fmt") or e.get("fmt_text")
+    if not fmt:
+        folder = e.get("folder")
+        fmt = cached_folder_meta(path_for_fs_access(Path(folder)))[1] if folder else "UNKNOWN"
+        e["primary_fmt"] = fmt
+    return str(fmt)
+
+def _edition_stored_format(e: dict) -> str:
+    """Format already recorded on an edition dict (scan or DB); never touches the filesystem."""
+    return str(e.get("primary_fmt") or e.get("fmt_text") or e.get("fmt") or "UNKNOWN")
+
 def thumb_url(album_id: int) -> str:
     return f"{PLEX_HOST}/library/metadata/{album_id}/thumb?X-Plex-Token={PLEX_TOKEN}"
 
@@ -28422,7 +29450,7 @@ def _files_album_id_for_folder(folder: Path | str) -> int:
             pass
 
 
-def _duplicate_album_thumb_url(album_id: int, folder_path: Path | str | None = None) -> str:
+def _duplicate_album_thumb_url(album_id: int, folder_path: Path | str | None = None, size: int = 128) -> str:
     """
     Return a duplicate-table thumbnail URL that works in both library modes.
     """
@@ -28447,46 +29475,10 @@ def _duplicate_album_thumb_url(album_id: int, folder_path: Path | str | None = N
             base = request.url_root.rstrip("/")
         except Exception:
             base = ""
-        path = f"/api/library/files/album/{resolved_id}/cover?size=128"
+        path = f"/api/library/files/album/{resolved_id}/cover?size={int(size)}"
         return f"{base}{path}" if base else path
-    return thumb_url(aid)
+    return f"/api/plex/album/{aid}/thumb"
 
-def build_cards() -> list[dict]:
-    """
-    Convert the live state["duplicates"] structure into the list of card
-    dictionaries expected by the front-end.  Called both by the initial
-    page render and the /api/duplicates endpoint so that new cards appear
-    incrementally while a scan is running.
-    """
-    cards: list[dict] = []
-    for artist, groups in state["duplicates"].items():
-        for g in groups:
-            best = g["best"]
-            # Ensure "date" is present in each version for modal rendering
-            if "meta" in best:
-                best["date"] = best["meta"].get("date") or best["meta"].get("originaldate") or ""
-            for l in g.get("losers", []):
-                if "meta" in l:
-                    l["date"] = l["meta"].get("date") or l["meta"].get("originaldate") or ""
-            best_fmt = best.get("fmt_text") or get_primary_format(Path(best["folder"]))
-            cards.append(
-                {
-                    "artist_key": artist.replace(" ", "_"),
-                    "artist": artist,
-                    "album_id": best["album_id"],
-                    "n": len(g["losers"]) + 1,
-                    "best_thumb": _duplicate_album_thumb_url(best["album_id"], best.get("folder")),
-                    "best_title": best["title_raw"],
-                    "best_fmt": best_fmt,
-                    "formats": [best_fmt]
-                    + [
-                        l.get("fmt_text") or l.get("fmt") or get_primary_format(Path(l["folder"]))
-                        for l in g["losers"]
-                    ],
-                    "used_ai": best.get("used_ai", False),
-                }
-            )
-    return cards
 @app.route("/api/edition_details")
 def edition_details():
     album_id = int(request.args["album_id"])
@@ -28520,26 +29512,49 @@ class Track(NamedTuple):
     disc: int
     dur: int  # duration in ms
 
-def get_tracks(db_conn, album_id: int) -> List[Track]:
+_plex_parent_index_lock = threading.Lock()
+_plex_parent_index_cache: dict[str, bool] = {}
+
+
+def _plex_has_parent_index(db_conn) -> bool:
+    """
+    Whether metadata_items has a parent_index (disc number) column.
+    Probed once per Plex DB file instead of once per album.
+    """
+    key = str(PLEX_DB_FILE or "")
+    with _plex_parent_index_lock:
+        cached = _plex_parent_index_cache.get(key)
+    if cached is not None:
+        return cached
     has_parent = any(r[1] == "parent_index"
                      for r in db_conn.execute("PRAGMA table_info(metadata_items)"))
-    sql = f"""
+    with _plex_parent_index_lock:
+        _plex_parent_index_cache[key] = has_parent
+    return has_parent
+
+
+_TRACKS_SQL = """
       SELECT tr.title, tr."index",
-             {'tr.parent_index' if has_parent else 'NULL'} AS disc_no,
+             {disc_col} AS disc_no,
              mp.duration
       FROM metadata_items tr
       JOIN media_items mi ON mi.metadata_item_id = tr.id
       JOIN media_parts mp ON mp.media_item_id = mi.id
       WHERE tr.parent_id = ? AND tr.metadata_type = 10
     """
+_TRACKS_SQL_WITH_DISC = _TRACKS_SQL.format(disc_col="tr.parent_index")
+_TRACKS_SQL_NO_DISC = _TRACKS_SQL.format(disc_col="NULL")
+
+
+def get_tracks(db_conn, album_id: int) -> List[Track]:
+    sql = _TRACKS_SQL_WITH_DISC if _plex_has_parent_index(db_conn) else _TRACKS_SQL_NO_DISC
     rows = db_conn.execute(sql, (album_id,)).fetchall()
     return [Track(t.lower().strip(), i or 0, d or 1, dur or 0)
             for t, i, d, dur in rows]
 
 def get_tracks_with_ids(db_conn, album_id: int) -> List[dict]:
     """Return list of track dicts with id, title, index, duration_ms for library playback API."""
-    has_parent = any(r[1] == "parent_index"
-                     for r in db_conn.execute("PRAGMA table_info(metadata_items)"))
+    has_parent = _plex_has_parent_index(db_conn)
     sql = f"""
       SELECT tr.id, tr.title, tr."index",
              {'tr.parent_index' if has_parent else 'NULL'} AS disc_no,
@@ -28572,8 +29587,7 @@ def get_tracks_for_details(db_conn, album_id: int) -> List[dict]:
     Return list of track dicts for API: name, title, idx, duration (seconds), dur (ms),
     format (codec), bitrate (kbps), for use in /details editions.
     """
-    has_parent = any(r[1] == "parent_index"
-                     for r in db_conn.execute("PRAGMA table_info(metadata_items)"))
+    has_parent = _plex_has_parent_index(db_conn)
     stream_cols = _stream_columns(db_conn)
     if stream_cols is None:
         # No media_streams codec/bitrate: return basic track info (duration from part or metadata_items)
@@ -28657,11 +29671,63 @@ def get_tracks_for_details(db_conn, album_id: int) -> List[dict]:
         })
     return out
 
+# Memo of Plex album titles, valid for one Plex DB file / read generation and at most
+# _PLEX_TITLE_CACHE_TTL_SEC, so repeated lookups (loser backfill, details, dedupe) skip SQLite.
+_PLEX_TITLE_CACHE_MAX = 100_000
+_PLEX_TITLE_CACHE_TTL_SEC = 300.0
+_plex_title_cache: dict[str, Any] = {"key": None, "born": 0.0, "titles": {}}
+
+
+def _plex_title_cache_titles() -> dict[int, str]:
+    key = (str(PLEX_DB_FILE or ""), _plex_read_generation)
+    now = time.monotonic()
+    cache = _plex_title_cache
+    titles = cache["titles"]
+    if (
+        cache["key"] != key
+        or now - cache["born"] > _PLEX_TITLE_CACHE_TTL_SEC
+        or len(titles) > _PLEX_TITLE_CACHE_MAX
+    ):
+        titles = {}
+        cache.update({"key": key, "born": now, "titles": titles})
+    return titles
+
+
 def album_title(db_conn, album_id: int) -> str:
+    titles = _plex_title_cache_titles()
+    try:
+        aid = int(album_id)
+    except (TypeError, ValueError):
+        aid = None
+    if aid is not None and aid in titles:
+        return titles[aid]
     row = db_conn.execute(
         "SELECT title FROM metadata_items WHERE id = ?", (album_id,)
     ).fetchone()
-    return row[0] if row else ""
+    title = row[0] if row else ""
+    if row and aid is not None:
+        titles[aid] = title
+    return title
+
+def album_titles_many(db_conn, album_ids) -> dict[int, str]:
+    """Batched album_title(): {album_id: title} in chunks below SQLite's bound-parameter limit."""
+    titles = _plex_title_cache_titles()
+    out: dict[int, str] = {}
+    missing: list[int] = []
+    for aid in sorted({int(a) for a in album_ids if a is not None}):
+        if aid in titles:
+            out[aid] = titles[aid]
+        else:
+            missing.append(aid)
+    for start in range(0, len(missing), 900):
+        chunk = missing[start:start + 900]
+        placeholders = ",".join("?" for _ in chunk)
+        for album_id, title in db_conn.execute(
+            f"SELECT id, title FROM metadata_items WHERE id IN ({placeholders})", chunk
+        ):
+            out[int(album_id)] = title or ""
+            titles[int(album_id)] = title or ""
+    return out
 
 def first_part_path(db_conn, album_id: int) -> Optional[Path]:
     sql = """
@@ -28674,8 +29740,11 @@ def first_part_path(db_conn, album_id: int) -> Optional[Path]:
     row = db_conn.execute(sql, (album_id,)).fetchone()
     if not row:
         return None
+    return _plex_part_folder(row[0])
+
 
-    raw_path = row[0]
+def _plex_part_folder(raw_path: str) -> Path:
+    """Album folder for a Plex media_parts.file path (host-mapped when PATH_MAP covers it)."""
     # Try to map to host path, fallback to container path if mapping missing
     host_loc = container_to_host(raw_path)
     if host_loc is None:
@@ -28684,6 +29753,160 @@ def first_part_path(db_conn, album_id: int) -> Optional[Path]:
     return host_loc.parent
 
 
+_ALBUM_BUNDLE_SQL = """
+      SELECT p.title, tr.title, tr."index",
+             {disc_col} AS disc_no,
+             mp.duration, mp.file, mp.id
+      FROM metadata_items p
+      LEFT JOIN metadata_items tr ON tr.parent_id = p.id AND tr.metadata_type = 10
+      LEFT JOIN media_items mi ON mi.metadata_item_id = tr.id
+      LEFT JOIN media_parts mp ON mp.media_item_id = mi.id
+      WHERE p.id = ?
+    """
+_ALBUM_BUNDLE_SQL_WITH_DISC = _ALBUM_BUNDLE_SQL.format(disc_col="tr.parent_index")
+_ALBUM_BUNDLE_SQL_NO_DISC = _ALBUM_BUNDLE_SQL.format(disc_col="NULL")
+
+
+# album_id -> (title, tracks, folder), filled by _build_scan_plan in Plex mode and consumed by the
+# scan workers. Own lock: workers pop one album at a time and must not queue on the global `lock`.
+_plex_album_bundles: dict[int, tuple[str, List[Track], Optional[Path]]] = {}
+_plex_album_bundles_lock = threading.Lock()
+
+
+def _clear_plex_album_bundles() -> None:
+    with _plex_album_bundles_lock:
+        _plex_album_bundles.clear()
+
+
+def album_title_tracks_folder(db_conn, album_id: int) -> tuple[str, List[Track], Optional[Path]]:
+    """
+    One-query equivalent of (album_title, get_tracks, first_part_path) for the Plex scan loop.
+    The title is returned even when the album has no playable tracks.
+    """
+    with _plex_album_bundles_lock:
+        prefetched = _plex_album_bundles.pop(album_id, None)
+    if prefetched is not None:
+        return prefetched
+    sql = _ALBUM_BUNDLE_SQL_WITH_DISC if _plex_has_parent_index(db_conn) else _ALBUM_BUNDLE_SQL_NO_DISC
+    rows = db_conn.execute(sql, (album_id,)).fetchall()
+    if not rows:
+        return "", [], None
+    return _album_bundle_from_rows(rows)
+
+
+def _album_bundle_from_rows(rows) -> tuple[str, List[Track], Optional[Path]]:
+    """Build (title, tracks, folder) from _ALBUM_BUNDLE_SQL-shaped rows of a single album."""
+    title = rows[0][0] or ""
+    tracks: List[Track] = []
+    folder: Optional[Path] = None
+    for _album, t, i, d, dur, raw_path, part_id in rows:
+        if part_id is None:
+            continue
+        tracks.append(Track((t or "").lower().strip(), i or 0, d or 1, dur or 0))
+        if folder is None and raw_path:
+            folder = _plex_part_folder(raw_path)
+    return title, tracks, folder
+
+
+def _prefetch_plex_album_bundles(db_conn, section_ids: list) -> dict[int, tuple[str, List[Track], Optional[Path]]]:
+    """
+    Stream title/tracks/first part path for every album of the given sections in one query,
+    so scan workers don't issue a bundle query per album.
+
+    This pull touches every track row, so it first runs with sqlite3's built-in UTF-8
+    decoder instead of plex_connect()'s Python surrogate-escape callback per TEXT cell;
+    only a library with non-UTF-8 bytes pays for a second, surrogate-escape pass.
+    """
+    text_factory = db_conn.text_factory
+    db_conn.text_factory = str
+    try:
+        return _stream_plex_album_bundles(db_conn, section_ids)
+    except sqlite3.OperationalError as e:
+        if "decode" not in str(e).lower():
+            raise
+        logging.debug("Plex album prefetch: non-UTF-8 text, retrying with surrogate-escape decoding")
+    finally:
+        db_conn.text_factory = text_factory
+    return _stream_plex_album_bundles(db_conn, section_ids)
+
+
+def _stream_plex_album_bundles(db_conn, section_ids: list) -> dict[int, tuple[str, List[Track], Optional[Path]]]:
+    disc_col = "tr.parent_index" if _plex_has_parent_index(db_conn) else "NULL"
+    placeholders = ",".join("?" for _ in section_ids)
+    cur = db_conn.execute(
+        f"""
+        SELECT alb.id, alb.title, tr.title, tr."index",
+               {disc_col} AS disc_no,
+               mp.duration, mp.file, mp.id
+        FROM metadata_items alb
+        LEFT JOIN metadata_items tr ON tr.parent_id = alb.id AND tr.metadata_type = 10
+        LEFT JOIN media_items mi ON mi.metadata_item_id = tr.id
+        LEFT JOIN media_parts mp ON mp.media_item_id = mi.id
+        WHERE alb.metadata_type = 9
+          AND alb.parent_id IN (
+            SELECT id FROM metadata_items
+            WHERE metadata_type = 8 AND library_section_id IN ({placeholders})
+          )
+        ORDER BY alb.id
+        """,
+        list(section_ids),
+    )
+    bundles: dict[int, tuple[str, List[Track], Optional[Path]]] = {}
+    pending_id = None
+    pending_rows: list = []
+    while True:
+        chunk = cur.fetchmany(10_000)
+        if not chunk:
+            break
+        for album_id, rows in itertools.groupby(chunk, key=lambda r: r[0]):
+            rows = [r[1:] for r in rows]
+            if album_id == pending_id:
+                pending_rows.extend(rows)
+                continue
+            if pending_id is not None:
+                bundles[pending_id] = _album_bundle_from_rows(pending_rows)
+            pending_id, pending_rows = album_id, rows
+    if pending_id is not None:
+        bundles[pending_id] = _album_bundle_from_rows(pending_rows)
+    return bundles
+
+
+def _prefetch_plex_album_bundles_for_ids(db_conn, album_ids) -> None:
+    """
+    Load bundles for *album_ids* not already in _plex_album_bundles with one IN query
+    per 900 ids (e.g. cross-library albums outside the section prefetch), so
+    album_title_tracks_folder() doesn't fall back to one query per album.
+    """
+    with _plex_album_bundles_lock:
+        missing = sorted({int(a) for a in album_ids if a is not None and int(a) not in _plex_album_bundles})
+    if not missing:
+        return
+    disc_col = "tr.parent_index" if _plex_has_parent_index(db_conn) else "NULL"
+    fetched: dict[int, tuple[str, List[Track], Optional[Path]]] = {}
+    for start in range(0, len(missing), 900):
+        chunk = missing[start:start + 900]
+        placeholders = ",".join("?" for _ in chunk)
+        rows = db_conn.execute(
+            f"""
+            SELECT alb.id, alb.title, tr.title, tr."index",
+                   {disc_col} AS disc_no,
+                   mp.duration, mp.file, mp.id
+            FROM metadata_items alb
+            LEFT JOIN metadata_items tr ON tr.parent_id = alb.id AND tr.metadata_type = 10
+            LEFT JOIN media_items mi ON mi.metadata_item_id = tr.id
+            LEFT JOIN media_parts mp ON mp.media_item_id = mi.id
+            WHERE alb.id IN ({placeholders})
+            ORDER BY alb.id
+            """,
+            chunk,
+        ).fetchall()
+        for album_id, album_rows in itertools.groupby(rows, key=lambda r: r[0]):
+            fetched[album_id] = _album_bundle_from_rows([r[1:] for r in album_rows])
+    if fetched:
+        with _plex_album_bundles_lock:
+            _plex_album_bundles.update(fetched)
+
+
 def _album_path_under_dupes(db_conn, album_id: int) -> bool:
     """Return True if the album's path is under DUPE_ROOT (already moved). Used to skip library-only groups that were already deduped."""
     sql = """
@@ -28990,7 +30213,7 @@ def _extract_embedded_artworks_from_folder(
     try:
         checked = 0
         for p in sorted(folder.rglob("*")):
-            if not AUDIO_RE.search(p.name):
+            if not _is_audio_name(p.name):
                 continue
             artworks = _extract_embedded_artworks_from_audio(p, max_items=max_items)
             for raw, mime, slot, desc in artworks:
@@ -29458,33 +30681,75 @@ def _cover_ocr_best_match_score(local_context: dict | None, candidate_value: str
         best = max(best, _provider_identity_text_score(raw_value, text_blob))
     return float(max(0.0, min(1.0, best)))
 
+_VORBIS_COMMENT_EXTS = {".flac", ".ogg", ".oga", ".opus"}
+# Keys ffmpeg renames when it demuxes Vorbis comments (ff_vorbiscomment_metadata_conv).
+_VORBIS_TO_FFMPEG_KEYS = {
+    "albumartist": "album_artist",
+    "tracknumber": "track",
+    "discnumber": "disc",
+    "description": "comment",
+}
+
+
+def _vorbis_comment_tags(audio_path: Path) -> dict[str, str] | None:
+    """
+    Read Vorbis-comment tags (FLAC/Ogg/Opus) in-process with mutagen, shaped like
+    extract_tags' ffprobe output (lower-case keys, ffmpeg key names, repeated keys
+    joined with ';', format duration). Returns None when ffprobe should be used instead.
+    """
+    if str(audio_path.suffix or "").lower() not in _VORBIS_COMMENT_EXTS:
+        return None
+    try:
+        from mutagen import File as MutagenFile
+
+        audio = MutagenFile(str(audio_path))
+    except Exception:
+        return None
+    if audio is None:
+        return None
+    tags: dict[str, str] = {}
+    for raw_key, raw_val in list(audio.tags or []):
+        key = str(raw_key or "").strip().lower()
+        key = _VORBIS_TO_FFMPEG_KEYS.get(key, key)
+        val = str(raw_val or "").strip()
+        if not key:
+            continue
+        tags[key] = f"{tags[key]};{val}" if tags.get(key) else val
+    length = float(getattr(getattr(audio, "info", None), "length", 0.0) or 0.0)
+    if length > 0:
+        tags["duration"] = f"{length:.6f}"
+    return tags
+
+
 def extract_tags(audio_path: Path) -> dict[str, str]:
     """
     Return *all* container‑level metadata tags for the given audio file
     (FLAC/MP3/M4A/…).
 
-    Uses ffprobe so no external Python deps are required.
+    Vorbis-comment files are read in-process with mutagen; other formats use ffprobe.
     """
     try:
-        out = subprocess.check_output(
-            [
-                "ffprobe", "-v", "error",
-                "-show_entries", "format_tags:format=duration",
-                "-of", "default=noprint_wrappers=1",
-                str(audio_path)
-            ],
-            stderr=subprocess.DEVNULL,
-            text=True,
-            timeout=10
-        )
-        tags = {}
-        for line in out.splitlines():
-            if "=" in line:
-                k, v = line.split("=", 1)
-                # ffprobe returns TAG:KEY=VAL sometimes – strip the prefix
-                if k.startswith("TAG:"):
-                    k = k[4:]
-                tags[k.lower()] = v.strip()
+        tags = _vorbis_comment_tags(audio_path)
+        if tags is None:
+            out = subprocess.check_output(
+                [
+                    "ffprobe", "-v", "error",
+                    "-show_entries", "format_tags:format=duration",
+                    "-of", "default=noprint_wrappers=1",
+                    str(audio_path)
+                ],
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=10
+            )
+            tags = {}
+            for line in out.splitlines():
+                if "=" in line:
+                    k, v = line.split("=", 1)
+                    # ffprobe returns TAG:KEY=VAL sometimes – strip the prefix
+                    if k.startswith("TAG:"):
+                        k = k[4:]
+                    tags[k.lower()] = v.strip()
         duration_sec = _parse_duration_seconds_loose(tags.get("duration"), 0.0)
         if duration_sec <= 0:
             duration_sec = float(_run_ffprobe_duration_sec(str(audio_path)) or 0)
@@ -29643,7 +30908,7 @@ def _iter_audio_files_under_roots(
 ) -> list[Path]:
     """
     Return a list of audio files under the given filesystem roots.
-    This helper is backend‑agnostic and only cares about AUDIO_RE matches.
+    This helper is backend‑agnostic and only cares about _is_audio_name matches.
     """
     roots_list = [str(r) for r in (roots or []) if r]
     roots_total = len(roots_list)
@@ -29760,7 +31025,7 @@ def _iter_audio_files_under_roots(
                         try:
                             if entry.is_dir(follow_symlinks=False):
                                 stack.append(entry.path)
-                            elif entry.is_file(follow_symlinks=False) and AUDIO_RE.search(entry.name):
+                            elif entry.is_file(follow_symlinks=False) and _is_audio_name(entry.name):
                                 local_out.append(Path(entry.path))
                                 root_audio_found += 1
                                 pending_files += 1
@@ -29890,7 +31155,7 @@ def _group_audio_files_by_folder_under_roots(
                         try:
                             if entry.is_dir(follow_symlinks=False):
                                 stack.append(entry.path)
-                            elif entry.is_file(follow_symlinks=False) and AUDIO_RE.search(entry.name):
+                            elif entry.is_file(follow_symlinks=False) and _is_audio_name(entry.name):
                                 p = Path(entry.path)
                                 sp = str(p)
                                 if sp in seen_paths:
@@ -30083,7 +31348,7 @@ def _iter_audio_files_under_roots_checkpointed(
                     for entry in it:
                         try:
                             is_dir = bool(entry.is_dir(follow_symlinks=False))
-                            is_audio = bool(not is_dir and entry.is_file(follow_symlinks=False) and AUDIO_RE.search(entry.name))
+                            is_audio = bool(not is_dir and entry.is_file(follow_symlinks=False) and _is_audio_name(entry.name))
                             items.append(
                                 {
                                     "path": str(entry.path),
@@ -30275,8 +31540,71 @@ def _run_ffprobe(fpath: str) -> tuple[int, int, int]:
     return (br, sr, bd)
 
 
+# Containers whose bits_per_sample describes real PCM depth. Lossy codecs report
+# a nominal 16-bit decoder depth in mutagen that ffprobe never exposes, so we ignore it.
+_MUTAGEN_DEPTH_EXTS = {"flac", "wav", "aif", "aiff", "aifc", "ape", "wv", "dsf", "alac"}
+
+
+def _read_audio_info_mutagen(fpath: str) -> tuple[int, int, int]:
+    """
+    Read (bit_rate, sample_rate, bit_depth) from the audio headers in-process.
+    Returns (0, 0, 0) when mutagen cannot parse the file so callers can fall back to ffprobe.
+    """
+    try:
+        from mutagen import File as MutagenFile
+
+        mf = MutagenFile(fpath)
+    except Exception:
+        return (0, 0, 0)
+    info = getattr(mf, "info", None)
+    if info is None:
+        return (0, 0, 0)
+    try:
+        br = int(getattr(info, "bitrate", 0) or 0)
+        sr = int(getattr(info, "sample_rate", 0) or 0)
+        bd = 0
+        ext = os.path.splitext(fpath)[1][1:].lower()
+        codec = str(getattr(info, "codec", "") or "").lower()
+        if ext in _MUTAGEN_DEPTH_EXTS or codec.startswith("alac"):
+            bd = int(getattr(info, "bits_per_sample", 0) or 0)
+    except (TypeError, ValueError):
+        return (0, 0, 0)
+    return (max(0, br), max(0, sr), max(0, bd))
+
+
+def _probe_audio_info(fpath: str) -> tuple[int, int, int]:
+    """
+    Return (bit_rate, sample_rate, bit_depth) for one file.
+    Header parsing via mutagen avoids a fork/exec per file; ffprobe is only spawned
+    for files mutagen cannot read (or reports nothing for).
+    """
+    br, sr, bd = _read_audio_info_mutagen(fpath)
+    if sr and (br or bd):
+        return (br, sr, bd)
+    return _run_ffprobe(fpath)
+
+
+def _read_audio_duration_mutagen(fpath: str) -> int:
+    """Duration (seconds) from the audio headers in-process; 0 when mutagen cannot tell."""
+    try:
+        from mutagen import File as MutagenFile
+
+        mf = MutagenFile(fpath)
+        length = float(getattr(getattr(mf, "info", None), "length", 0.0) or 0.0)
+    except Exception:
+        return 0
+    return int(max(1.0, round(length))) if length > 0 else 0
+
+
 def _run_ffprobe_duration_sec(fpath: str) -> int:
-    """Return media duration (seconds) via ffprobe. Best-effort; returns 0 on failure."""
+    """
+    Return media duration (seconds). Best-effort; returns 0 on failure.
+    Like _probe_audio_info, headers are read in-process first and ffprobe is only
+    spawned for files mutagen cannot parse.
+    """
+    parsed = _read_audio_duration_mutagen(fpath)
+    if parsed > 0:
+        return parsed
     cmd = [
         "ffprobe", "-v", "error",
         "-show_entries", "format=duration",
@@ -30285,27 +31613,37 @@ def _run_ffprobe_duration_sec(fpath: str) -> int:
     ]
     try:
         out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, text=True, timeout=20).strip()
-        if not out:
-            raise RuntimeError("ffprobe returned empty duration")
-        parsed = int(max(0.0, float(out)))
-        if parsed > 0:
-            return parsed
-        raise RuntimeError("ffprobe returned non-positive duration")
+        return int(max(0.0, float(out))) if out else 0
     except Exception:
-        # Fallback: mutagen parser is slower than ffprobe but still in-process and
-        # significantly better than keeping 0:00 durations forever.
+        return 0
+
+def _list_audio_files(folder: Path) -> list[Path]:
+    """
+    Return audio files under *folder* (recursive) using a single os.scandir walk.
+    Files of a directory come before its sub-directories, like Path.rglob("*").
+    """
+    out: list[Path] = []
+    stack = [str(folder)]
+    while stack:
+        current = stack.pop()
+        subdirs: list[str] = []
         try:
-            from mutagen import File as MutagenFile
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif _is_audio_name(entry.name) and entry.is_file():
+                            out.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+    return out
 
-            mf = MutagenFile(fpath)
-            length = float(getattr(getattr(mf, "info", None), "length", 0.0) or 0.0)
-            if length > 0:
-                return int(max(1.0, round(length)))
-        except Exception:
-            pass
-        return 0
 
-def analyse_format(folder: Path) -> tuple[int, int, int, int, bool]:
+def analyse_format(folder: Path, audio_files: list[Path] | None = None) -> tuple[int, int, int, int, bool]:
     """
     Inspect up to **three** audio files inside *folder* and return a 4‑tuple:
 
@@ -30324,7 +31662,7 @@ def analyse_format(folder: Path) -> tuple[int, int, int, int, bool]:
     We now:
 
     1. Collect *all* audio files under the folder (breadth‑first, glob pattern
-       from `AUDIO_RE`).
+       from `_AUDIO_EXTS`).
     2. Probe **up to three distinct files** or **two attempts per file** (cache +
        fresh call) until we obtain at least one non‑zero technical metric.
     3. Only if **every attempt** yields `(0, 0, 0)` do we fall back to the
@@ -30333,64 +31671,100 @@ def analyse_format(folder: Path) -> tuple[int, int, int, int, bool]:
     Each `(path, mtime)` result – even the all‑zero case – is cached so we
     never hammer ffprobe, but a later scan still re‑probes if the file changes.
     
-    Non-cached ffprobe calls are now processed in parallel using a thread pool.
+    Non-cached probes are processed in parallel using a thread pool. Each probe
+    reads the headers in-process with mutagen and only spawns ffprobe for files
+    mutagen cannot parse.
+
+    Callers that already listed the folder can pass *audio_files* to skip the walk.
     """
-    audio_files = [p for p in folder.rglob("*") if AUDIO_RE.search(p.name)]
+    if audio_files is None:
+        audio_files = _list_audio_files(folder)
     if not audio_files:
         return (0, 0, 0, 0, False)
 
-    # First pass: check cache for all files (unless global scan setting disables cache usage)
+    # First pass: one batched cache lookup for the candidate files (unless global scan
+    # setting disables cache usage)
     use_cache = not getattr(sys.modules[__name__], "SCAN_DISABLE_CACHE", False)
+    candidates = []
+    for audio_file in audio_files:
+        try:
+            mtime = int(audio_file.stat().st_mtime)
+        except OSError:
+            continue  # stale entry in a caller-supplied list
+        candidates.append((audio_file, audio_file.suffix[1:].lower(), str(audio_file), mtime))
+        if len(candidates) >= 3:
+            break
+    # Folder signature: audio file count, the folder's own mtime (bumped when entries are
+    # added/removed/renamed) and the candidates' mtimes. Cheap: no extra per-file stat.
+    folder_key = str(folder)
+    try:
+        folder_mtime = int(os.stat(folder_key).st_mtime_ns)
+    except OSError:
+        folder_mtime = 0
+    folder_sig = f"{len(audio_files)}:{folder_mtime}:" + ",".join(str(c[3]) for c in candidates)
+    if use_cache:
+        cached_folder = get_cached_folder_info(folder_key, folder_sig)
+        if cached_folder:
+            ext, br, sr, bd = cached_folder
+            return (score_format(ext), br, sr, bd, True)  # True = cache hit
+
+    def _remember(ext: str, br: int, sr: int, bd: int) -> None:
+        try:
+            set_cached_folder_info(folder_key, folder_sig, ext, br, sr, bd, len(audio_files))
+        except sqlite3.Error:
+            logging.debug("audio_folder_cache write failed for %s", folder_key, exc_info=True)
+
+    cached_by_path = get_cached_info_many([(fpath, mtime) for _f, _e, fpath, mtime in candidates]) if use_cache else {}
     files_to_probe = []
-    for audio_file in audio_files[:3]:
-        ext   = audio_file.suffix[1:].lower()
-        fpath = str(audio_file)
-        mtime = int(audio_file.stat().st_mtime)
-
-        # Check cache first (when enabled)
-        if use_cache:
-            cached = get_cached_info(fpath, mtime)
-            if cached and not (cached == (0, 0, 0) and ext == "flac"):
-                br, sr, bd = cached
-                if br or sr or bd:
-                    # Track cache hit (will be aggregated in scan_duplicates)
-                    return (score_format(ext), br, sr, bd, True)  # True = cache hit
+    for audio_file, ext, fpath, mtime in candidates:
+        cached = cached_by_path.get(fpath)
+        if cached and not (cached == (0, 0, 0) and ext == "flac"):
+            br, sr, bd = cached
+            if br or sr or bd:
+                _remember(ext, br, sr, bd)
+                # Track cache hit (will be aggregated in scan_duplicates)
+                return (score_format(ext), br, sr, bd, True)  # True = cache hit
         
         # File not in cache or cache miss, add to probe list
         files_to_probe.append((audio_file, ext, fpath, mtime))
     
-    # Second pass: probe files in parallel if pool is enabled
-    if files_to_probe and FFPROBE_POOL_SIZE > 1:
-        futures = {}
-        pool = get_ffprobe_pool()
-        
-        for audio_file, ext, fpath, mtime in files_to_probe:
-            future = pool.submit(_run_ffprobe, fpath)
-            futures[future] = (audio_file, ext, fpath, mtime)
-        
-        # Wait for results (with timeout per file)
-        for future in as_completed(futures):
-            audio_file, ext, fpath, mtime = futures[future]
-            try:
-                br, sr, bd = future.result(timeout=15)  # Slightly longer timeout for pool
-            except Exception:
-                br, sr, bd = 0, 0, 0
-            
-            # Cache the result
-            set_cached_info(fpath, mtime, br, sr, bd)
-            
-            if br or sr or bd:  # success on this file → done
-                return (score_format(ext), br, sr, bd, False)  # False = cache miss
-    else:
-        # Sequential processing (fallback or pool disabled)
-        for audio_file, ext, fpath, mtime in files_to_probe:
-            br, sr, bd = _run_ffprobe(fpath)
+    # Probe results are written back in one transaction when we leave this block
+    cache_rows: list[tuple[str, int, int, int, int, bytes | None]] = []
+    try:
+        # Second pass: probe files in parallel if pool is enabled
+        if files_to_probe and FFPROBE_POOL_SIZE > 1:
+            futures = {}
+            pool = get_ffprobe_pool()
             
-            # Cache the result
-            set_cached_info(fpath, mtime, br, sr, bd)
+            for audio_file, ext, fpath, mtime in files_to_probe:
+                future = pool.submit(_probe_audio_info, fpath)
+                futures[future] = (audio_file, ext, fpath, mtime)
             
-            if br or sr or bd:  # success on this file → done
-                return (score_format(ext), br, sr, bd, False)  # False = cache miss
+            # Wait for results (with timeout per file)
+            for future in as_completed(futures):
+                audio_file, ext, fpath, mtime = futures[future]
+                try:
+                    br, sr, bd = future.result(timeout=15)  # Slightly longer timeout for pool
+                except Exception:
+                    br, sr, bd = 0, 0, 0
+                
+                cache_rows.append((fpath, mtime, br, sr, bd, _file_head_hash(fpath)))
+                
+                if br or sr or bd:  # success on this file → done
+                    _remember(ext, br, sr, bd)
+                    return (score_format(ext), br, sr, bd, False)  # False = cache miss
+        else:
+            # Sequential processing (fallback or pool disabled)
+            for audio_file, ext, fpath, mtime in files_to_probe:
+                br, sr, bd = _probe_audio_info(fpath)
+                
+                cache_rows.append((fpath, mtime, br, sr, bd, _file_head_hash(fpath)))
+                
+                if br or sr or bd:  # success on this file → done
+                    _remember(ext, br, sr, bd)
+                    return (score_format(ext), br, sr, bd, False)  # False = cache miss
+    finally:
+        set_cached_info_many(cache_rows)
 
     # After probing up to 3 files and still nothing usable → treat as invalid
     if audio_files:
@@ -30400,19 +31774,41 @@ def analyse_format(folder: Path) -> tuple[int, int, int, int, bool]:
 
 # ───────────────────────────────── DUPLICATE DETECTION ─────────────────────────────────
 def signature(tracks: List[Track]) -> tuple:
-    # round durations to seconds before grouping
-    return tuple(sorted((
-        t.disc,
-        t.idx,
-        _dupe_norm_track_title(getattr(t, "title", "") or "") or _norm_track_title_strict(getattr(t, "title", "") or ""),
-        int(round(t.dur/1000))
-    ) for t in tracks))
+    return summarize_tracks(tracks)[0]
+
+
+def summarize_tracks(tracks: List[Track]) -> tuple[tuple, set, int]:
+    """
+    Single pass over *tracks* returning (signature, discs, total_duration_ms)
+    for building scan editions.
+    """
+    items = []
+    discs: set = set()
+    total_dur = 0
+    for t in tracks:
+        title = getattr(t, "title", "") or ""
+        discs.add(t.disc)
+        total_dur += t.dur
+        # round durations to seconds before grouping
+        items.append((
+            t.disc,
+            t.idx,
+            _dupe_norm_track_title(title) or _norm_track_title_strict(title),
+            int(round(t.dur/1000))
+        ))
+    items.sort()
+    return tuple(items), discs, total_dur
 
 def overlap(a: set, b: set) -> float:
     return len(a & b) / max(len(a), len(b))
 
+@lru_cache(maxsize=65536)
 def _dupe_norm_track_title(s: str) -> str:
-    """Normalize a track title for dupe similarity (robust to tags/filename noise)."""
+    """
+    Normalize a track title for dupe similarity (robust to tags/filename noise).
+    Memoized: summarize_tracks and _dupe_track_title_set both normalize every track,
+    and the same titles recur across the editions of an album.
+    """
     cleaned = _clean_track_title_from_text(str(s or ""), 1)
     raw = (cleaned or s or "").strip().lower()
     if not raw:
@@ -30462,7 +31858,7 @@ def _dupe_jaccard(a: set[str], b: set[str]) -> float:
     if not a or not b:
         return 0.0
     inter = len(a & b)
-    union = len(a | b)
+    union = len(a) + len(b) - inter  # |A∪B| without building the union set
     return (float(inter) / float(union)) if union else 0.0
 
 
@@ -30488,6 +31884,28 @@ def _dupe_track_count_ratio(a_tracks: list, b_tracks: list) -> float:
     return float(min(a_n, b_n)) / float(max(a_n, b_n))
 
 
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _pack_merge_list(merge_list) -> str:
+    """Serialize a merge_list column value; the (common) empty list skips the encoder."""
+    items = list(merge_list or [])
+    if not items:
+        return "[]"
+    return _COMPACT_JSON_ENCODER.encode(items)
+
+
+def _unpack_merge_list(raw) -> list:
+    """Inverse of _pack_merge_list; tolerant of NULL/legacy values."""
+    if not raw or raw == "[]":
+        return []
+    try:
+        value = json.loads(raw)
+    except (TypeError, ValueError):
+        return []
+    return value if isinstance(value, list) else []
+
+
 def _dupe_folder_key_str(folder) -> str:
     """Stable-ish folder identity for caching/feedback (prefer resolved absolute path)."""
     if not folder:
@@ -30510,6 +31928,27 @@ def _dupe_group_key_from_editions(editions: list[dict]) -> str:
     return hashlib.sha1(payload.encode("utf-8", errors="ignore")).hexdigest()
 
 
+def _dupe_edition_fingerprint(edition: dict) -> str:
+    """Folder-independent identity of one edition: track signature + audio quality."""
+    e = edition or {}
+    sig = e.get("sig") or ()
+    if not sig:
+        return ""
+    payload = repr((tuple(sig), int(e.get("br") or 0), int(e.get("sr") or 0), int(e.get("bd") or 0), int(e.get("fmt_score") or 0)))
+    return hashlib.blake2b(payload.encode("utf-8", errors="ignore"), digest_size=8).hexdigest()
+
+
+def _dupe_edition_hash_from_editions(editions: list[dict]) -> str:
+    """
+    Folder-independent key for an edition set, so cached AI picks survive moves/renames and
+    library renumbering. Empty when any edition has no track signature.
+    """
+    fps = [_dupe_edition_fingerprint(e) for e in editions or []]
+    if len(fps) < 2 or not all(fps):
+        return ""
+    return hashlib.blake2b(("\n".join(sorted(fps))).encode("ascii"), digest_size=8).hexdigest()
+
+
 def _dupe_feedback_pair_key(folder_a: str, folder_b: str) -> tuple[str, str]:
     a = (folder_a or "").strip()
     b = (folder_b or "").strip()
@@ -30527,14 +31966,11 @@ def _dupe_load_feedback_pairs_for_artist(artist: str) -> dict[tuple[str, str], s
     if not artist_name:
         return out
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
-        cur = con.cursor()
-        cur.execute(
-            "SELECT folder_a, folder_b, label FROM dupe_feedback_pairs WHERE artist = ?",
-            (artist_name,),
-        )
-        rows = cur.fetchall()
-        con.close()
+        with STATE_POOL.acquire() as con:
+            rows = con.execute(
+                "SELECT folder_a, folder_b, label FROM dupe_feedback_pairs WHERE artist = ?",
+                (artist_name,),
+            ).fetchall()
     except Exception:
         return out
     for fa, fb, lab in rows or []:
@@ -30549,33 +31985,34 @@ def _dupe_load_feedback_pairs_for_artist(artist: str) -> dict[tuple[str, str], s
     return out
 
 
-def _dupe_ai_cache_get(artist: str, group_key: str) -> Optional[dict]:
-    if not artist or not group_key:
+def _dupe_ai_cache_get(artist: str, group_key: str, edition_hash: str = "") -> Optional[dict]:
+    """Cached AI pick for a group: exact folder-set match first, else same edition_hash."""
+    if not artist or not (group_key or edition_hash):
         return None
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
-        cur = con.cursor()
-        cur.execute(
-            """
-            SELECT best_folder, rationale, merge_list, ai_provider, ai_model, confidence
-            FROM dupe_ai_cache
-            WHERE artist = ? AND group_key = ?
-            """,
-            ((artist or "").strip(), (group_key or "").strip()),
-        )
-        row = cur.fetchone()
-        con.close()
+        with STATE_POOL.acquire() as con:
+            row = con.execute(
+                """
+                SELECT best_folder, rationale, merge_list, ai_provider, ai_model, confidence, best_edition_fp
+                FROM dupe_ai_cache
+                WHERE artist = ? AND (group_key = ? OR (? != '' AND edition_hash = ?))
+                ORDER BY (group_key = ?) DESC, updated_at DESC
+                LIMIT 1
+                """,
+                (
+                    (artist or "").strip(),
+                    (group_key or "").strip(),
+                    (edition_hash or "").strip(),
+                    (edition_hash or "").strip(),
+                    (group_key or "").strip(),
+                ),
+            ).fetchone()
     except Exception:
         return None
     if not row:
         return None
-    best_folder, rationale, merge_list_json, provider, model, confidence = row
-    try:
-        merge_list = json.loads(merge_list_json) if merge_list_json else []
-        if not isinstance(merge_list, list):
-            merge_list = []
-    except Exception:
-        merge_list = []
+    best_folder, rationale, merge_list_json, provider, model, confidence, best_edition_fp = row
+    merge_list = _unpack_merge_list(merge_list_json)
     conf = None
     try:
         if confidence is not None:
@@ -30589,6 +32026,7 @@ def _dupe_ai_cache_get(artist: str, group_key: str) -> Optional[dict]:
         "ai_provider": (provider or "").strip(),
         "ai_model": (model or "").strip(),
         "confidence": conf,
+        "best_edition_fp": (best_edition_fp or "").strip(),
     }
 
 
@@ -30602,42 +32040,47 @@ def _dupe_ai_cache_put(
     ai_provider: str,
     ai_model: str,
     confidence: int | None,
+    edition_hash: str = "",
+    best_edition_fp: str = "",
 ) -> None:
     if not artist or not group_key:
         return
     now = time.time()
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
-        cur = con.cursor()
-        cur.execute(
-            """
-            INSERT INTO dupe_ai_cache
-              (artist, group_key, best_folder, rationale, merge_list, ai_provider, ai_model, confidence, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(artist, group_key) DO UPDATE SET
-              best_folder = excluded.best_folder,
-              rationale   = excluded.rationale,
-              merge_list  = excluded.merge_list,
-              ai_provider = excluded.ai_provider,
-              ai_model    = excluded.ai_model,
-              confidence  = excluded.confidence,
-              updated_at  = excluded.updated_at
-            """,
-            (
-                (artist or "").strip(),
-                (group_key or "").strip(),
-                (best_folder or "").strip(),
-                (rationale or "").strip(),
-                json.dumps(list(merge_list or [])),
-                (ai_provider or "").strip(),
-                (ai_model or "").strip(),
-                int(confidence) if confidence is not None else None,
-                now,
-                now,
-            ),
-        )
-        con.commit()
-        con.close()
+        with STATE_POOL.acquire() as con:
+            con.execute(
+                """
+                INSERT INTO dupe_ai_cache
+                  (artist, group_key, best_folder, rationale, merge_list, ai_provider, ai_model, confidence,
+                   created_at, updated_at, edition_hash, best_edition_fp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(artist, group_key) DO UPDATE SET
+                  best_folder = excluded.best_folder,
+                  rationale   = excluded.rationale,
+                  merge_list  = excluded.merge_list,
+                  ai_provider = excluded.ai_provider,
+                  ai_model    = excluded.ai_model,
+                  confidence  = excluded.confidence,
+                  updated_at  = excluded.updated_at,
+                  edition_hash = excluded.edition_hash,
+                  best_edition_fp = excluded.best_edition_fp
+                """,
+                (
+                    (artist or "").strip(),
+                    (group_key or "").strip(),
+                    (best_folder or "").strip(),
+                    (rationale or "").strip(),
+                    _pack_merge_list(merge_list),
+                    (ai_provider or "").strip(),
+                    (ai_model or "").strip(),
+                    int(confidence) if confidence is not None else None,
+                    now,
+                    now,
+                    (edition_hash or "").strip() or None,
+                    (best_edition_fp or "").strip() or None,
+                ),
+            )
+            con.commit()
     except Exception:
         # Cache failures must never break the scan.
         return
@@ -30930,13 +32373,13 @@ def _dupe_audio_fp_set_for_edition(e: dict, *, max_tracks: int = 12) -> set[str]
                     pp = path_for_fs_access(Path(p))
                 except Exception:
                     pp = Path(p)
-                if pp and pp.is_file() and AUDIO_RE.search(pp.name):
+                if pp and pp.is_file() and _is_audio_name(pp.name):
                     paths.append(pp)
     except Exception:
         paths = []
     if not paths:
         try:
-            paths = sorted([p for p in folder_path.rglob("*") if p.is_file() and AUDIO_RE.search(p.name)], key=lambda p: str(p))[: max(1, int(max_tracks or 12))]
+            paths = sorted([p for p in folder_path.rglob("*") if p.is_file() and _is_audio_name(p.name)], key=lambda p: str(p))[: max(1, int(max_tracks or 12))]
         except Exception:
             paths = []
 
@@ -31002,14 +32445,14 @@ def _dupe_audio_sig_for_edition(
                     pp = path_for_fs_access(Path(p))
                 except Exception:
                     pp = Path(p)
-                if pp and pp.is_file() and AUDIO_RE.search(pp.name):
+                if pp and pp.is_file() and _is_audio_name(pp.name):
                     paths.append(pp)
     except Exception:
         paths = []
     if not paths:
         try:
             paths = sorted(
-                [p for p in folder_path.rglob("*") if p.is_file() and AUDIO_RE.search(p.name)],
+                [p for p in folder_path.rglob("*") if p.is_file() and _is_audio_name(p.name)],
                 key=lambda p: str(p),
             )
         except Exception:
@@ -31056,6 +32499,55 @@ def _dupe_audio_sig_for_edition(
     return sig
 
 
+DUPE_FUZZY_TITLE_MIN_SCORE = 90
+_DUPE_FUZZY_TITLE_MAX_KEYS = 2000
+
+
+def _dupe_fuzzy_title_clusters(editions: list[dict]) -> list[list[dict]]:
+    """
+    Cluster editions whose loose title keys differ but are near-identical
+    (rapidfuzz token_set_ratio >= DUPE_FUZZY_TITLE_MIN_SCORE), via union-find over
+    pairwise key matches. Returns [] when rapidfuzz is not installed.
+    """
+    if rapidfuzz_process is None or rapidfuzz_fuzz is None or len(editions) < 2:
+        return []
+    by_key: dict[str, list[dict]] = defaultdict(list)
+    for e in editions:
+        key = (e.get("_dupe_title_norm_loose") or "").strip() or (e.get("album_norm") or "").strip()
+        if key and not key.startswith("__untitled__"):
+            by_key[key].append(e)
+    keys = list(by_key)
+    if len(keys) < 2 or len(keys) > _DUPE_FUZZY_TITLE_MAX_KEYS:
+        return []
+    parent = list(range(len(keys)))
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # process.extract scores one key against all keys in C (cdist would need numpy).
+    for i, key in enumerate(keys):
+        matches = rapidfuzz_process.extract(
+            key,
+            keys,
+            scorer=rapidfuzz_fuzz.token_set_ratio,
+            score_cutoff=DUPE_FUZZY_TITLE_MIN_SCORE,
+            limit=None,
+        )
+        for _choice, _score, j in matches:
+            if j <= i:
+                continue
+            ri, rj = _find(i), _find(j)
+            if ri != rj:
+                parent[rj] = ri
+    components: dict[int, list[dict]] = defaultdict(list)
+    for i, key in enumerate(keys):
+        components[_find(i)].extend(by_key[key])
+    return [c for c in components.values() if len(c) >= 2]
+
+
 def _dupe_split_editions_by_similarity(
     editions: list[dict],
     *,
@@ -31111,6 +32603,13 @@ def _dupe_split_editions_by_similarity(
             ts = _dupe_track_title_set(tr)
             e["_dupe_track_title_set"] = ts
             title_sets.append(ts)
+    title_lens = [len(ts) for ts in title_sets]
+    min_jaccard = float(min_jaccard)
+    min_ratio = float(min_ratio)
+    partial_containment_min = float(partial_containment_min)
+    partial_ratio_max = float(partial_ratio_max)
+    # Lowest Jaccard that can still change the outcome (title match or audio tie-break).
+    jac_floor = min(min_jaccard, 0.55) if allow_audio_fp else min_jaccard
 
     # Pairwise comparisons within this small candidate set only.
     for i in range(n):
@@ -31119,12 +32618,17 @@ def _dupe_split_editions_by_similarity(
             if ratio < 0.55:
                 # Truncated duplicate rescue: strong title containment + very low count ratio.
                 # This catches 1-track/3-track partial copies of full releases.
-                containment = _dupe_track_title_containment(title_sets[i], title_sets[j])
-                if containment >= float(partial_containment_min) and ratio <= float(partial_ratio_max):
-                    union(i, j)
+                if ratio <= partial_ratio_max:
+                    containment = _dupe_track_title_containment(title_sets[i], title_sets[j])
+                    if containment >= partial_containment_min:
+                        union(i, j)
+                continue
+            li, lj = title_lens[i], title_lens[j]
+            if (li or lj) and min(li, lj) / max(li, lj) < jac_floor:
+                # Jaccard is bounded by the set-size ratio: no intersection needed to rule it out.
                 continue
             jac = _dupe_jaccard(title_sets[i], title_sets[j])
-            if jac >= float(min_jaccard) and ratio >= float(min_ratio):
+            if jac >= min_jaccard and ratio >= min_ratio:
                 union(i, j)
                 continue
             # Optional tie-break: if track titles are messy but audio overlaps, keep together.
@@ -31603,7 +33107,7 @@ def _incomplete_album_disk_crosscheck(
             "actual_track_count": 0,
         }
 
-    audio_files = [p for p in folder.rglob("*") if AUDIO_RE.search(p.name)]
+    audio_files = [p for p in folder.rglob("*") if _is_audio_name(p.name)]
     disk_by_index: Dict[int, Path] = {}
     disk_extra: List[str] = []
     tag_album: Optional[str] = None
@@ -32036,7 +33540,7 @@ def _store_acoustid_fingerprints_for_folder(folder: Path, max_tracks: int = 20)
         import acoustid
     except ImportError:
         return 0
-    audio_files = sorted([p for p in folder.rglob("*") if AUDIO_RE.search(p.name)])
+    audio_files = sorted([p for p in folder.rglob("*") if _is_audio_name(p.name)])
     if not audio_files:
         return 0
     stored = 0
@@ -32077,7 +33581,7 @@ def _identify_album_by_acoustic_id(
     except ImportError as ie:
         logging.warning("[AcousticID] pyacoustid not available: %s", ie)
         return (None, False)
-    audio_files = sorted([p for p in folder.rglob("*") if AUDIO_RE.search(p.name)])
+    audio_files = sorted([p for p in folder.rglob("*") if _is_audio_name(p.name)])
     if not audio_files:
         logging.debug("[AcousticID] No audio files in %s", folder)
         return (None, False)
@@ -38701,10 +40205,11 @@ def search_mb_release_group_by_metadata(
     return (None, False)
 
 
-def process_ai_groups_batch(ai_groups: List[dict], max_workers: int = None) -> List[dict]:
+def process_ai_groups_batch(ai_groups: List[dict], max_workers: int = None, track_progress: bool = True) -> List[dict]:
     """
     Process multiple groups requiring AI in parallel using choose_best().
     Returns list of completed group dicts with 'best' and 'losers' set.
+    When track_progress is False, state["scan_ai_batch_processed"] is left untouched.
 
     This function is deliberately tolerant: when AI fails for a group, the error
     is recorded in state["scan_ai_errors"] but the scan continues for other groups.
@@ -38771,11 +40276,12 @@ def process_ai_groups_batch(ai_groups: List[dict], max_workers: int = None) -> L
         for future in as_completed(future_to_group):
             res = future.result()
             processed += 1
-            try:
-                with lock:
-                    state["scan_ai_batch_processed"] = processed
-            except Exception:
-                pass
+            if track_progress:
+                try:
+                    with lock:
+                        state["scan_ai_batch_processed"] = processed
+                except Exception:
+                    pass
             if res:
                 results.append(res)
 
@@ -38929,15 +40435,21 @@ def choose_best(editions: List[dict], defer_ai: bool = False) -> dict | None:
 
     artist = str((editions[0] or {}).get('artist') or '').strip()
     group_key = _dupe_group_key_from_editions(editions)
+    edition_hash = _dupe_edition_hash_from_editions(editions)
 
-    # 1) AI cache reuse.
-    cached = _dupe_ai_cache_get(artist, group_key)
-    if cached and cached.get('best_folder'):
+    # 1) AI cache reuse (same folder set, or same editions after moves/renumbering).
+    cached = _dupe_ai_cache_get(artist, group_key, edition_hash)
+    if cached and (cached.get('best_folder') or cached.get('best_edition_fp')):
         best_folder_key = _dupe_folder_key_str(cached.get('best_folder'))
         best_cached = next(
             (e for e in editions if _dupe_folder_key_str((e or {}).get('folder')) == best_folder_key),
             None,
         )
+        if best_cached is None and cached.get('best_edition_fp'):
+            best_cached = next(
+                (e for e in editions if _dupe_edition_fingerprint(e) == cached.get('best_edition_fp')),
+                None,
+            )
         if best_cached is not None:
             best_cached['rationale'] = cached.get('rationale') or 'AI cache'
             best_cached['merge_list'] = cached.get('merge_list') or []
@@ -39067,6 +40579,8 @@ def choose_best(editions: List[dict], defer_ai: bool = False) -> dict | None:
                 ai_provider=(AI_PROVIDER or ''),
                 ai_model=(model_display or ''),
                 confidence=ai_confidence,
+                edition_hash=edition_hash,
+                best_edition_fp=_dupe_edition_fingerprint(best),
             )
             return best
         except Exception as e:
@@ -39089,6 +40603,12 @@ def choose_best(editions: List[dict], defer_ai: bool = False) -> dict | None:
     return None
 
 def scan_artist_duplicates(args):
+    """ThreadPool worker: run _scan_artist_duplicates with audio cache writes batched per artist."""
+    with _buffered_audio_cache_writes():
+        return _scan_artist_duplicates(args)
+
+
+def _scan_artist_duplicates(args):
     """
     ThreadPool worker: scan one artist for duplicate albums.
     args: (artist_id, artist_name) or (artist_id, artist_name, album_ids).
@@ -39157,7 +40677,9 @@ def scan_artist_duplicates(args):
                             "step_summary": "Running FFprobe…",
                             "step_response": "",
                         }
-                fmt_score_val, br, sr, bd, audio_cache_hit = analyse_format(folder)
+                # The scan plan already listed this folder's audio files; reuse them instead of walking again.
+                planned_paths = [p if isinstance(p, Path) else Path(str(p)) for p in (fe.get("ordered_paths") or [])]
+                fmt_score_val, br, sr, bd, audio_cache_hit = analyse_format(folder, audio_files=planned_paths or None)
                 tr = fe.get("tracks") or []
                 meta_tags = fe.get("tags") or {}
                 title_raw = _sanitize_album_title_display(fe.get("album_title") or folder.name.replace("_", " "))
@@ -39194,6 +40716,7 @@ def scan_artist_duplicates(args):
                     is_broken = False
                     expected_track_count = None
                     missing_indices = []
+                tr_sig, tr_discs, tr_dur = summarize_tracks(tr)
                 editions_for_artist.append({
                     "album_id": aid,
                     "title_raw": title_raw,
@@ -39203,14 +40726,13 @@ def scan_artist_duplicates(args):
                     "folder": folder,
                     "tracks": tr,
                     "file_count": fe.get("file_count") or len(tr),
-                    "sig": signature(tr),
-                    "titles": {t.title for t in tr},
-                    "dur": sum(t.dur for t in tr),
+                    "sig": tr_sig,
+                    "dur": tr_dur,
                     "fmt_score": fmt_score_val,
                     "br": br,
                     "sr": sr,
                     "bd": bd,
-                    "discs": len({t.disc for t in tr}) if tr else 1,
+                    "discs": len(tr_discs) if tr else 1,
                     "meta": meta_tags,
                     "invalid": False,
                     "title_source": "tag:album",
@@ -39308,6 +40830,7 @@ def scan_artist_duplicates(args):
                         fmt_txt = (alb.get("format") or "").strip().upper()
                         fmt_score_val = score_format(fmt_txt.lower()) if fmt_txt else 0
 
+                        tr_sig, tr_discs, tr_dur = summarize_tracks(tracks)
                         editions_for_artist.append(
                             {
                                 "album_id": next_ctx_id,
@@ -39318,14 +40841,13 @@ def scan_artist_duplicates(args):
                                 "folder": folder_obj,
                                 "tracks": tracks,
                                 "file_count": int(alb.get("track_count") or len(tracks) or 0),
-                                "sig": signature(tracks),
-                                "titles": {t.title for t in tracks},
-                                "dur": sum(t.dur for t in tracks),
+                                "sig": tr_sig,
+                                "dur": tr_dur,
                                 "fmt_score": fmt_score_val,
                                 "br": br_guess,
                                 "sr": sr_guess,
                                 "bd": bd_guess,
-                                "discs": len({t.disc for t in tracks}) if tracks else 1,
+                                "discs": len(tr_discs) if tracks else 1,
                                 "meta": meta_tags,
                                 "invalid": False,
                                 "title_source": "published_cache",
@@ -39358,7 +40880,8 @@ def scan_artist_duplicates(args):
                 except Exception:
                     logging.debug("Files changed-only: failed to add published context editions for artist %s", artist_name, exc_info=True)
         else:
-            db_conn = plex_connect()
+            # Per-worker read connection, reused across the artists this thread scans.
+            db_conn = _plex_read_conn()
 
         if album_ids is None and db_conn is not None:
             logging.debug("[Artist %s (ID %s)] Fetching album IDs from Plex DB", artist_name, artist_id)
@@ -39404,8 +40927,6 @@ def scan_artist_duplicates(args):
             # Merge timing stats
             if "timing" in stats:
                 timing_stats.update(stats["timing"])
-        if db_conn is not None:
-            db_conn.close()
         
         timing_stats["total_time"] = time.perf_counter() - artist_start_time
         stats["timing"] = timing_stats
@@ -39459,6 +40980,10 @@ def scan_duplicates(
                     seen_folders.setdefault(str(folder), []).append(e["album_id"])
         # Continue to MB enrichment and grouping below (skip the Plex for-loop).
     else:
+        try:
+            _prefetch_plex_album_bundles_for_ids(db_conn, album_ids)
+        except sqlite3.Error:
+            logging.debug("[Artist %s] bulk album bundle fetch failed; falling back to per-album queries", artist, exc_info=True)
         for aid in album_ids:
             processed_albums += 1
             PROGRESS_STATE["current"] = processed_albums
@@ -39471,11 +40996,13 @@ def scan_duplicates(
                 while scan_is_paused.is_set() and not scan_should_stop.is_set():
                     time.sleep(0.5)
                 
+                # Title, tracks and first part path in one round-trip
+                plex_title, tr, folder = album_title_tracks_folder(db_conn, aid)
                 # Update current album tracking and albums_processed so UI shows progress during long artist scan
                 with lock:
                     if artist in state.get("scan_active_artists", {}):
                         state["scan_active_artists"][artist]["albums_processed"] = processed_albums
-                        album_title_str = album_title(db_conn, aid) or f"Album {aid}"
+                        album_title_str = plex_title or f"Album {aid}"
                         state["scan_active_artists"][artist]["current_album"] = {
                             "album_id": aid,
                             "album_title": album_title_str,
@@ -39485,7 +41012,6 @@ def scan_duplicates(
                             "step_response": ""
                         }
                 
-                tr = get_tracks(db_conn, aid)
                 if not tr:
                     continue
                 
@@ -39496,7 +41022,6 @@ def scan_duplicates(
                         state["scan_active_artists"][artist]["current_album"]["status_details"] = "analyzing audio format"
                         state["scan_active_artists"][artist]["current_album"]["step_summary"] = "Running FFprobe…"
                 
-                folder = first_part_path(db_conn, aid)
                 if not folder:
                     continue
                 # Skip albums in configured skip folders (path-aware)
@@ -39522,18 +41047,20 @@ def scan_duplicates(
                     skip_count += 1
                     logging.info("Skipping album %s since folder %s matches skip prefixes %s", aid, folder_resolved, SKIP_FOLDERS)
                     continue
-                # count audio files once – we re‑use it later
-                file_count = sum(1 for f in folder.rglob("*") if AUDIO_RE.search(f.name))
+                # list audio files once – count, format probe and tags all re‑use it; the same walk
+                # fills folder_meta (size + primary format) for save_scan_to_db
+                audio_files = _list_audio_files_recording_meta(folder)
+                file_count = len(audio_files)
 
                 # consider edition invalid when technical data are all zero OR no files found
 
                 # ─── audio‑format inspection ──────────────────────────────────────
                 audio_start = time.perf_counter()
-                fmt_score, br, sr, bd, audio_cache_hit = analyse_format(folder)
+                fmt_score, br, sr, bd, audio_cache_hit = analyse_format(folder, audio_files=audio_files)
                 audio_analysis_time += time.perf_counter() - audio_start
 
                 # --- metadata tags (first track only) -----------------------------
-                first_audio = next((p for p in folder.rglob("*") if AUDIO_RE.search(p.name)), None)
+                first_audio = audio_files[0] if audio_files else None
                 meta_tags = extract_tags(first_audio) if first_audio else {}
 
                 # Mark as invalid if file_count == 0 OR all tech data are zero
@@ -39542,13 +41069,15 @@ def scan_duplicates(
                 # --- Quick retry before purging to avoid false negatives -------------
                 if is_invalid:
                     time.sleep(0.5)
-                    fmt_score_retry, br_retry, sr_retry, bd_retry, audio_cache_hit_retry = analyse_format(folder)
-                    file_count_retry = file_count or sum(1 for f in folder.rglob("*") if AUDIO_RE.search(f.name))
+                    # Re-list on retry: a transient mount hiccup may have hidden the files
+                    audio_files_retry = audio_files or _list_audio_files(folder)
+                    fmt_score_retry, br_retry, sr_retry, bd_retry, audio_cache_hit_retry = analyse_format(folder, audio_files=audio_files_retry)
+                    file_count_retry = file_count or len(audio_files_retry)
                     if (file_count_retry == 0) or (br_retry == 0 and sr_retry == 0 and bd_retry == 0):
                         _purge_invalid_edition({
                             "folder":   folder,
                             "artist":   artist,
-                            "title_raw": album_title(db_conn, aid),
+                            "title_raw": plex_title,
                             "album_id": aid
                         })
                         continue            # do NOT add to the editions list
@@ -39556,7 +41085,6 @@ def scan_duplicates(
                         fmt_score, br, sr, bd, audio_cache_hit = fmt_score_retry, br_retry, sr_retry, bd_retry, audio_cache_hit_retry
                         is_invalid = False
 
-                plex_title = album_title(db_conn, aid)
                 title_raw, title_source = derive_album_title(plex_title, meta_tags, folder, aid)
                 normalize_parenthetical = bool(_parse_bool(_get_config_from_db("NORMALIZE_PARENTHETICAL_FOR_DEDUPE") or "true"))
                 album_norm_value = norm_album_for_dedup(title_raw, normalize_parenthetical)
@@ -39580,6 +41108,7 @@ def scan_duplicates(
 
                 # Plex-normalized title: same key as get_duplicate_groups_from_library so scan groups match library
                 plex_norm_value = norm_album_for_dedup(plex_title or "", normalize_parenthetical) if plex_title else album_norm_value
+                tr_sig, tr_discs, tr_dur = summarize_tracks(tr)
                 editions.append({
                     'album_id':  aid,
                     'title_raw': title_raw,
@@ -39589,18 +41118,18 @@ def scan_duplicates(
                     'folder':    folder,
                     'tracks':    tr,
                     'file_count': file_count,
-                    'sig':       signature(tr),
-                    'titles':    {t.title for t in tr},
-                    'dur':       sum(t.dur for t in tr),
+                    'sig':       tr_sig,
+                    'dur':       tr_dur,
                     'fmt_score': fmt_score,
                     'br':        br,
                     'sr':        sr,
                     'bd':        bd,
-                    'discs':     len({t.disc for t in tr}),
+                    'discs':     len(tr_discs),
                     'meta':      meta_tags,
                     'invalid':   False,
                     'title_source': title_source,
                     'plex_title': plex_title or "",
+                    'primary_fmt': first_audio.suffix[1:].upper() if first_audio else get_primary_format(folder),
                     'audio_cache_hit': audio_cache_hit  # Track if this album used cache
                 })
 
@@ -40710,7 +42239,7 @@ def scan_duplicates(
             first_track_tags = None
             try:
                 folder_for_tags = Path(str(e.get("folder") or ""))
-                first_audio = next((p for p in folder_for_tags.rglob("*") if AUDIO_RE.search(p.name)), None)
+                first_audio = next((p for p in folder_for_tags.rglob("*") if _is_audio_name(p.name)), None)
                 if first_audio and first_audio.exists():
                     first_track_tags = extract_tags(first_audio) or {}
             except Exception:
@@ -40853,13 +42382,21 @@ def scan_duplicates(
         d[k] = int(d.get(k) or 0) + int(n or 0)
 
     def _folder_key(e: dict) -> str:
+        # Memoized on the edition: resolve() stats every path component, and the same
+        # edition is checked by several grouping passes.
+        cached = e.get("_dupe_folder_key")
+        if cached is not None:
+            return cached
         folder = e.get("folder")
         if not folder:
-            return ""
-        try:
-            return str(Path(folder).resolve())
-        except Exception:
-            return str(folder)
+            key = ""
+        else:
+            try:
+                key = str(Path(folder).resolve())
+            except Exception:
+                key = str(folder)
+        e["_dupe_folder_key"] = key
+        return key
 
     def _all_same_folder(ed_list: list[dict]) -> bool:
         keys = {_folder_key(e) for e in ed_list if e.get("folder")}
@@ -40952,9 +42489,20 @@ def scan_duplicates(
         if not all(live_flags):
             _dr_inc("rejected_by_reason", "mixed_live_nonlive")
             return True
-        if len(track_sets) >= 2:
+        if len(track_sets) == 2:
+            # Common case (pair): sizes only, no union/intersection sets allocated.
+            a, b = track_sets
+            inter_n = len(a & b) if len(a) <= len(b) else len(b & a)
+            union_n = len(a) + len(b) - inter_n
+            jaccard = (inter_n / union_n) if union_n else 1.0
+        elif len(track_sets) > 2:
+            ordered = sorted(track_sets, key=len)
+            inter = set(ordered[0])
+            for ts in ordered[1:]:
+                if not inter:
+                    break
+                inter.intersection_update(ts)
             union = set().union(*track_sets)
-            inter = set.intersection(*track_sets) if track_sets else set()
             jaccard = (len(inter) / len(union)) if union else 1.0
         else:
             jaccard = 1.0
@@ -41509,6 +43057,17 @@ def scan_duplicates(
                 continue
             _append_group(c, fuzzy=True, signal="title_loose", evidence=[f"TITLE_LOOSE:{key}"])
 
+    # Then near-identical loose titles (typos, punctuation, word order), clustered locally
+    # so fuzzy dupes are found without AI and only ambiguous groups escalate to it.
+    remaining = [e for e in editions if e.get("album_id") not in used_ids]
+    for fuzzy_cluster in _dupe_fuzzy_title_clusters(remaining):
+        clusters = _dupe_split_editions_by_similarity(fuzzy_cluster, min_jaccard=0.82, min_ratio=0.75, allow_audio_fp=True)
+        for c in clusters:
+            if len(c) < 2:
+                continue
+            titles = sorted({str(e.get("_dupe_title_norm_loose") or e.get("album_norm") or "") for e in c})
+            _append_group(c, fuzzy=True, signal="title_fuzzy", evidence=["TITLE_FUZZY:" + " | ".join(titles)[:200]])
+
     # Fallback: strict title grouping for remaining editions.
     remaining = [e for e in editions if e.get("album_id") not in used_ids]
     strict_groups: dict[str, list[dict]] = defaultdict(list)
@@ -41523,6 +43082,11 @@ def scan_duplicates(
         _append_group(ed_list, fuzzy=True, signal="title_strict", evidence=[f"TITLE_STRICT:{key}"])
 
     # --- Same-folder duplicate groups: multiple Plex album entries pointing to one folder ---
+    same_folder_titles = album_id_to_title
+    if db_conn is not None:
+        same_folder_titles = album_titles_many(
+            db_conn, [aid for ids in seen_folders.values() if len(ids) >= 2 for aid in ids]
+        )
     for folder_str, album_ids in seen_folders.items():
         if len(album_ids) < 2:
             continue
@@ -41533,7 +43097,7 @@ def scan_duplicates(
         for aid in album_ids:
             if aid == best_edition["album_id"]:
                 continue
-            pt = album_id_to_title.get(aid, f"Album {aid}") if db_conn is None else (album_title(db_conn, aid) or f"Album {aid}")
+            pt = same_folder_titles.get(aid) or f"Album {aid}"
             losers.append({
                 "album_id": aid,
                 "title_raw": pt,
@@ -41955,7 +43519,7 @@ def save_scan_editions_to_db(scan_id: int, all_editions_by_artist: Dict[str, Lis
             missing_required = _check_required_tags(meta, REQUIRED_TAGS, edition=edition_for_required)
             missing_required_json = json.dumps(missing_required) if missing_required else None
             folder_str = str(folder) if folder else ""
-            fmt_text = get_primary_format(Path(folder_str)) if folder_str else ""
+            fmt_text = cached_folder_meta(Path(folder_str))[1] if folder_str else ""
             if mode == "files":
                 folder_key = ""
                 try:
@@ -42050,93 +43614,143 @@ def save_scan_editions_to_db(scan_id: int, all_editions_by_artist: Dict[str, Lis
     logging.debug("save_scan_editions_to_db: scan_id=%s, %d edition rows", scan_id, row_count)
 
 
+_DUPLICATES_BEST_INSERT_SQL = """
+      INSERT OR IGNORE INTO duplicates_best
+        (artist, album_id, title_raw, album_norm, folder,
+         fmt_text, br, sr, bd, dur, discs, rationale, merge_list, ai_used, meta_json, ai_provider, ai_model, evidence_json, size_mb, track_count, match_verified_by_ai,
+         dupe_signal, no_move, manual_review, same_folder)
+      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_DUPLICATES_LOSER_INSERT_SQL = """
+    INSERT INTO duplicates_loser
+      (artist, album_id, loser_album_id, folder, fmt_text, br, sr, bd, size_mb)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _duplicate_group_rows(artist_name: str, g: dict) -> tuple[tuple, list[tuple]]:
+    """
+    Build the duplicates_best row and duplicates_loser rows for one group.
+    Does the filesystem work (folder sizes) so callers can keep it outside the DB transaction.
+    """
+    best = g["best"]
+    best_folder_path = path_for_fs_access(Path(best["folder"])) if best.get("folder") else None
+    best_size_mb = (cached_folder_meta(best_folder_path)[0] // (1024 * 1024)) if best_folder_path else 0
+    best_track_count = len(best.get("tracks", []))
+    # When used_ai, ensure ai_provider/ai_model are set (e.g. from cache they may be empty)
+    used_ai = bool(best.get("used_ai", False))
+    ai_provider = best.get("ai_provider") or ""
+    ai_model = best.get("ai_model") or ""
+    if used_ai and (not ai_provider or not ai_model):
+        mod = sys.modules[__name__]
+        ai_provider = ai_provider or (getattr(mod, "AI_PROVIDER", None) or "")
+        ai_model = ai_model or (getattr(mod, "RESOLVED_MODEL", None) or getattr(mod, "OPENAI_MODEL", None) or "")
+    try:
+        evidence_json = json.dumps(best.get("dupe_evidence", []))
+    except Exception:
+        evidence_json = "[]"
+    best_row = (
+        artist_name,
+        best["album_id"],
+        best["title_raw"],
+        best["album_norm"],
+        str(best["folder"]),
+        _edition_primary_format(best),
+        best["br"],
+        best["sr"],
+        best["bd"],
+        best["dur"],
+        best["discs"],
+        best.get("rationale", ""),
+        _pack_merge_list(best.get("merge_list")),
+        int(used_ai),
+        json.dumps(best.get("meta", {})),
+        ai_provider,
+        ai_model,
+        evidence_json,
+        best_size_mb,
+        best_track_count,
+        1 if best.get("match_verified_by_ai") else 0,
+        str(g.get("dupe_signal") or ""),
+        1 if bool(g.get("no_move")) else 0,
+        1 if bool(g.get("manual_review")) else 0,
+        1 if bool(g.get("same_folder")) else 0,
+    )
+    loser_rows = []
+    for e in g["losers"]:
+        size_mb = cached_folder_meta(Path(e["folder"]))[0] // (1024 * 1024)
+        # Remember the size on the loser so perform_dedupe doesn't re-walk the moved folder.
+        e["size"] = size_mb
+        loser_rows.append((
+            artist_name,
+            best["album_id"],
+            e.get("album_id"),
+            str(e["folder"]),
+            _edition_primary_format(e),
+            e["br"],
+            e["sr"],
+            e["bd"],
+            size_mb,
+        ))
+    return best_row, loser_rows
+
+
+# Max number of artists the incremental scan writer persists per duplicates transaction.
+SCAN_PERSIST_BATCH_ARTISTS = 200
+
+
+def save_scan_artists_to_db(
+    batch: List[tuple[str, List[dict]]],
+    con: sqlite3.Connection | None = None,
+) -> int:
+    """
+    Insert several artists' duplicate groups into duplicates_best and duplicates_loser
+    in one transaction. *batch* is a list of (artist_name, groups). When *con* is given
+    it is reused (and left open); otherwise a short-lived connection is opened.
+    Skips groups without best/losers (e.g. needs_ai not yet processed). Returns count of groups saved.
+    """
+    best_rows: list[tuple] = []
+    loser_rows: list[tuple] = []
+    for artist_name, groups in batch:
+        for g in groups or []:
+            if "best" not in g or "losers" not in g:
+                continue
+            best_row, group_loser_rows = _duplicate_group_rows(artist_name, g)
+            best_rows.append(best_row)
+            loser_rows.extend(group_loser_rows)
+    if not best_rows:
+        return 0
+    own_con = con is None
+    if own_con:
+        con = _open_db(str(STATE_DB_FILE), timeout=30)
+    try:
+        cur = con.cursor()
+        cur.executemany(_DUPLICATES_BEST_INSERT_SQL, best_rows)
+        if loser_rows:
+            cur.executemany(_DUPLICATES_LOSER_INSERT_SQL, loser_rows)
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        if own_con:
+            con.close()
+    return len(best_rows)
+
+
 def save_scan_artist_to_db(artist_name: str, groups: List[dict]) -> int:
     """
     Insert one artist's duplicate groups into duplicates_best and duplicates_loser.
     Skips groups without best/losers (e.g. needs_ai not yet processed). Returns count of groups saved.
     """
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
-    cur = con.cursor()
-    saved_count = 0
-    for g in groups:
-        if "best" not in g or "losers" not in g:
-            continue
-        saved_count += 1
-        best = g["best"]
-        best_folder_path = path_for_fs_access(Path(best["folder"])) if best.get("folder") else None
-        best_size_mb = (safe_folder_size(best_folder_path) // (1024 * 1024)) if best_folder_path else 0
-        best_track_count = len(best.get("tracks", []))
-        used_ai = bool(best.get("used_ai", False))
-        ai_provider = best.get("ai_provider") or ""
-        ai_model = best.get("ai_model") or ""
-        if used_ai and (not ai_provider or not ai_model):
-            mod = sys.modules[__name__]
-            ai_provider = ai_provider or (getattr(mod, "AI_PROVIDER", None) or "")
-            ai_model = ai_model or (getattr(mod, "RESOLVED_MODEL", None) or getattr(mod, "OPENAI_MODEL", None) or "")
-        try:
-            evidence_json = json.dumps(best.get("dupe_evidence", []))
-        except Exception:
-            evidence_json = "[]"
-        cur.execute("""
-              INSERT OR IGNORE INTO duplicates_best
-                (artist, album_id, title_raw, album_norm, folder,
-                 fmt_text, br, sr, bd, dur, discs, rationale, merge_list, ai_used, meta_json, ai_provider, ai_model, evidence_json, size_mb, track_count, match_verified_by_ai,
-                 dupe_signal, no_move, manual_review, same_folder)
-              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-          """, (
-              artist_name,
-              best["album_id"],
-              best["title_raw"],
-              best["album_norm"],
-              str(best["folder"]),
-              get_primary_format(Path(best["folder"])),
-              best["br"],
-              best["sr"],
-              best["bd"],
-              best["dur"],
-              best["discs"],
-              best.get("rationale", ""),
-              json.dumps(best.get("merge_list", [])),
-              int(used_ai),
-              json.dumps(best.get("meta", {})),
-              ai_provider,
-              ai_model,
-              evidence_json,
-              best_size_mb,
-              best_track_count,
-              1 if best.get("match_verified_by_ai") else 0,
-              str(g.get("dupe_signal") or ""),
-              1 if bool(g.get("no_move")) else 0,
-              1 if bool(g.get("manual_review")) else 0,
-              1 if bool(g.get("same_folder")) else 0,
-          ))
-        for e in g["losers"]:
-            size_mb = folder_size(e["folder"]) // (1024 * 1024)
-            cur.execute("""
-                INSERT INTO duplicates_loser
-                  (artist, album_id, loser_album_id, folder, fmt_text, br, sr, bd, size_mb)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                artist_name,
-                best["album_id"],
-                e.get("album_id"),
-                str(e["folder"]),
-                get_primary_format(e["folder"]),
-                e["br"],
-                e["sr"],
-                e["bd"],
-                size_mb,
-            ))
-    con.commit()
-    con.close()
-    return saved_count
+    return save_scan_artists_to_db([(artist_name, groups)])
 
 
 def save_scan_editions_artist_to_db(scan_id: int, artist_name: str, editions_list: List[dict]) -> int:
     """
     Insert one artist's editions into scan_editions (no DELETE). Returns row count inserted.
     """
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     cur = con.cursor()
     row_count = 0
     for e in editions_list:
@@ -42174,7 +43788,7 @@ def save_scan_editions_artist_to_db(scan_id: int, artist_name: str, editions_lis
         except (TypeError, ValueError):
             missing_required_json = None
         folder_str = str(folder) if folder else ""
-        fmt_text = get_primary_format(Path(folder_str)) if folder_str else ""
+        fmt_text = cached_folder_meta(Path(folder_str))[1] if folder_str else ""
         try:
             meta_json_str = json.dumps(meta, default=str)
         except (TypeError, ValueError):
@@ -42269,7 +43883,7 @@ def _scan_pipeline_trace_move_lookup(scan_id: int) -> dict[int, dict[str, Any]]:
     sid = int(scan_id or 0)
     if sid <= 0:
         return {}
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     con.row_factory = sqlite3.Row
     try:
         cur = con.cursor()
@@ -42320,7 +43934,7 @@ def _scan_pipeline_trace_incomplete_lookup(scan_id: int) -> dict[int, dict[str,
     sid = int(scan_id or 0)
     if sid <= 0:
         return {}
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     con.row_factory = sqlite3.Row
     try:
         cur = con.cursor()
@@ -42769,7 +44383,7 @@ def save_scan_pipeline_trace_artist_to_db(
         editions_list=list(editions_list or []),
         groups=list(groups or []),
     )
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     try:
         cur = con.cursor()
         cur.execute("DELETE FROM scan_pipeline_trace WHERE scan_id = ? AND artist = ?", (int(scan_id or 0), str(artist_name or "")))
@@ -42791,7 +44405,7 @@ def save_scan_pipeline_trace_to_db(
     all_results = dict(all_results or {})
     move_lookup = _scan_pipeline_trace_move_lookup(sid)
     incomplete_lookup = _scan_pipeline_trace_incomplete_lookup(sid)
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     try:
         cur = con.cursor()
         cur.execute("DELETE FROM scan_pipeline_trace WHERE scan_id = ?", (sid,))
@@ -42832,7 +44446,7 @@ def update_scan_history_incremental(
     Only updates rows with status = 'running'.
     """
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         cur.execute(
             """
@@ -43050,20 +44664,14 @@ def save_scan_to_db(scan_results: Dict[str, List[dict]]):
     """
     Given a dict of { artist_name: [group_dicts...] }, clear duplicates tables and re‐populate them.
     """
-    import sqlite3, json
 
     # (Removed: filtering of invalid editions; already purged upstream)
-    con = sqlite3.connect(str(STATE_DB_FILE))
-    cur = con.cursor()
-
-    # 1) Clear both duplicates tables
-    cur.execute("DELETE FROM duplicates_loser")
-    cur.execute("DELETE FROM duplicates_best")
-
-    # 2) Re-insert all scan results (skip groups that have no best/losers, e.g. needs_ai not yet processed)
+    # 1) Build all rows first: folder sizes hit the filesystem, keep that out of the write lock.
     saved_count = 0
     skipped_count = 0
     saved_with_ai = 0
+    best_rows: list[tuple] = []
+    loser_rows: list[tuple] = []
     for artist, groups in scan_results.items():
         for g in groups:
             if "best" not in g or "losers" not in g:
@@ -43071,78 +44679,22 @@ def save_scan_to_db(scan_results: Dict[str, List[dict]]):
                 logging.debug("save_scan_to_db: skipping group without best/losers (artist=%s)", artist)
                 continue
             saved_count += 1
-            best = g["best"]
-            if best.get("used_ai"):
+            if g["best"].get("used_ai"):
                 saved_with_ai += 1
-            # Persist size_mb and track_count so Unduper shows them after reload
-            best_folder_path = path_for_fs_access(Path(best["folder"])) if best.get("folder") else None
-            best_size_mb = (safe_folder_size(best_folder_path) // (1024 * 1024)) if best_folder_path else 0
-            best_track_count = len(best.get("tracks", []))
-            # When used_ai, ensure ai_provider/ai_model are set (e.g. from cache they may be empty)
-            used_ai = bool(best.get("used_ai", False))
-            ai_provider = best.get("ai_provider") or ""
-            ai_model = best.get("ai_model") or ""
-            if used_ai and (not ai_provider or not ai_model):
-                mod = sys.modules[__name__]
-                ai_provider = ai_provider or (getattr(mod, "AI_PROVIDER", None) or "")
-                ai_model = ai_model or (getattr(mod, "RESOLVED_MODEL", None) or getattr(mod, "OPENAI_MODEL", None) or "")
-            try:
-                evidence_json = json.dumps(best.get("dupe_evidence", []))
-            except Exception:
-                evidence_json = "[]"
-            # Best edition
-            cur.execute("""
-                  INSERT OR IGNORE INTO duplicates_best
-                    (artist, album_id, title_raw, album_norm, folder,
-                     fmt_text, br, sr, bd, dur, discs, rationale, merge_list, ai_used, meta_json, ai_provider, ai_model, evidence_json, size_mb, track_count, match_verified_by_ai,
-                     dupe_signal, no_move, manual_review, same_folder)
-                  VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-              """, (
-                  artist,
-                  best['album_id'],
-                  best['title_raw'],
-                  best['album_norm'],
-                  str(best['folder']),
-                  get_primary_format(Path(best['folder'])),
-                  best['br'],
-                  best['sr'],
-                  best['bd'],
-                  best['dur'],
-                  best['discs'],
-                  best.get('rationale', ''),
-                  json.dumps(best.get('merge_list', [])),
-                  int(used_ai),
-                  json.dumps(best.get('meta', {})),
-                  ai_provider,
-                  ai_model,
-                  evidence_json,
-                  best_size_mb,
-                  best_track_count,
-                  1 if best.get('match_verified_by_ai') else 0,
-                  str(g.get("dupe_signal") or ""),
-                  1 if bool(g.get("no_move")) else 0,
-                  1 if bool(g.get("manual_review")) else 0,
-                  1 if bool(g.get("same_folder")) else 0,
-              ))
-
-            # All "loser" editions
-            for e in g['losers']:
-                size_mb = folder_size(e['folder']) // (1024 * 1024)
-                cur.execute("""
-                    INSERT INTO duplicates_loser
-                      (artist, album_id, loser_album_id, folder, fmt_text, br, sr, bd, size_mb)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    artist,
-                    best['album_id'],
-                    e.get('album_id'),
-                    str(e['folder']),
-                    get_primary_format(e['folder']),
-                    e['br'],
-                    e['sr'],
-                    e['bd'],
-                    size_mb
-                ))
+            best_row, group_loser_rows = _duplicate_group_rows(artist, g)
+            best_rows.append(best_row)
+            loser_rows.extend(group_loser_rows)
+
+    # 2) Clear both duplicates tables and re-insert in one transaction
+    con = _open_db(str(STATE_DB_FILE))
+    cur = con.cursor()
+    cur.execute("BEGIN IMMEDIATE")
+    cur.execute("DELETE FROM duplicates_loser")
+    cur.execute("DELETE FROM duplicates_best")
+    if best_rows:
+        cur.executemany(_DUPLICATES_BEST_INSERT_SQL, best_rows)
+    if loser_rows:
+        cur.executemany(_DUPLICATES_LOSER_INSERT_SQL, loser_rows)
 
     # 3) Commit & close
     con.commit()
@@ -43163,19 +44715,19 @@ def save_scan_to_db(scan_results: Dict[str, List[dict]]):
             pass
 
 
-def _remove_dedupe_group_from_db(artist: str, best_album_id: int, loser_album_ids: List[int]) -> None:
-    """Remove one duplicate group from DB after it has been successfully moved to /dupes."""
+def _remove_dedupe_groups_from_db(groups: List[Tuple[str, int]]) -> None:
+    """Remove (artist, best_album_id) duplicate groups from DB in one transaction once moved to /dupes."""
+    pairs = [(artist, int(best_album_id)) for artist, best_album_id in groups if best_album_id]
+    if not pairs:
+        return
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE))
-        cur = con.cursor()
-        cur.execute("DELETE FROM duplicates_best WHERE artist = ? AND album_id = ?", (artist, best_album_id))
-        # duplicates_loser.album_id is the winner/group key; loser_album_id stores the real loser edition id.
-        # Remove the whole loser set for this winner group in one shot.
-        cur.execute("DELETE FROM duplicates_loser WHERE artist = ? AND album_id = ?", (artist, best_album_id))
-        con.commit()
-        con.close()
+        with STATE_POOL.acquire() as con, con:
+            con.executemany("DELETE FROM duplicates_best WHERE artist = ? AND album_id = ?", pairs)
+            # duplicates_loser.album_id is the winner/group key; loser_album_id stores the real loser edition id.
+            # Remove the whole loser set for each winner group in one shot.
+            con.executemany("DELETE FROM duplicates_loser WHERE artist = ? AND album_id = ?", pairs)
     except Exception as e:
-        logging.warning("_remove_dedupe_group_from_db failed for %s / %s: %s", artist, best_album_id, e)
+        logging.warning("_remove_dedupe_groups_from_db failed for %d group(s): %s", len(pairs), e)
 
 
 def load_scan_from_db() -> Dict[str, List[dict]]:
@@ -43190,7 +44742,7 @@ def load_scan_from_db() -> Dict[str, List[dict]]:
     """
     import json
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         cur = con.cursor()
 
         # ---- 1) Best editions -------------------------------------------------
@@ -43275,6 +44827,16 @@ def load_scan_from_db() -> Dict[str, List[dict]]:
             }
         )
 
+    # Loser rows don't store a readable title; resolve them all from Plex in one batched lookup.
+    loser_titles: dict[int, str] = {}
+    loser_aids = {l["album_id"] for ls in loser_map.values() for l in ls if l["title_raw"] is None}
+    if loser_aids:
+        try:
+            with PLEX_POOL.acquire() as db_plx:
+                loser_titles = album_titles_many(db_plx, loser_aids)
+        except sqlite3.Error as e:
+            logging.debug("load_scan_from_db: loser title lookup failed: %s", e)
+
     results: Dict[str, List[dict]] = defaultdict(list)
 
     for row in best_rows:
@@ -43321,7 +44883,7 @@ def load_scan_from_db() -> Dict[str, List[dict]]:
             "dur": dur,
             "discs": discs,
             "rationale": rationale,
-            "merge_list": json.loads(merge_list_json) if merge_list_json else [],
+            "merge_list": _unpack_merge_list(merge_list_json),
             "used_ai": bool(ai_used),
             "meta": json.loads(meta_json or "{}"),
             "ai_provider": ai_provider,
@@ -43334,13 +44896,14 @@ def load_scan_from_db() -> Dict[str, List[dict]]:
 
         losers = loser_map.get((artist, aid), [])
 
-        # Some loser rows still need the readable title; fetch from Plex by this edition's album_id.
         for l in losers:
             if l["title_raw"] is None:
-                db_plx = plex_connect()
-                title = album_title(db_plx, l["album_id"])
-                l["title_raw"] = title or ""
-                db_plx.close()
+                l["title_raw"] = loser_titles.get(l["album_id"], "")
+            # Rows written before formats were persisted: resolve once here, not per card build.
+            if not l.get("fmt") and l.get("folder"):
+                l["fmt"] = _edition_primary_format(l)
+        if not best_entry.get("fmt_text") and folder:
+            best_entry["fmt_text"] = _edition_primary_format(best_entry)
 
         results[artist].append(
             {
@@ -43364,6 +44927,7 @@ def clear_db_on_new_scan():
     """
     with lock:
         state["duplicates"].clear()
+        _bump_duplicates_version()
 
 def _get_library_mode() -> str:
     """
@@ -44498,7 +46062,7 @@ def _recalculate_files_album_scan_cache_quality(
 
     total_rows = 0
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute(f"SELECT COUNT(*) FROM files_album_scan_cache {where_sql}", tuple(where_params))
         total_rows = int((cur.fetchone() or [0])[0] or 0)
@@ -44569,7 +46133,7 @@ def _recalculate_files_album_scan_cache_quality(
         query_params.append(last_rowid)
         query_params.append(batch_size)
         try:
-            con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+            con = _open_db(str(STATE_DB_FILE), timeout=20)
             cur = con.cursor()
             cur.execute(select_sql, tuple(query_params))
             chunk = cur.fetchall()
@@ -44862,7 +46426,7 @@ def _refresh_files_album_scan_cache_from_editions(editions: list[dict], scan_id:
             if not ordered_paths:
                 try:
                     ordered_paths = sorted(
-                        [p for p in folder.rglob("*") if p.is_file() and AUDIO_RE.search(p.name)],
+                        [p for p in folder.rglob("*") if p.is_file() and _is_audio_name(p.name)],
                         key=lambda x: str(x),
                     )
                 except Exception:
@@ -44953,7 +46517,7 @@ def _files_collect_ordered_audio_paths(folder: Path, ordered_paths_raw: list | N
         except Exception:
             continue
         try:
-            if p.exists() and p.is_file() and AUDIO_RE.search(p.name):
+            if p.exists() and p.is_file() and _is_audio_name(p.name):
                 sp = str(p.resolve())
                 if sp in seen:
                     continue
@@ -44964,30 +46528,40 @@ def _files_collect_ordered_audio_paths(folder: Path, ordered_paths_raw: list | N
     if out:
         return out
     try:
-        discovered = [p for p in folder.rglob("*") if p.is_file() and AUDIO_RE.search(p.name)]
+        discovered = [p for p in folder.rglob("*") if p.is_file() and _is_audio_name(p.name)]
     except Exception:
         discovered = []
     return sorted(discovered, key=lambda p: str(p))
 
 
+# Track-number prefixes in file names / tag text ("CD2-07", "1-05", "A1", "07"), shared by the
+# per-file parsers below; compiled once because they run for every audio file of every scan.
+_TRACK_CD_DISC_TRACK_RE = re.compile(r"^\s*(?:cd|disc)\s*(\d{1,2})\s*[-_. ]\s*(\d{1,3})\b", re.IGNORECASE)
+_TRACK_DISC_TRACK_RE = re.compile(r"^\s*(\d{1,2})\s*[-_.]\s*(\d{1,3})\b")
+_TRACK_SIDE_TRACK_RE = re.compile(r"^\s*([A-Z])\s*(?:[-_. ]?\s*(\d{1,3}))\b", re.IGNORECASE)
+_TRACK_SIDE_LABEL_RE = re.compile(r"^\s*([A-Z])\s*(?:[-_. ]?\s*\d{1,3})\b", re.IGNORECASE)
+_TRACK_NUMBER_RE = re.compile(r"^\s*(\d{1,3})\b")
+_TRACK_ARTIST_ALBUM_TAIL_RE = re.compile(r"^\s*[^-]+?\s*-\s*[^-]+?\s*-\s*(.+)$", re.IGNORECASE)
+
+
 def _infer_disc_track_from_text(text: str, fallback_track: int) -> tuple[int, int]:
     raw = str(text or "").strip()
     if not raw:
         return (1, max(1, int(fallback_track or 1)))
     disc = 1
     track = max(1, int(fallback_track or 1))
-    m = re.match(r"^\s*(?:cd|disc)\s*(\d{1,2})\s*[-_. ]\s*(\d{1,3})\b", raw, flags=re.IGNORECASE)
+    m = _TRACK_CD_DISC_TRACK_RE.match(raw)
     if m:
         return (_parse_int_loose(m.group(1), 1) or 1, _parse_int_loose(m.group(2), track) or track)
-    m = re.match(r"^\s*(\d{1,2})\s*[-_.]\s*(\d{1,3})\b", raw)
+    m = _TRACK_DISC_TRACK_RE.match(raw)
     if m:
         return (_parse_int_loose(m.group(1), 1) or 1, _parse_int_loose(m.group(2), track) or track)
-    m = re.match(r"^\s*([A-Z])\s*(?:[-_. ]?\s*(\d{1,3}))\b", raw, flags=re.IGNORECASE)
+    m = _TRACK_SIDE_TRACK_RE.match(raw)
     if m:
         disc = (ord(m.group(1).upper()) - ord("A")) + 1
         track = _parse_int_loose(m.group(2), 1) or 1
         return (max(1, disc), max(1, track))
-    m = re.match(r"^\s*(\d{1,3})\b", raw)
+    m = _TRACK_NUMBER_RE.match(raw)
     if m:
         track = _parse_int_loose(m.group(1), track) or track
         return (1, max(1, track))
@@ -44997,7 +46571,7 @@ def _infer_disc_track_from_text(text: str, fallback_track: int) -> tuple[int, in
 def _disc_label_from_text(text: str, disc_num: int) -> str:
     raw = str(text or "").strip()
     if raw:
-        m = re.match(r"^\s*([A-Z])\s*(?:[-_. ]?\s*\d{1,3})\b", raw, flags=re.IGNORECASE)
+        m = _TRACK_SIDE_LABEL_RE.match(raw)
         if m:
             side = str(m.group(1) or "").upper()
             if side:
@@ -45155,7 +46729,7 @@ def _track_display_fields_from_sources(
                 cand,
                 flags=re.IGNORECASE,
             )
-            or re.match(r"^\s*[A-Z]\s*(?:[-_. ]?\s*\d{1,3})\b", cand, flags=re.IGNORECASE)
+            or _TRACK_SIDE_LABEL_RE.match(cand)
         )
         if looks_structured or (parsed_disc != 1 or parsed_track != track_num):
             disc_num = max(1, int(parsed_disc or disc_num))
@@ -45415,7 +46989,7 @@ def _files_build_track_entries_from_item(item: dict, folder: Path) -> list[dict]
 
 def _clear_files_library_published_rows() -> int:
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute("DELETE FROM files_library_published_albums")
         deleted = int(cur.rowcount or 0)
@@ -45491,7 +47065,7 @@ def _upsert_files_library_published_rows(rows: list[dict]) -> int:
     if not filtered:
         return 0
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+        con = _open_db(str(STATE_DB_FILE), timeout=30)
         cur = con.cursor()
         cur.executemany(
             """
@@ -46096,7 +47670,7 @@ def _delete_files_library_published_rows(folder_paths: list[str] | set[str] | tu
     if not paths:
         return 0
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+        con = _open_db(str(STATE_DB_FILE), timeout=30)
         cur = con.cursor()
         placeholders = ",".join(["?"] * len(paths))
         cur.execute(
@@ -46679,7 +48253,7 @@ def _rows_to_files_library_payload(rows: list[tuple]) -> tuple[dict[str, dict],
 def _load_files_library_published_payload() -> tuple[dict[str, dict], list[dict], int]:
     """Load published albums from state.db as payload for Files PG index rebuild."""
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute(
             """
@@ -46713,7 +48287,7 @@ def _load_files_library_published_payload_for_artist(artist_hint: str) -> tuple[
     artist_norm_alt = norm_album(artist_name or "") or artist_norm
     artist_like = "%" + " ".join(artist_name.lower().split()).replace("%", "").replace("_", "") + "%"
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute(
             """
@@ -47634,7 +49208,7 @@ def _prepare_resume_scan_artists(
     skipped_albums = 0
     included_albums = 0
 
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     cur = con.cursor()
     prev = None
     resume_run_id_override = str(resume_run_id_override or "").strip()
@@ -48406,20 +49980,20 @@ def _build_files_editions(
         stem = path.stem.strip()
         disc = 1
         track = fallback_track
-        m = re.match(r"^\s*(?:cd|disc)\s*(\d{1,2})\s*[-_. ]\s*(\d{1,3})\b", stem, flags=re.IGNORECASE)
+        m = _TRACK_CD_DISC_TRACK_RE.match(stem)
         if m:
             return (_parse_int_loose(m.group(1), 1) or 1, _parse_int_loose(m.group(2), fallback_track) or fallback_track)
-        m = re.match(r"^\s*(\d{1,2})\s*[-_.]\s*(\d{1,3})\b", stem)
+        m = _TRACK_DISC_TRACK_RE.match(stem)
         if m:
             return (_parse_int_loose(m.group(1), 1) or 1, _parse_int_loose(m.group(2), fallback_track) or fallback_track)
         # Vinyl-side style: "A1", "B2", optionally with separators. Require digits so we don't mis-detect
         # normal names like "Ochre - ..." as side "O".
-        m = re.match(r"^\s*([A-Z])\s*(?:[-_. ]?\s*(\d{1,3}))\b", stem, flags=re.IGNORECASE)
+        m = _TRACK_SIDE_TRACK_RE.match(stem)
         if m:
             disc = (ord(m.group(1).upper()) - ord("A")) + 1
             track = _parse_int_loose(m.group(2), 1) or 1
             return (max(1, disc), max(1, track))
-        m = re.match(r"^\s*(\d{1,3})\b", stem)
+        m = _TRACK_NUMBER_RE.match(stem)
         if m:
             track = _parse_int_loose(m.group(1), fallback_track) or fallback_track
             return (disc, max(1, track))
@@ -48463,7 +50037,7 @@ def _build_files_editions(
             stem = str(path or "").strip()
         if not stem:
             return ""
-        m = re.match(r"^\s*[^-]+?\s*-\s*[^-]+?\s*-\s*(.+)$", stem, flags=re.IGNORECASE)
+        m = _TRACK_ARTIST_ALBUM_TAIL_RE.match(stem)
         if m:
             tail = str(m.group(1) or "").strip()
             if tail:
@@ -48499,7 +50073,7 @@ def _build_files_editions(
         tail = _filename_tail_for_track_parsing(raw)
         if not tail:
             return None
-        m = re.match(r"^\s*([A-Z])\s*(?:[-_. ]?\s*\d{1,3})\b", tail, flags=re.IGNORECASE)
+        m = _TRACK_SIDE_LABEL_RE.match(tail)
         if not m:
             return None
         side = str(m.group(1) or "").upper()
@@ -48567,13 +50141,13 @@ def _build_files_editions(
         stem = path.stem.strip()
         if not stem:
             return False
-        if re.match(r"^\s*(?:cd|disc)\s*\d{1,2}\s*[-_. ]\s*\d{1,3}\b", stem, flags=re.IGNORECASE):
+        if _TRACK_CD_DISC_TRACK_RE.match(stem):
             return True
-        if re.match(r"^\s*\d{1,2}\s*[-_.]\s*\d{1,3}\b", stem):
+        if _TRACK_DISC_TRACK_RE.match(stem):
             return True
-        if re.match(r"^\s*[A-Z]\s*(?:[-_. ]?\s*\d{1,3})\b", stem, flags=re.IGNORECASE):
+        if _TRACK_SIDE_LABEL_RE.match(stem):
             return True
-        if re.match(r"^\s*\d{1,3}\b", stem):
+        if _TRACK_NUMBER_RE.match(stem):
             return True
         return False
 
@@ -48727,7 +50301,7 @@ def _build_files_editions(
                 continue
             try:
                 album_files = sorted(
-                    [p for p in folder_path.rglob("*") if p.is_file() and AUDIO_RE.search(p.name)],
+                    [p for p in folder_path.rglob("*") if p.is_file() and _is_audio_name(p.name)],
                     key=lambda p: str(p),
                 )
             except Exception:
@@ -48851,7 +50425,7 @@ def _build_files_editions(
         removed_from_cache = 0
         removed_from_published = 0
         try:
-            con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+            con = _open_db(str(STATE_DB_FILE), timeout=20)
             cur = con.cursor()
             cur.executemany(
                 "DELETE FROM files_album_scan_cache WHERE folder_path = ?",
@@ -49522,15 +51096,19 @@ def _run_export_library() -> None:
                         try:
                             tgt.hardlink_to(src)
                         except OSError:
-                            import shutil
                             shutil.copy2(src, tgt)
                     elif strategy == "symlink":
                         tgt.symlink_to(src)
                     elif strategy == "move":
                         if src.resolve() != tgt.resolve():
-                            shutil.move(str(src), str(tgt))
+                            # One rename syscall on the same filesystem; copy+delete only across devices.
+                            try:
+                                os.rename(src, tgt)
+                            except OSError as move_err:
+                                if move_err.errno != errno.EXDEV:
+                                    raise
+                                shutil.move(str(src), str(tgt))
                     else:
-                        import shutil
                         shutil.copy2(src, tgt)
                 except Exception as e:
                     logging.warning("Export failed for %s -> %s: %s", src, tgt, e)
@@ -49581,6 +51159,16 @@ def _trigger_export_library_async(reason: str = "manual") -> bool:
     return True
 
 
+# Plex scan plan: every artist of the selected sections with its albums, ordered so each
+# artist's rows are contiguous. Albums are counted from these rows for the progress total.
+_PLEX_SCAN_PLAN_SQL = (
+    "SELECT art.id, art.title, alb.id FROM metadata_items art "
+    "LEFT JOIN metadata_items alb ON alb.parent_id = art.id AND alb.metadata_type = 9 "
+    "WHERE art.metadata_type = 8 AND art.library_section_id IN ({placeholders}) "
+    "ORDER BY art.id, alb.id"
+)
+
+
 def _build_scan_plan(scan_type: str = "full") -> tuple[list[tuple[int, str, list[int]]], int]:
     """
     Build the list of artists/albums to scan and return (artists_merged, total_albums).
@@ -49632,44 +51220,33 @@ def _build_scan_plan(scan_type: str = "full") -> tuple[list[tuple[int, str, list
         logging.info("Scan type 'changed_only' is only optimized in Files mode; using full scan plan for Plex mode.")
 
     # Plex-backed scan plan (current behaviour)
+    _reset_plex_read_connections()
     db_conn = plex_connect()
     placeholders = ",".join("?" for _ in SECTION_IDS)
 
-    # Total albums for progress bar
-    total_albums = db_conn.execute(
-        f"SELECT COUNT(*) FROM metadata_items "
-        f"WHERE metadata_type=9 AND library_section_id IN ({placeholders})",
-        SECTION_IDS,
-    ).fetchone()[0]
-
-    # Fetch all artists in the selected sections
-    artists_raw = db_conn.execute(
-        f"SELECT id, title FROM metadata_items "
-        f"WHERE metadata_type=8 AND library_section_id IN ({placeholders})",
-        SECTION_IDS,
-    ).fetchall()
-
-    # Merge artists by normalized name so duplicates across Plex \"artist\" entries
-    # (e.g. Ochre from folder A and Ochre from folder B) are scanned together.
+    # Artists of the selected sections and their albums in one index pass (replaces a separate
+    # COUNT(*), artist SELECT and album SELECT). Artists without albums come back with NULL.
     from collections import defaultdict
 
     artists_by_name: dict[str, list[tuple[int, str]]] = defaultdict(list)
-    for artist_id, artist_name in artists_raw:
-        name_norm = _norm_artist_key(artist_name)
-        artists_by_name[name_norm].append((artist_id, artist_name))
+    album_ids_by_artist: dict[int, list[int]] = defaultdict(list)
+    total_albums = 0
+    prev_artist_id = None
+    for artist_id, artist_name, album_id in db_conn.execute(_PLEX_SCAN_PLAN_SQL.format(placeholders=placeholders), SECTION_IDS):
+        if artist_id != prev_artist_id:
+            prev_artist_id = artist_id
+            # Merge artists by normalized name so duplicates across Plex "artist" entries
+            # (e.g. Ochre from folder A and Ochre from folder B) are scanned together.
+            artists_by_name[_norm_artist_key(artist_name)].append((artist_id, artist_name))
+        if album_id is not None:
+            album_ids_by_artist[artist_id].append(album_id)
+            total_albums += 1
 
     artists_merged: list[tuple[int, str, list[int]]] = []
     for _name_norm, id_name_list in artists_by_name.items():
-        artist_ids = [aid for aid, _ in id_name_list]
         primary_id, primary_name = id_name_list[0]
-        ph = ",".join("?" for _ in artist_ids)
         album_ids_for_name = [
-            row[0]
-            for row in db_conn.execute(
-                f"SELECT id FROM metadata_items "
-                f"WHERE metadata_type=9 AND parent_id IN ({ph})",
-                artist_ids,
-            ).fetchall()
+            album_id for aid, _ in id_name_list for album_id in album_ids_by_artist.get(aid, [])
         ]
         artists_merged.append((primary_id, primary_name, album_ids_for_name))
         if len(id_name_list) > 1:
@@ -49680,6 +51257,15 @@ def _build_scan_plan(scan_type: str = "full") -> tuple[list[tuple[int, str, list
                 len(album_ids_for_name),
             )
 
+    # Title/tracks/first path for every album, consumed by scan_duplicates workers
+    try:
+        bundles = _prefetch_plex_album_bundles(db_conn, list(SECTION_IDS))
+    except sqlite3.Error as e:
+        logging.warning("Plex album prefetch failed; workers will query per album: %s", e)
+        bundles = {}
+    with _plex_album_bundles_lock:
+        _plex_album_bundles.clear()
+        _plex_album_bundles.update(bundles)
     db_conn.close()
     return artists_merged, total_albums
 
@@ -49825,7 +51411,7 @@ def _auto_move_incomplete_albums_for_scan(
         return result
 
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
     except Exception:
         con = None
@@ -49844,11 +51430,7 @@ def _auto_move_incomplete_albums_for_scan(
                 artist_hint=str(item.get("artist") or ""),
                 album_hint=str(item.get("title_raw") or src_folder.name or ""),
             )
-            dst = target_root / letter / artist_dir / album_dir
-            counter = 1
-            while dst.exists():
-                dst = target_root / letter / artist_dir / f"{album_dir} ({counter})"
-                counter += 1
+            dst = _next_available_folder_path(target_root / letter / artist_dir / album_dir)
             try:
                 dst.parent.mkdir(parents=True, exist_ok=True)
                 size_mb = int(folder_size(src_folder) // (1024 * 1024))
@@ -49934,7 +51516,7 @@ def _compute_scan_track_reconciliation(scan_id: int | None, detected_total: int)
     moved_incomplete = 0
     con = None
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=20)
+        con = _open_db(str(STATE_DB_FILE), timeout=20)
         cur = con.cursor()
         cur.execute("PRAGMA table_info(scan_moves)")
         move_cols = [r[1] for r in cur.fetchall()]
@@ -50132,7 +51714,7 @@ def _mark_broken_from_dupe_groups(
             for p in folder_path.rglob("*"):
                 if not p.is_file():
                     continue
-                if not AUDIO_RE.search(p.name):
+                if not _is_audio_name(p.name):
                     continue
                 idx = _parse_track_idx(p.name)
                 if idx > 0:
@@ -50431,6 +52013,7 @@ def background_scan():
         state["scan_pipeline_flags"] = dict(pipeline_flags_requested)
         state["scan_pipeline_async"] = bool(pipeline_async_enabled)
         state["scan_pipeline_sync_target"] = str(pipeline_flags.get("sync_target") or "none")
+    _notify_progress_event()
 
     try:
         if _get_library_mode() == "files" and scan_type == "full":
@@ -50625,6 +52208,8 @@ def background_scan():
             state["scan_step_progress"] = 0
             # scan_step_total set after _reload_auto_move_from_db() so AUTO_MOVE_DUPES is current
             state["duplicates"].clear()
+            _bump_duplicates_version()
+            _clear_scan_group_events()
             # Initialize scan details tracking
             state["scan_artists_processed"] = 0
             state["scan_artists_total"] = total_artists
@@ -50776,7 +52361,7 @@ def background_scan():
             state["scan_pipeline_sync_target"] = str(pipeline_flags.get("sync_target") or "none")
 
         # Create scan history entry
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         cur = con.cursor()
         cur.execute("PRAGMA table_info(scan_history)")
         scan_cols = [r[1] for r in cur.fetchall()]
@@ -50829,7 +52414,7 @@ def background_scan():
         _set_resume_run_status(resume_run_id, "running", scan_id=scan_id)
 
         # Clear scan_editions for this scan_id so only the latest run's data is stored
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         con.execute("DELETE FROM scan_editions WHERE scan_id = ?", (scan_id,))
         con.execute("DELETE FROM scan_pipeline_trace WHERE scan_id = ?", (scan_id,))
         con.execute("DELETE FROM duplicates_loser")
@@ -50844,36 +52429,65 @@ def background_scan():
         scan_incremental_writer_thread = None
 
         def _scan_incremental_writer():
-            while True:
-                item = scan_incremental_queue.get()
-                if item is None:
-                    break
-                sid, aname, grps, eds = item
-                try:
-                    save_scan_artist_to_db(aname, grps)
-                    save_scan_editions_artist_to_db(sid, aname, eds)
-                    save_scan_pipeline_trace_artist_to_db(sid, aname, eds, grps)
-                    logging.debug(
-                        "Incremental persist: %s (%d groups, %d editions)",
-                        aname, len(grps), len(eds),
-                    )
-                    with lock:
-                        update_scan_history_incremental(
-                            sid,
-                            artists_processed=state.get("scan_artists_processed", 0),
-                            duplicates_found=sum(len(g) for g in state["duplicates"].values()),
-                            duplicate_groups_count=state.get("scan_duplicate_groups_count", 0),
-                            total_duplicates_count=state.get("scan_total_duplicates_count", 0),
-                            broken_albums_count=state.get("scan_broken_albums_count", 0),
-                            missing_albums_count=state.get("scan_missing_albums_count", 0),
-                            albums_without_artist_image=state.get("scan_albums_without_artist_image", 0),
-                            albums_without_album_image=state.get("scan_albums_without_album_image", 0),
-                            albums_without_complete_tags=state.get("scan_albums_without_complete_tags", 0),
-                            albums_without_mb_id=state.get("scan_albums_without_mb_id", 0),
-                            albums_without_artist_mb_id=state.get("scan_albums_without_artist_mb_id", 0),
-                        )
-                except Exception as e:
-                    logging.warning("Incremental scan persist failed for artist %s: %s", aname, e)
+            # Drain whatever artists are queued (up to SCAN_PERSIST_BATCH_ARTISTS) and write their
+            # duplicate rows in one transaction on a long-lived connection, so a fast scan does not
+            # pay one connect + commit per artist while the UI still sees rows as soon as a batch lands.
+            dupes_con = None
+            stopping = False
+            try:
+                while not stopping:
+                    batch = [scan_incremental_queue.get()]
+                    while len(batch) < SCAN_PERSIST_BATCH_ARTISTS:
+                        try:
+                            batch.append(scan_incremental_queue.get_nowait())
+                        except Empty:
+                            break
+                    if None in batch:
+                        stopping = True
+                        batch = batch[:batch.index(None)]
+                    if not batch:
+                        continue
+                    try:
+                        if dupes_con is None:
+                            dupes_con = _state_connect(30.0)
+                        save_scan_artists_to_db([(aname, grps) for _sid, aname, grps, _eds in batch], con=dupes_con)
+                    except Exception as e:
+                        logging.warning("Incremental duplicates persist failed for %d artist(s): %s", len(batch), e)
+                    for sid, aname, grps, eds in batch:
+                        try:
+                            save_scan_editions_artist_to_db(sid, aname, eds)
+                            save_scan_pipeline_trace_artist_to_db(sid, aname, eds, grps)
+                            logging.debug(
+                                "Incremental persist: %s (%d groups, %d editions)",
+                                aname, len(grps), len(eds),
+                            )
+                        except Exception as e:
+                            logging.warning("Incremental scan persist failed for artist %s: %s", aname, e)
+                    sid = batch[-1][0]
+                    try:
+                        with lock:
+                            update_scan_history_incremental(
+                                sid,
+                                artists_processed=state.get("scan_artists_processed", 0),
+                                duplicates_found=sum(len(g) for g in state["duplicates"].values()),
+                                duplicate_groups_count=state.get("scan_duplicate_groups_count", 0),
+                                total_duplicates_count=state.get("scan_total_duplicates_count", 0),
+                                broken_albums_count=state.get("scan_broken_albums_count", 0),
+                                missing_albums_count=state.get("scan_missing_albums_count", 0),
+                                albums_without_artist_image=state.get("scan_albums_without_artist_image", 0),
+                                albums_without_album_image=state.get("scan_albums_without_album_image", 0),
+                                albums_without_complete_tags=state.get("scan_albums_without_complete_tags", 0),
+                                albums_without_mb_id=state.get("scan_albums_without_mb_id", 0),
+                                albums_without_artist_mb_id=state.get("scan_albums_without_artist_mb_id", 0),
+                            )
+                    except Exception as e:
+                        logging.warning("Incremental scan history update failed: %s", e)
+            finally:
+                if dupes_con is not None:
+                    try:
+                        dupes_con.close()
+                    except Exception:
+                        pass
 
         scan_incremental_writer_thread = threading.Thread(target=_scan_incremental_writer, daemon=True)
         scan_incremental_writer_thread.start()
@@ -51221,7 +52835,10 @@ def background_scan():
         future_to_albums: dict[concurrent.futures.Future, int] = {}
         future_to_artist: dict[concurrent.futures.Future, str] = {}
         future_to_album_ids: dict[concurrent.futures.Future, list[int]] = {}
-        with ThreadPoolExecutor(max_workers=SCAN_THREADS) as executor:
+        # Threads, not processes: workers share `state`/`lock`, the stop/pause events and the
+        # FFprobe/MusicBrainz/AI caches, and spend most of their time in subprocess or HTTP waits
+        # (hence the "auto" worker count above cpu_count, see _auto_scan_threads).
+        with ThreadPoolExecutor(max_workers=SCAN_THREADS, thread_name_prefix="pmda-scan") as executor:
             for primary_id, artist_name, album_ids_list in artists_merged:
                 album_cnt = len(album_ids_list)
                 # Track artist before submitting
@@ -51272,6 +52889,13 @@ def background_scan():
                     stats = {"ai_used": 0, "mb_used": 0}
                     all_editions_by_artist[artist_name] = []
                 finally:
+                    # Build everything that does not touch shared state before taking the lock,
+                    # so worker threads updating per-album status wait as little as possible.
+                    n_albums = album_cnt
+                    n_grps = stats.get("duplicate_groups_count", 0)
+                    n_broken = stats.get("broken_albums_count", 0)
+                    n_mb = max(0, n_albums - stats.get("albums_without_mb_id", 0))
+                    step_line = f"{artist_name}: {n_albums} albums, strict matched {n_mb}, broken {n_broken}, duplicate groups {n_grps}"
                     with lock:
                         state["scan_progress"] += album_cnt
                         state["scan_step_progress"] = state.get("scan_step_progress", 0) + album_cnt  # compare step: 1 per album
@@ -51331,13 +52955,7 @@ def background_scan():
                             del state["scan_active_artists"][artist_name]
                         # Append one line to steps log for this artist (bounded to avoid unbounded growth)
                         step_log = state.get("scan_steps_log") or []
-                        n_albums = album_cnt
-                        n_grps = stats.get("duplicate_groups_count", 0)
-                        n_broken = stats.get("broken_albums_count", 0)
-                        n_mb = max(0, n_albums - stats.get("albums_without_mb_id", 0))
-                        step_log.append(
-                            f"{artist_name}: {n_albums} albums, strict matched {n_mb}, broken {n_broken}, duplicate groups {n_grps}"
-                        )
+                        step_log.append(step_line)
                         # Keep only the latest 200 entries so JSON payloads and DB rows stay small
                         if len(step_log) > 200:
                             step_log = step_log[-200:]
@@ -51345,8 +52963,12 @@ def background_scan():
                         if groups:
                             all_results[artist_name] = groups
                             state["duplicates"][artist_name] = groups
-                        # Enqueue for incremental persist (duplicates + scan_editions + scan_history)
-                        scan_incremental_queue.put((scan_id, artist_name, groups, all_editions_by_artist.get(artist_name, [])))
+                            _bump_duplicates_version()
+                    if groups:
+                        _publish_scan_group_event(artist_name, groups)
+                    _notify_progress_event()
+                    # Enqueue for incremental persist (duplicates + scan_editions + scan_history)
+                    scan_incremental_queue.put((scan_id, artist_name, groups, all_editions_by_artist.get(artist_name, [])))
                     if _get_library_mode() == "files":
                         _refresh_files_album_scan_cache_from_editions(
                             all_editions_by_artist.get(artist_name, []),
@@ -51537,25 +53159,29 @@ def background_scan():
             with lock:
                 state["scan_step_progress"] = state.get("scan_step_progress", 0) + 1
         
-        # Final pass: any group still with needs_ai and no best/losers -> run AI (no heuristic fallback)
+        # Final pass: any group still with needs_ai and no best/losers -> run AI (no heuristic fallback).
+        # Dispatched through the same bounded worker pool as the main AI batch so leftover groups
+        # overlap their provider latency instead of running one request at a time.
         fallback_count = 0
+        leftover_positions: dict[tuple, tuple[str, int]] = {}
+        leftover_groups: list[dict] = []
         for artist_name, groups in list(all_results.items()):
             for i, g in enumerate(groups):
                 if g.get("needs_ai", False) and "best" not in g and "editions" in g:
                     editions = g["editions"]
                     if len(editions) >= 2:
-                        best = choose_best(editions, defer_ai=False)
-                        if best:
-                            losers = [e for e in editions if e["album_id"] != best["album_id"]]
-                            all_results[artist_name][i] = {
-                                "artist": artist_name,
-                                "album_id": best["album_id"],
-                                "best": best,
-                                "losers": losers,
-                                "fuzzy": g.get("fuzzy", False),
-                                "needs_ai": False,
-                            }
-                            fallback_count += 1
+                        key = (artist_name, tuple(sorted(int(e.get("album_id") or 0) for e in editions)))
+                        leftover_positions[key] = (artist_name, i)
+                        leftover_groups.append({**g, "artist": g.get("artist") or artist_name})
+        if leftover_groups:
+            for res in process_ai_groups_batch(leftover_groups, max_workers=AI_BATCH_SIZE, track_progress=False):
+                ids = tuple(sorted(int(e.get("album_id") or 0) for e in [res["best"]] + res["losers"]))
+                pos = leftover_positions.get((res["artist"], ids))
+                if pos is None:
+                    continue
+                target_artist, target_index = pos
+                all_results[target_artist][target_index] = res
+                fallback_count += 1
         if fallback_count:
             logging.info("Final pass: applied AI selection to %d group(s) that had no best/losers.", fallback_count)
             with lock:
@@ -51625,12 +53251,21 @@ def background_scan():
                 scan_post_worker_thread.join(timeout=600)
             except Exception:
                 logging.debug("Post-process queue shutdown in finally failed", exc_info=True)
+        # Bundles not consumed by the workers (skipped/cancelled artists) would otherwise stay
+        # in memory until the next Plex scan plan replaces them.
+        _clear_plex_album_bundles()
+        # Streams reload the full list when scanning flips to False; the deltas are not needed.
+        _clear_scan_group_events()
         try:
             save_scan_to_db(all_results)
             with lock:
                 state["duplicates"] = all_results
         except Exception as e:
             logging.warning("save_scan_to_db in finally failed: %s", e)
+        try:
+            prune_folder_meta()
+        except Exception as e:
+            logging.debug("prune_folder_meta in finally failed: %s", e)
         try:
             _scan_id = state.get("scan_id")
             if _scan_id and all_editions_by_artist is not None:
@@ -51813,7 +53448,7 @@ def background_scan():
         
         # Update scan history entry (summary_json etc.); only then mark scan done
         if scan_id:
-            con = sqlite3.connect(str(STATE_DB_FILE))
+            con = _open_db(str(STATE_DB_FILE))
             cur = con.cursor()
             duration = int(end_time - scan_start_epoch) if scan_start_epoch else None
             with lock:
@@ -51874,6 +53509,7 @@ def background_scan():
             ai_tokens_total = 0
             ai_cost_usd_total = 0.0
             ai_unpriced_calls = 0
+            _audio_cache_writes_wait_for_idle()
             try:
                 _ai_usage_wait_for_idle(max_wait_sec=2.0)
                 ai_cost_summary = _ai_scan_cost_summary(
@@ -52285,7 +53921,7 @@ def background_scan():
             # whole pending-changes table after any successful scan.
             cleared = 0
             try:
-                con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+                con = _open_db(str(STATE_DB_FILE), timeout=10)
                 cur = con.cursor()
                 cur.execute("DELETE FROM files_pending_changes")
                 cleared = int(cur.rowcount or 0)
@@ -52359,7 +53995,7 @@ def background_scan():
             scan_id_for_improve = scan_id
             if scan_id_for_improve is not None:
                 try:
-                    con = sqlite3.connect(str(STATE_DB_FILE))
+                    con = _open_db(str(STATE_DB_FILE))
                     cur = con.cursor()
                     # Include all albums from the current scan so improve-all can enrich tags/covers
                     # even when there is no MusicBrainz ID yet (e.g. Bandcamp/Last.fm-only matches, or new REQUIRED_TAGS like "genre").
@@ -52407,7 +54043,7 @@ def background_scan():
             # Fallback to duplicates_best only in Plex mode.
             if not best_albums and current_mode != "files":
                 try:
-                    con = sqlite3.connect(str(STATE_DB_FILE))
+                    con = _open_db(str(STATE_DB_FILE))
                     cur = con.cursor()
                     cur.execute(
                         "SELECT artist, album_id, title_raw, album_norm, folder, meta_json FROM duplicates_best"
@@ -52500,6 +54136,7 @@ def background_scan():
             state["scan_auto_trigger"] = None
             state["scan_scheduler_run_id"] = None
             state["scanning"] = False
+        _notify_progress_event()
         if scan_status == "completed" and _get_library_mode() == "files":
             try:
                 _refresh_scan_history_from_published(scan_id)
@@ -52629,6 +54266,7 @@ def background_dedupe(all_groups: List[dict]):
             dedupe_current_group=None,
             dedupe_last_write=None,
         )
+    _notify_progress_event()
 
     total_moved = 0
     removed_count = 0
@@ -52643,60 +54281,95 @@ def background_dedupe(all_groups: List[dict]):
             if p:
                 best_folders.add(str(p))
 
-    for g in all_groups:
-        best = g.get("best", {})
-        losers = g.get("losers", [])
-        artist = g["artist"]
-        album_title = best.get("title_raw", "")
-        num_dupes = 1 + len(losers)
-        # Ensure folder values are str for JSON (edition dict may store Path)
-        current_group = {
-            "artist": artist,
-            "album": album_title,
-            "num_dupes": num_dupes,
-            "winner": {
-                "title_raw": best.get("title_raw", ""),
-                "album_id": best.get("album_id"),
-                "folder": str(best.get("folder") or ""),
-            },
-            "losers": [
-                {"title_raw": e.get("title_raw", ""), "album_id": e.get("album_id"), "folder": str(e.get("folder") or "")}
-                for e in losers
-            ],
-            "destination": str(dupe_root),
-            "status": "moving",
-        }
-        with lock:
-            state["dedupe_current_group"] = current_group
+    # Processed groups leave state/DB once per run of same-artist groups (flushed when the
+    # artist changes and at the end) instead of rebuilding the artist's list after every group.
+    # Callers may pass copies (scan history reload, scheduler, pipeline auto-dedupe), so groups
+    # are matched back to state["duplicates"] by their best album_id, not by object identity.
+    pending_state_ids: dict[str, set] = defaultdict(set)
+    pending_db_groups: list[tuple[str, int]] = []
 
-        moved = perform_dedupe(g, best_folders=best_folders)
-        removed_count += len(moved)
-        group_saved = sum(item["size"] for item in moved)
-        total_moved += group_saved
-        artists_to_refresh.add(g["artist"])
+    def _group_state_key(group: dict):
+        best_id = (group.get("best") or {}).get("album_id")
+        if best_id is None:
+            return ("id", id(group))
+        try:
+            return ("album", int(best_id))
+        except (TypeError, ValueError):
+            return ("album", str(best_id))
 
-        with lock:
-            state["dedupe_progress"] += 1
-            state["dedupe_saved_this_run"] = state.get("dedupe_saved_this_run", 0) + group_saved
-            state["dedupe_current_group"] = None
-            logging.debug(f"background_dedupe(): processed group for '{artist}|{album_title}', dedupe_progress={state['dedupe_progress']}/{state['dedupe_total']}")
-            # Remove this group from in-memory state so the list shrinks on next /api/duplicates
-            # Only remove if still present (same ref can appear twice from AI merge, avoid ValueError)
-            if artist in state["duplicates"]:
-                lst = state["duplicates"][artist]
-                if g in lst:
-                    lst.remove(g)
-                if not state["duplicates"][artist]:
-                    del state["duplicates"][artist]
-        # Remove from DB so /api/duplicates (and reload) shows shrinking list
-        best_album_id = best.get("album_id")
-        loser_album_ids = [e.get("album_id") for e in losers if e.get("album_id") is not None]
-        if best_album_id is not None:
-            _remove_dedupe_group_from_db(artist, best_album_id, loser_album_ids)
+    def _flush_processed_groups() -> None:
+        if pending_state_ids:
+            with lock:
+                for art, group_keys in pending_state_ids.items():
+                    # Drops every occurrence (same group can appear twice from AI merge).
+                    lst = state["duplicates"].get(art)
+                    if lst is None:
+                        continue
+                    lst[:] = [x for x in lst if _group_state_key(x) not in group_keys]
+                    if not lst:
+                        del state["duplicates"][art]
+                _bump_duplicates_version()
+            pending_state_ids.clear()
+        if pending_db_groups:
+            # Remove from DB so /api/duplicates (and reload) shows shrinking list
+            _remove_dedupe_groups_from_db(pending_db_groups)
+            pending_db_groups.clear()
+
+    # Groups are moved one at a time on purpose: same-device moves are cheap renames, cross-device
+    # copies are bound by the target disk, and /dupes destination naming is not race-free. The
+    # I/O-heavy per-artist work (tags, SQL, providers) is already parallel in the scan pool.
+    try:
+        for g in all_groups:
+            if pending_state_ids and g["artist"] not in pending_state_ids:
+                _flush_processed_groups()
+            best = g.get("best", {})
+            losers = g.get("losers", [])
+            artist = g["artist"]
+            album_title = best.get("title_raw", "")
+            num_dupes = 1 + len(losers)
+            # Ensure folder values are str for JSON (edition dict may store Path)
+            current_group = {
+                "artist": artist,
+                "album": album_title,
+                "num_dupes": num_dupes,
+                "winner": {
+                    "title_raw": best.get("title_raw", ""),
+                    "album_id": best.get("album_id"),
+                    "folder": str(best.get("folder") or ""),
+                },
+                "losers": [
+                    {"title_raw": e.get("title_raw", ""), "album_id": e.get("album_id"), "folder": str(e.get("folder") or "")}
+                    for e in losers
+                ],
+                "destination": str(dupe_root),
+                "status": "moving",
+            }
+            with lock:
+                state["dedupe_current_group"] = current_group
+
+            moved = perform_dedupe(g, best_folders=best_folders)
+            removed_count += len(moved)
+            group_saved = sum(item["size"] for item in moved)
+            total_moved += group_saved
+            artists_to_refresh.add(g["artist"])
+
+            with lock:
+                state["dedupe_progress"] += 1
+                state["dedupe_saved_this_run"] = state.get("dedupe_saved_this_run", 0) + group_saved
+                state["dedupe_current_group"] = None
+                dedupe_progress = state["dedupe_progress"]
+                dedupe_total = state["dedupe_total"]
+            _notify_progress_event()
+            logging.debug(f"background_dedupe(): processed group for '{artist}|{album_title}', dedupe_progress={dedupe_progress}/{dedupe_total}")
+            pending_state_ids[artist].add(_group_state_key(g))
+            best_album_id = best.get("album_id")
+            if best_album_id is not None:
+                pending_db_groups.append((artist, best_album_id))
+    finally:
+        _flush_processed_groups()
 
     # Update stats in DB
-    increment_stat("space_saved", total_moved)
-    increment_stat("removed_dupes", removed_count)
+    increment_stats({"space_saved": total_moved, "removed_dupes": removed_count})
     notify_discord(
         f"🟢 Deduplication finished: {removed_count} duplicate folders moved, "
         f"{total_moved}  MB reclaimed."
@@ -52705,22 +54378,13 @@ def background_dedupe(all_groups: List[dict]):
 
     # Refresh Plex for all affected artists (each section in SECTION_IDS)
     section_ids = getattr(sys.modules[__name__], "SECTION_IDS", []) or []
-    for artist in artists_to_refresh:
-        letter = quote_plus(artist[0].upper())
-        art_enc = quote_plus(artist)
-        for sid in section_ids:
-            try:
-                logging.info(
-                    "background_dedupe(): requesting Plex refresh for artist '%s' in section %s (path=/music/matched/%s/%s)",
-                    artist,
-                    sid,
-                    letter,
-                    art_enc,
-                )
-                plex_api(f"/library/sections/{sid}/refresh?path=/music/matched/{letter}/{art_enc}", method="GET")
-                plex_api(f"/library/sections/{sid}/emptyTrash", method="PUT")
-            except Exception as e:
-                logging.warning(f"background_dedupe(): plex refresh/emptyTrash failed for artist={artist} section={sid}: {e}")
+    if section_ids and artists_to_refresh:
+        logging.info(
+            "background_dedupe(): requesting Plex refresh for %d artist(s) in section(s) %s",
+            len(artists_to_refresh),
+            section_ids,
+        )
+        _plex_refresh_artists(artists_to_refresh, section_ids, caller="background_dedupe()")
 
     with lock:
         scan_id = state.get("scan_id")
@@ -52732,24 +54396,114 @@ def background_dedupe(all_groups: List[dict]):
         # For "Last scan summary": dupes moved and space saved in this run (when auto-move was used)
         state["last_dedupe_moved_count"] = removed_count
         state["last_dedupe_saved_mb"] = total_moved
+    _notify_progress_event()
     if scan_id is not None:
         update_dedupe_scan_summary(scan_id, total_moved, removed_count)
     logging.debug("background_dedupe(): deduping completed")
 
 # ─────────────────────────────────── SUPPORT FUNCTIONS ──────────────────────────────────
+# Thumbs whose Plex artwork version cannot be read (Plex DB unavailable) are refetched after this.
+_PLEX_THUMB_UNVERSIONED_TTL_SEC = 24 * 3600
+
+
+def _plex_thumb_cache_path(plex_host: str, album_id: int, version: Optional[str] = None) -> Path:
+    """
+    On-disk location of a fetched Plex album thumb (namespaced per Plex server). *version* is
+    Plex's artwork reference for the album, so a changed poster lands in a new file.
+    """
+    host_key = hashlib.sha1((plex_host or "").encode("utf-8")).hexdigest()[:12]
+    name = f"{int(album_id)}.jpg"
+    if version:
+        name = f"{int(album_id)}-{hashlib.sha1(version.encode('utf-8')).hexdigest()[:12]}.jpg"
+    return _media_cache_root_dir() / "plex_thumbs" / host_key / name
+
+
+def _plex_album_thumb_version(album_id: int) -> Optional[str]:
+    """Plex's current artwork reference (user_thumb_url) for *album_id*, or None when unknown."""
+    try:
+        with PLEX_POOL.acquire() as db_plx:
+            row = db_plx.execute(
+                "SELECT user_thumb_url FROM metadata_items WHERE id = ?", (int(album_id),)
+            ).fetchone()
+    except Exception as e:
+        logging.debug("Plex thumb %s: artwork version lookup failed: %s", album_id, e)
+        return None
+    return (row[0] or None) if row else None
+
+
+def cache_cover(album_id: int) -> Optional[Path]:
+    """
+    Make sure the Plex thumb of *album_id* is on disk under MEDIA_CACHE_ROOT/plex_thumbs
+    and return its path (fetched from Plex once per artwork version, then served from disk).
+    None on failure.
+    """
+    try:
+        aid = int(album_id)
+    except (TypeError, ValueError):
+        return None
+    if aid <= 0:
+        return None
+    version = _plex_album_thumb_version(aid)
+    cache_path = _plex_thumb_cache_path(str(PLEX_HOST or ""), aid, version)
+    try:
+        st = cache_path.stat()
+        if st.st_size > 0 and (version or time.time() - st.st_mtime < _PLEX_THUMB_UNVERSIONED_TTL_SEC):
+            return cache_path
+    except OSError:
+        pass
+    try:
+        resp = plex_api(f"/library/metadata/{aid}/thumb")
+    except Exception as e:
+        logging.debug("Plex thumb %s: fetch failed: %s", aid, e)
+        return None
+    if resp.status_code != 200 or not resp.content:
+        logging.debug("Plex thumb %s: HTTP %s", aid, resp.status_code)
+        return None
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer: concurrent misses for the same album must not interleave.
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f".{aid}-", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(resp.content)
+        os.replace(tmp_name, cache_path)
+        tmp_name = None
+    except OSError as e:
+        logging.debug("Could not write Plex thumb cache %s: %s", cache_path, e)
+        return None
+    finally:
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    # Drop this album's thumbs for older artwork versions.
+    for stale in cache_path.parent.glob(f"{aid}*.jpg"):
+        if stale != cache_path and stale.name.split(".", 1)[0].split("-", 1)[0] == str(aid):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return cache_path
+
+
 def fetch_cover_as_base64(album_id: int) -> Optional[str]:
     """
-    Fetch album thumb from Plex as a base64 data‐URI.
+    Fetch album thumb from Plex as a base64 data‐URI (disk-cached via cache_cover).
+    Only for callers that need the bytes inline (vision prompts, editions outside the
+    Files index); UI payloads should link to /api/plex/album/<id>/thumb instead.
     Returns None on failure.
     """
+    path = cache_cover(album_id)
+    if path is None:
+        return None
     try:
-        resp = plex_api(f"/library/metadata/{album_id}/thumb")
-        if resp.status_code == 200:
-            b64 = base64.b64encode(resp.content).decode("utf-8")
-            return f"data:image/jpeg;base64,{b64}"
-    except Exception:
-        pass
-    return None
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    return "data:image/jpeg;base64," + base64.b64encode(raw).decode("ascii")
 
 
 def _files_forget_album_folder_global(folder: Path | str) -> bool:
@@ -52771,7 +54525,7 @@ def _files_forget_album_folder_global(folder: Path | str) -> bool:
 
     # 1) SQLite scan/published caches
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         cur.execute("DELETE FROM files_album_scan_cache WHERE folder_path = ?", (key,))
         changed = changed or int(cur.rowcount or 0) > 0
@@ -52922,15 +54676,26 @@ def _duplicate_cover_data_for_edition(edition_payload: dict) -> Optional[str]:
 
 
 def _next_available_folder_path(base: Path) -> Path:
+    """
+    Return *base*, or the first free "<name> (N)" sibling when it is taken.
+    Lists the parent once instead of stat()ing every candidate, which matters once a
+    dupes folder has accumulated many copies of the same album.
+    """
     if not base.exists():
         return base
     parent = base.parent
     stem = base.name
+    try:
+        with os.scandir(parent) as it:
+            taken = {entry.name for entry in it}
+    except OSError:
+        taken = set()
     idx = 1
     while True:
-        candidate = parent / f"{stem} ({idx})"
-        if not candidate.exists():
-            return candidate
+        name = f"{stem} ({idx})"
+        # The final exists() also catches case-insensitive filesystems and races.
+        if name not in taken and not (parent / name).exists():
+            return parent / name
         idx += 1
 
 
@@ -53089,6 +54854,40 @@ def perform_dedupe(group: dict, best_folders: set = None, manual_override: bool
         best_folder = None
 
     num_losers = len(group["losers"])
+    plex_retire_futures: dict = {}
+    plex_retire_enabled = bool(PLEX_HOST and PLEX_TOKEN)
+    with lock:
+        scan_id = state.get("scan_id")
+    # Everything the scan_moves rows say about the winner is the same for every loser.
+    winner = group.get("best") or {}
+    winner_album_id = int(winner.get("album_id") or 0)
+    winner_title = str(winner.get("title_raw") or winner.get("album_norm") or "")
+    winner_path = str(winner.get("folder") or "")
+    winner_fmt_text = str(winner.get("fmt_text") or "")
+    decision_provider = _normalize_identity_provider(
+        str(
+            winner.get("strict_match_provider")
+            or (winner.get("meta") or {}).get("primary_metadata_source")
+            or ""
+        )
+    )
+    decision_reason = str(group.get("dupe_signal") or "").strip() or str(winner.get("rationale") or "").strip()
+    decision_confidence = float(winner.get("strict_tracklist_score") or 0.0)
+    if bool(winner.get("strict_match_verified")):
+        decision_confidence = max(decision_confidence, 1.0)
+    move_analysis = {
+        "dupe_signal": str(group.get("dupe_signal") or ""),
+        "no_move": bool(group.get("no_move")),
+        "manual_review": bool(group.get("manual_review")),
+        "same_folder": bool(group.get("same_folder")),
+        "rationale": str(winner.get("rationale") or ""),
+        "strict_match_verified": bool(winner.get("strict_match_verified")),
+        "strict_match_provider": str(winner.get("strict_match_provider") or ""),
+        "strict_reject_reason": str(winner.get("strict_reject_reason") or ""),
+        "strict_tracklist_score": float(winner.get("strict_tracklist_score") or 0.0),
+        "match_verified_by_ai": bool(winner.get("match_verified_by_ai")),
+        "dupe_evidence": list(winner.get("dupe_evidence") or []),
+    }
     for idx, loser in enumerate(group["losers"], 1):
         src_folder = Path(loser["folder"])
         # Never move a folder that is any group's best (safeguard when duplicate groups exist)
@@ -53108,14 +54907,7 @@ def perform_dedupe(group: dict, best_folders: set = None, manual_override: bool
             artist_hint=str(artist or ""),
             album_hint=str(loser.get("title_raw") or src_folder.name or ""),
         )
-        dst = base_dst
-        counter = 1
-        while dst.exists():
-            candidate = base_dst.parent / f"{base_dst.name} ({counter})"
-            if not candidate.exists():
-                dst = candidate
-                break
-            counter += 1
+        dst = _next_available_folder_path(base_dst)
         dst.parent.mkdir(parents=True, exist_ok=True)
 
         logging.info("Moving dupe %s/%s: %s  →  %s", idx, num_losers, src_folder, dst)
@@ -53145,95 +54937,59 @@ def perform_dedupe(group: dict, best_folders: set = None, manual_override: bool
             logging.warning("perform_dedupe(): %s was not fully removed (left‑over non‑audio files?)", src_folder)
             notify_discord(f"⚠ Folder **{src_folder.name}** could not be fully removed (non‑audio files locked?). Check manually.")
 
-        size_mb = folder_size(dst) // (1024 * 1024)
+        # Size is known from the scan (duplicates_loser.size_mb); only walk the folder when missing.
+        known_size = loser.get("size")
+        size_mb = int(known_size) if isinstance(known_size, (int, float)) and known_size > 0 else folder_size(dst) // (1024 * 1024)
         fmt_text = loser.get("fmt_text", loser.get("fmt", ""))
         br_kbps = loser["br"] // 1000
         sr = loser["sr"]
         bd = loser["bd"]
 
         loser_id = loser["album_id"]
-        try:
-            plex_api(f"/library/metadata/{loser_id}/trash", method="PUT")
-            time.sleep(0.3)
-            plex_api(f"/library/metadata/{loser_id}", method="DELETE")
-        except Exception as e:
-            logging.warning(f"perform_dedupe(): failed to delete Plex metadata for {loser_id}: {e}")
+        if plex_retire_enabled:
+            plex_retire_futures[_PLEX_RETIRE_EXECUTOR.submit(_plex_retire, loser_id)] = loser_id
 
         # Record move in scan_moves table
         moved_at = time.time()
-        scan_id = None
-        with lock:
-            scan_id = state.get("scan_id")
-        
         if scan_id:
             try:
-                con = sqlite3.connect(str(STATE_DB_FILE))
-                cur = con.cursor()
-                winner = group.get("best") or {}
-                winner_album_id = int(winner.get("album_id") or 0)
-                winner_title = str(winner.get("title_raw") or winner.get("album_norm") or "")
-                winner_path = str(winner.get("folder") or "")
-                decision_provider = _normalize_identity_provider(
-                    str(
-                        winner.get("strict_match_provider")
-                        or (winner.get("meta") or {}).get("primary_metadata_source")
-                        or ""
-                    )
-                )
-                decision_reason = str(group.get("dupe_signal") or "").strip() or str(winner.get("rationale") or "").strip()
-                decision_confidence = float(winner.get("strict_tracklist_score") or 0.0)
-                if bool(winner.get("strict_match_verified")):
-                    decision_confidence = max(decision_confidence, 1.0)
-                _insert_scan_move_row(
-                    cur,
-                    scan_id=int(scan_id),
-                    artist=str(artist or ""),
-                    album_id=int(loser_id or 0),
-                    original_path=str(src_folder),
-                    moved_to_path=str(dst),
-                    size_mb=int(size_mb or 0),
-                    moved_at=moved_at,
-                    album_title=str(loser.get("title_raw") or best_title or ""),
-                    fmt_text=str(fmt_text or ""),
-                    move_reason="dedupe",
-                    winner_album_id=winner_album_id or None,
-                    winner_title=winner_title,
-                    winner_path=winner_path,
-                    decision_source="pipeline_dedupe",
-                    decision_provider=decision_provider,
-                    decision_reason=decision_reason,
-                    decision_confidence=decision_confidence,
-                    details={
-                        "kind": "dedupe",
-                        "winner": {
-                            "album_id": winner_album_id,
-                            "title": winner_title,
-                            "folder": winner_path,
-                            "fmt_text": str(winner.get("fmt_text") or ""),
-                        },
-                        "moved": {
-                            "album_id": int(loser_id or 0),
-                            "title": str(loser.get("title_raw") or best_title or ""),
-                            "folder": str(src_folder),
-                            "fmt_text": str(fmt_text or ""),
-                        },
-                        "analysis": {
-                            "dupe_signal": str(group.get("dupe_signal") or ""),
-                            "no_move": bool(group.get("no_move")),
-                            "manual_review": bool(group.get("manual_review")),
-                            "same_folder": bool(group.get("same_folder")),
-                            "rationale": str(winner.get("rationale") or ""),
-                            "strict_match_verified": bool(winner.get("strict_match_verified")),
-                            "strict_match_provider": str(winner.get("strict_match_provider") or ""),
-                            "strict_reject_reason": str(winner.get("strict_reject_reason") or ""),
-                            "strict_tracklist_score": float(winner.get("strict_tracklist_score") or 0.0),
-                            "match_verified_by_ai": bool(winner.get("match_verified_by_ai")),
-                            "dupe_evidence": list(winner.get("dupe_evidence") or []),
+                with STATE_POOL.acquire() as con, con:
+                    _insert_scan_move_row(
+                        con.cursor(),
+                        scan_id=int(scan_id),
+                        artist=str(artist or ""),
+                        album_id=int(loser_id or 0),
+                        original_path=str(src_folder),
+                        moved_to_path=str(dst),
+                        size_mb=int(size_mb or 0),
+                        moved_at=moved_at,
+                        album_title=str(loser.get("title_raw") or best_title or ""),
+                        fmt_text=str(fmt_text or ""),
+                        move_reason="dedupe",
+                        winner_album_id=winner_album_id or None,
+                        winner_title=winner_title,
+                        winner_path=winner_path,
+                        decision_source="pipeline_dedupe",
+                        decision_provider=decision_provider,
+                        decision_reason=decision_reason,
+                        decision_confidence=decision_confidence,
+                        details={
+                            "kind": "dedupe",
+                            "winner": {
+                                "album_id": winner_album_id,
+                                "title": winner_title,
+                                "folder": winner_path,
+                                "fmt_text": winner_fmt_text,
+                            },
+                            "moved": {
+                                "album_id": int(loser_id or 0),
+                                "title": str(loser.get("title_raw") or best_title or ""),
+                                "folder": str(src_folder),
+                                "fmt_text": str(fmt_text or ""),
+                            },
+                            "analysis": move_analysis,
                         },
-                    },
-                )
-                con.commit()
-                con.close()
+                    )
             except Exception as e:
                 logging.warning(f"perform_dedupe(): failed to record move in scan_moves: {e}")
 
@@ -53245,19 +55001,35 @@ def perform_dedupe(group: dict, best_folders: set = None, manual_override: bool
             "br":        br_kbps,
             "sr":        sr,
             "bd":        bd,
-            "thumb_data": None
+            "best_album_id": None,
+            "thumb_url": ""
         })
 
+    for fut in as_completed(plex_retire_futures):
+        try:
+            fut.result()
+        except Exception as e:
+            logging.warning(f"perform_dedupe(): failed to delete Plex metadata for {plex_retire_futures[fut]}: {e}")
+
     # Fetch cover after moves so we do not block the first group on Plex API (fixes stuck 1/N dedupe).
     try:
         _normalize_winner_folder_to_canonical_root(group)
     except Exception:
         logging.debug("Winner canonical placement failed for group %s", group.get("artist"), exc_info=True)
 
-    # Fetch cover after moves so we do not block the first group on Plex API (fixes stuck 1/N dedupe).
-    cover_data = fetch_cover_as_base64(group["best"]["album_id"]) if group.get("best", {}).get("album_id") else None
+    # Hand the client the kept edition's id and a cover URL it can load (and cache) itself,
+    # instead of inlining a base64 thumb per moved item.
+    best = group.get("best") or {}
+    best_album_id = best.get("album_id")
+    cover_url = ""
+    if best_album_id:
+        try:
+            cover_url = _duplicate_album_thumb_url(int(best_album_id), best.get("folder"))
+        except Exception:
+            cover_url = ""
     for m in moved_items:
-        m["thumb_data"] = cover_data
+        m["best_album_id"] = best_album_id
+        m["thumb_url"] = cover_url
 
     return moved_items
 
@@ -53269,11 +55041,9 @@ def _build_card_list(dup_dict) -> list[dict]:
     cards expected by both the main page and /api/duplicates.
     """
     cards = []
+    # Opened on first need only: scanned groups carry track_count, so most rebuilds never touch Plex.
     db_conn = None
-    try:
-        db_conn = plex_connect()
-    except Exception:
-        pass
+    db_conn_tried = False
     for artist, groups in dup_dict.items():
         for g in groups:
             if "best" not in g or "losers" not in g:
@@ -53292,11 +55062,8 @@ def _build_card_list(dup_dict) -> list[dict]:
             folder_path = path_for_fs_access(Path(best["folder"]))
             if not folder_path.exists():
                 continue
-            best_fmt = best.get("fmt_text", get_primary_format(folder_path))
-            formats = [best_fmt] + [
-                loser.get("fmt", get_primary_format(path_for_fs_access(Path(loser["folder"]))))
-                for loser in existing_losers
-            ]
+            best_fmt = _edition_stored_format(best)
+            formats = [best_fmt] + [_edition_stored_format(loser) for loser in existing_losers]
             display_title = best["album_norm"].title()
             # Ensure used_ai groups have provider/model for METHOD column (backfill from globals if missing)
             used_ai = best.get("used_ai", False)
@@ -53317,6 +55084,12 @@ def _build_card_list(dup_dict) -> list[dict]:
                 track_count = int(best["track_count"])
             else:
                 track_count = 0
+                if not db_conn_tried:
+                    db_conn_tried = True
+                    try:
+                        db_conn = plex_connect()
+                    except Exception:
+                        db_conn = None
                 if db_conn:
                     try:
                         track_count = len(get_tracks(db_conn, best["album_id"]))
@@ -53349,6 +55122,35 @@ def _build_card_list(dup_dict) -> list[dict]:
     return cards
 
 
+# Last card list built from state["duplicates"]; reused until that dict is replaced or
+# state["duplicates_version"] moves (bumped by every in-place mutation).
+_DUPLICATE_CARDS_CACHE: dict[str, Any] = {"dups": None, "version": None, "cards": None}
+
+
+def _bump_duplicates_version() -> None:
+    """Invalidate cached duplicate cards after mutating state["duplicates"] in place. Caller holds `lock`."""
+    state["duplicates_version"] = int(state.get("duplicates_version") or 0) + 1
+
+
+def _cached_card_list() -> list[dict]:
+    """
+    Cards for state["duplicates"], rebuilt only when the duplicates changed. Takes `lock` only
+    to read/publish; the rebuild (filesystem checks, thumb lookups) runs on a snapshot outside it.
+    """
+    cache = _DUPLICATE_CARDS_CACHE
+    with lock:
+        dups = state["duplicates"]
+        version = state.get("duplicates_version")
+        if cache["dups"] is dups and cache["version"] == version and cache["cards"] is not None:
+            return list(cache["cards"])
+        snapshot = {artist: list(groups) for artist, groups in dups.items()}
+    cards = _build_card_list(snapshot)
+    with lock:
+        if state["duplicates"] is dups and state.get("duplicates_version") == version:
+            cache.update({"dups": dups, "version": version, "cards": cards})
+    return list(cards)
+
+
 # --- New scan control endpoints ---
 from flask import Response
 
@@ -53858,6 +55660,17 @@ def _lastfm_auth_url_for_token(token: str, callback_url: str = "") -> str:
     return url
 
 
+def _json_for_inline_script(value: Any) -> str:
+    """json.dumps for a value placed inside an inline <script>: escapes <, >, & and ' so text such as "</script>" cannot end the tag."""
+    return (
+        json.dumps(value)
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+        .replace("'", "\\u0027")
+    )
+
+
 def _lastfm_callback_html(*, ok: bool, message: str, session_name: str = "") -> str:
     safe_message = html.escape(str(message or "").strip() or ("Last.fm connected." if ok else "Last.fm authorization failed."))
     safe_session_name = html.escape(str(session_name or "").strip())
@@ -53905,10 +55718,10 @@ def _lastfm_callback_html(*, ok: bool, message: str, session_name: str = "") ->
       (function() {{
         var payload = {{
           type: 'pmda:lastfm-auth-complete',
-          status: {json.dumps(status)},
-          ok: {json.dumps(bool(ok))},
-          message: {json.dumps(str(message or "").strip())},
-          session_name: {json.dumps(str(session_name or "").strip())}
+          status: {_json_for_inline_script(status)},
+          ok: {_json_for_inline_script(bool(ok))},
+          message: {_json_for_inline_script(str(message or "").strip())},
+          session_name: {_json_for_inline_script(str(session_name or "").strip())}
         }};
         try {{
           if (window.opener && !window.opener.closed) {{
@@ -57886,7 +59699,7 @@ def api_incoming_status():
     pending_by_source: dict[str, int] = {}
     errors: list[str] = []
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=10)
+        con = _open_db(str(STATE_DB_FILE), timeout=10)
         cur = con.cursor()
         if incoming_ids:
             placeholders = ",".join("?" for _ in incoming_ids)
@@ -57997,6 +59810,7 @@ def pause_scan():
         except Exception:
             previous_updated_at = None
     scan_is_paused.set()
+    _notify_progress_event()
     if discovery_running:
         _wait_for_discovery_runtime_update(
             resume_run_id,
@@ -58026,6 +59840,7 @@ def resume_scan():
     requested_scan_type = str(body.get("scan_type") or "").strip().lower()
     scan_should_stop.clear()
     scan_is_paused.clear()
+    _notify_progress_event()
     with lock:
         scanning_now = bool(state.get("scanning") or state.get("scan_starting") or state.get("scan_finalizing"))
         current_scan_type = str(state.get("scan_type") or "full").strip().lower() or "full"
@@ -58142,14 +59957,13 @@ def clear_scan():
     scan editions (Tag Fixer), and last completed scan id.
     Optionally clear audio and MusicBrainz caches.
     """
-    import sqlite3
     data = request.get_json() or {}
     clear_audio_cache = data.get("clear_audio_cache", False)
     clear_mb_cache = data.get("clear_mb_cache", False)
     
     try:
         # Clear all scan-derived data so Unduper, Tag Fixer, Incomplete Albums show nothing
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         cur = con.cursor()
         cur.execute("DELETE FROM duplicates_loser")
         deleted_losers = cur.rowcount
@@ -58201,7 +60015,7 @@ def clear_scan():
 
         # Optionally clear audio cache
         if clear_audio_cache:
-            con = sqlite3.connect(str(CACHE_DB_FILE))
+            con = _open_db(str(CACHE_DB_FILE))
             cur = con.cursor()
             cur.execute("DELETE FROM audio_cache")
             audio_cache_deleted = cur.rowcount
@@ -58212,7 +60026,7 @@ def clear_scan():
         
         # Optionally clear MusicBrainz cache
         if clear_mb_cache:
-            con = sqlite3.connect(str(CACHE_DB_FILE))
+            con = _open_db(str(CACHE_DB_FILE))
             cur = con.cursor()
             cur.execute("DELETE FROM musicbrainz_cache")
             mb_cache_deleted = cur.rowcount
@@ -61616,7 +63430,7 @@ def _apply_settings_in_memory(updates: dict):
         global SCAN_THREADS
         v = updates["SCAN_THREADS"]
         if isinstance(v, str) and str(v).strip().lower() == "auto":
-            SCAN_THREADS = max(1, os.cpu_count() or 4)
+            SCAN_THREADS = _auto_scan_threads()
         else:
             try:
                 SCAN_THREADS = max(1, int(v))
@@ -62972,7 +64786,7 @@ def _build_library_duplicate_group_for_artist_album(artist_name: str, album_id:
             if not tracks:
                 continue
             fmt_score, br, sr, bd, _cache_hit = analyse_format(folder_path)
-            first_audio = next((p for p in folder_path.rglob("*") if AUDIO_RE.search(p.name)), None)
+            first_audio = next((p for p in folder_path.rglob("*") if _is_audio_name(p.name)), None)
             meta_tags = extract_tags(first_audio) if first_audio else {}
             plex_title = album_title(db_conn, aid) or ""
             title_raw, title_source = derive_album_title(plex_title, meta_tags, folder_path, aid)
@@ -62991,9 +64805,8 @@ def _build_library_duplicate_group_for_artist_album(artist_name: str, album_id:
                     "artist": artist_title,
                     "folder": folder_path,
                     "tracks": tracks,
-                    "file_count": sum(1 for f in folder_path.rglob("*") if AUDIO_RE.search(f.name)),
+                    "file_count": sum(1 for f in folder_path.rglob("*") if _is_audio_name(f.name)),
                     "sig": signature(tracks),
-                    "titles": {t.title for t in tracks},
                     "dur": sum(t.dur for t in tracks),
                     "fmt_score": fmt_score,
                     "br": br,
@@ -63082,6 +64895,7 @@ def _find_duplicate_group_by_artist_album(
                 artist_groups = state.setdefault("duplicates", {}).setdefault(artist_norm, [])
                 if not any(_group_contains_album_id(existing, target_id) for existing in artist_groups):
                     artist_groups.append(g)
+                    _bump_duplicates_version()
             return g
 
     if not allow_library_build:
@@ -63091,9 +64905,49 @@ def _find_duplicate_group_by_artist_album(
         with lock:
             artist_groups = state.setdefault("duplicates", {}).setdefault(artist_norm, [])
             artist_groups.append(built)
+            _bump_duplicates_version()
     return built
 
 
+_API_DUPLICATES_SCAN_CACHE: dict[str, Any] = {"key": None, "cards": None}
+_state_data_version_conn: dict[str, Any] = {"path": None, "con": None}
+
+
+def _state_db_data_version() -> Optional[int]:
+    """
+    PRAGMA data_version of the state DB, read on one dedicated connection so the value
+    changes whenever any other connection (e.g. the incremental scan writer) commits.
+    Caller must hold `lock`. Returns None when the DB cannot be read.
+    """
+    path = str(STATE_DB_FILE)
+    con = _state_data_version_conn.get("con")
+    if con is None or _state_data_version_conn.get("path") != path:
+        if con is not None:
+            try:
+                con.close()
+            except Exception:
+                pass
+        try:
+            con = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        except sqlite3.Error:
+            _state_data_version_conn.update({"path": None, "con": None})
+            return None
+        _state_data_version_conn.update({"path": path, "con": con})
+    try:
+        return int(con.execute("PRAGMA data_version").fetchone()[0])
+    except sqlite3.Error:
+        _state_data_version_conn.update({"path": None, "con": None})
+        return None
+
+
+def _conditional_json(payload: Any) -> Response:
+    """jsonify() with an ETag so unchanged polls are answered with an empty 304."""
+    resp = jsonify(payload)
+    resp.headers["Cache-Control"] = "private, no-cache"
+    resp.add_etag()
+    return resp.make_conditional(request)
+
+
 @app.get("/api/duplicates")
 def api_duplicates():
     """
@@ -63109,91 +64963,124 @@ def api_duplicates():
         resp.headers["X-PMDA-Requires-Config"] = "true"
         return resp
     include_library_groups = request.args.get("source", "scan").strip().lower() == "all"
+    cards = None
+    needs_load = False
+    cache_key = None
     with lock:
-        # During scan, always reload from DB so incremental writer updates are visible
-        if state.get("scanning") or not state["duplicates"]:
-            if not state.get("_api_duplicates_load_logged") and not state.get("scanning"):
-                logging.debug("api_duplicates(): loading scan results from DB into memory")
-                state["_api_duplicates_load_logged"] = True
-            state["duplicates"] = load_scan_from_db()
-        cards = _build_card_list(state["duplicates"])
-        if not include_library_groups:
-            return jsonify(cards)
-        scan_keys = set()
-        for artist, groups in state["duplicates"].items():
-            for g in groups:
-                if "best" not in g:
-                    continue
-                norm = (g["best"].get("album_norm") or "").strip().lower()
-                if norm:
-                    scan_keys.add((artist, norm))
-        # Add library-only groups only when explicitly requested (source=all)
-        if cards or scan_keys:
-            library_groups = get_duplicate_groups_from_library()
-            db_plex = None
-            try:
-                db_plex = plex_connect()
-            except Exception:
-                pass
-            for lg in library_groups:
-                artist, norm_title = lg["artist"], (lg["norm_title"] or "").strip().lower()
-                if (artist, norm_title) in scan_keys:
+        scanning = bool(state.get("scanning"))
+        dups_before = state["duplicates"]
+        version_before = state.get("duplicates_version")
+        # During scan, reload from DB so incremental writer updates are visible -- but only when
+        # something was committed since the last reload; otherwise reuse the cards built then.
+        if scanning or not state["duplicates"]:
+            data_version = _state_db_data_version() if scanning else None
+            cache_key = (str(STATE_DB_FILE), data_version) if data_version is not None else None
+            if (
+                cache_key is not None
+                and _API_DUPLICATES_SCAN_CACHE["key"] == cache_key
+                and _API_DUPLICATES_SCAN_CACHE["cards"] is not None
+            ):
+                cards = list(_API_DUPLICATES_SCAN_CACHE["cards"])
+            else:
+                needs_load = True
+                if not state.get("_api_duplicates_load_logged") and not scanning:
+                    logging.debug("api_duplicates(): loading scan results from DB into memory")
+                    state["_api_duplicates_load_logged"] = True
+    # The DB reload and card building hit SQLite and the filesystem: keep them outside `lock`
+    # so progress polling and the scan workers are not queued behind them.
+    if needs_load:
+        loaded = load_scan_from_db()
+        with lock:
+            # A dedupe or another reload may have replaced/edited the groups while we were
+            # reading: only install ours if nothing moved, otherwise serve what is there now.
+            installed = state["duplicates"] is dups_before and state.get("duplicates_version") == version_before
+            if installed:
+                state["duplicates"] = loaded
+        cards = _cached_card_list()
+        if installed:
+            with lock:
+                _API_DUPLICATES_SCAN_CACHE.update({"key": cache_key, "cards": list(cards)})
+    if cards is None:
+        cards = _cached_card_list()
+    if not include_library_groups:
+        return _conditional_json(cards)
+    with lock:
+        dup_snapshot = {artist: list(groups) for artist, groups in state["duplicates"].items()}
+    scan_keys = set()
+    for artist, groups in dup_snapshot.items():
+        for g in groups:
+            if "best" not in g:
+                continue
+            norm = (g["best"].get("album_norm") or "").strip().lower()
+            if norm:
+                scan_keys.add((artist, norm))
+    # Add library-only groups only when explicitly requested (source=all)
+    if cards or scan_keys:
+        library_groups = get_duplicate_groups_from_library()
+        db_plex = None
+        try:
+            db_plex = plex_connect()
+        except Exception:
+            pass
+        for lg in library_groups:
+            artist, norm_title = lg["artist"], (lg["norm_title"] or "").strip().lower()
+            if (artist, norm_title) in scan_keys:
+                continue
+            album_ids = lg["album_ids"]
+            # Skip group if any edition is already under /dupes (already deduped by auto-move or manual)
+            if db_plex:
+                if any(_album_path_under_dupes(db_plex, aid) for aid in album_ids):
                     continue
-                album_ids = lg["album_ids"]
-                # Skip group if any edition is already under /dupes (already deduped by auto-move or manual)
-                if db_plex:
-                    if any(_album_path_under_dupes(db_plex, aid) for aid in album_ids):
-                        continue
-                first_id = album_ids[0]
-                n = len(album_ids)
-                display_title = (norm_title or "").title() or "Unknown"
-                same_folder = False
-                best_fmt = "—"
-                best_path = ""
-                if db_plex:
-                    try:
-                        folder_keys = set()
-                        for aid in album_ids:
-                            p = first_part_path(db_plex, aid)
-                            if not p:
-                                continue
-                            try:
-                                rp = path_for_fs_access(Path(p)).resolve()
-                                folder_keys.add(str(rp))
-                            except Exception:
-                                folder_keys.add(str(p))
-                        same_folder = len(folder_keys) == 1 and bool(folder_keys)
-                        if folder_keys:
-                            best_path = sorted(folder_keys)[0]
-                            best_fmt = get_primary_format(Path(best_path))
-                    except Exception:
-                        same_folder = False
-                        best_fmt = "—"
-                        best_path = ""
-                cards.append({
-                    "artist_key": artist.replace(" ", "_"),
-                    "artist": artist,
-                    "album_id": first_id,
-                    "n": n,
-                    "best_thumb": _duplicate_album_thumb_url(first_id),
-                    "best_title": display_title,
-                    "best_fmt": best_fmt,
-                    "formats": [best_fmt] + ["—"] * max(0, n - 1),
-                    "used_ai": False,
-                    "ai_provider": "",
-                    "ai_model": "",
-                    "size": 0,
-                    "size_mb": 0,
-                    "track_count": 0,
-                    "path": best_path,
-                    # Library-only groups are shown for manual review in Unduper.
-                    "no_move": True,
-                })
+            first_id = album_ids[0]
+            n = len(album_ids)
+            display_title = (norm_title or "").title() or "Unknown"
+            same_folder = False
+            best_fmt = "—"
+            best_path = ""
             if db_plex:
                 try:
-                    db_plex.close()
+                    folder_keys = set()
+                    for aid in album_ids:
+                        p = first_part_path(db_plex, aid)
+                        if not p:
+                            continue
+                        try:
+                            rp = path_for_fs_access(Path(p)).resolve()
+                            folder_keys.add(str(rp))
+                        except Exception:
+                            folder_keys.add(str(p))
+                    same_folder = len(folder_keys) == 1 and bool(folder_keys)
+                    if folder_keys:
+                        best_path = sorted(folder_keys)[0]
+                        best_fmt = get_primary_format(Path(best_path))
                 except Exception:
-                    pass
+                    same_folder = False
+                    best_fmt = "—"
+                    best_path = ""
+            cards.append({
+                "artist_key": artist.replace(" ", "_"),
+                "artist": artist,
+                "album_id": first_id,
+                "n": n,
+                "best_thumb": _duplicate_album_thumb_url(first_id),
+                "best_title": display_title,
+                "best_fmt": best_fmt,
+                "formats": [best_fmt] + ["—"] * max(0, n - 1),
+                "used_ai": False,
+                "ai_provider": "",
+                "ai_model": "",
+                "size": 0,
+                "size_mb": 0,
+                "track_count": 0,
+                "path": best_path,
+                # Library-only groups are shown for manual review in Unduper.
+                "no_move": True,
+            })
+        if db_plex:
+            try:
+                db_plex.close()
+            except Exception:
+                pass
     return jsonify(cards)
 
 
@@ -64353,7 +66240,7 @@ def api_statistics_scan_moves_audit():
     scan_id = int(scan_id_raw or 0)
     try:
         if scan_id <= 0:
-            con = sqlite3.connect(str(STATE_DB_FILE))
+            con = _open_db(str(STATE_DB_FILE))
             cur = con.cursor()
             cur.execute("SELECT MAX(scan_id) FROM scan_history")
             row = cur.fetchone()
@@ -64417,8 +66304,7 @@ def api_statistics_scan_moves_audit():
 @app.get("/api/scan-history")
 def api_scan_history():
     """Return list of all scan history entries."""
-    import sqlite3
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     cur.execute("PRAGMA table_info(scan_history)")
     cols_info = [r[1] for r in cur.fetchall()]
@@ -64542,8 +66428,7 @@ def api_scan_history():
 @app.delete("/api/scan-history")
 def api_scan_history_clear():
     """Delete all scan history entries (and related scan_editions). Requires confirmation from client."""
-    import sqlite3
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     try:
         cur.execute("DELETE FROM ai_scan_cost_rollups")
@@ -64636,9 +66521,8 @@ def add_broken_album_to_lidarr(artist_name: str, album_id: int, musicbrainz_rele
 def api_broken_albums():
     """Return list of broken albums in selected library sections only (SECTION_IDS)."""
     _reload_section_ids_from_db()
-    import sqlite3
     import json
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     cur = con.cursor()
     cur.execute("""
         SELECT artist, album_id, expected_track_count, actual_track_count,
@@ -64776,7 +66660,7 @@ def _run_incomplete_albums_scan():
         finally:
             db_conn.close()
 
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         cur = con.cursor()
         cur.execute("PRAGMA table_info(scan_history)")
         cols = [r[1] for r in cur.fetchall()]
@@ -64858,7 +66742,7 @@ def _run_incomplete_albums_scan():
                         state["incomplete_scan"]["current_artist"] = artist_name
                         state["incomplete_scan"]["current_album"] = title_str
                 diag = _incomplete_album_disk_crosscheck(db_conn, artist_name, aid, tracks, folder, title_str)
-                con = sqlite3.connect(str(STATE_DB_FILE))
+                con = _open_db(str(STATE_DB_FILE))
                 c = con.cursor()
                 c.execute("""
                     INSERT OR REPLACE INTO incomplete_album_diagnostics
@@ -64902,7 +66786,7 @@ def _run_incomplete_albums_scan():
     end_time = time.time()
     duration_seconds = int(end_time - start_time)
     artists_total_val = len(artists_merged)
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     cur.execute(
         "UPDATE scan_history SET status = 'completed', end_time = ?, duration_seconds = ?, broken_albums_count = ?, artists_processed = ? WHERE scan_id = ?",
@@ -64954,7 +66838,7 @@ def api_incomplete_albums_scan_progress():
 def api_incomplete_albums_results():
     """Return list of incomplete album diagnostics for a run_id (default: latest run)."""
     run_id = request.args.get("run_id", type=int)
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     if run_id is None:
         cur.execute("SELECT MAX(run_id) FROM incomplete_album_diagnostics")
@@ -65011,7 +66895,7 @@ def api_incomplete_albums_move():
         target_dir = "/dupes/incomplete_albums"
     target_path = Path(target_dir)
     target_path.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     cur.execute(
         """
@@ -65047,17 +66931,13 @@ def api_incomplete_albums_move():
         src_folder = path_for_fs_access(Path(str(diag.get("folder") or "")))
         if not src_folder.exists():
             continue
-        dst = target_path / src_folder.name
-        counter = 1
-        while dst.exists():
-            dst = target_path / f"{src_folder.name} ({counter})"
-            counter += 1
+        dst = _next_available_folder_path(target_path / src_folder.name)
         try:
             safe_move(str(src_folder), str(dst))
             moved.append({"artist": artist, "album_id": album_id, "moved_to": str(dst)})
             scan_id = run_id
             if scan_id:
-                con = sqlite3.connect(str(STATE_DB_FILE))
+                con = _open_db(str(STATE_DB_FILE))
                 c = con.cursor()
                 try:
                     missing_in_plex = json.loads(str(diag.get("missing_in_plex") or "[]"))
@@ -65102,7 +66982,7 @@ def api_incomplete_albums_move():
 def api_incomplete_albums_export(run_id):
     """Export incomplete album diagnostics for run_id as JSON or CSV. Query: format=json|csv (default json)."""
     fmt = (request.args.get("format") or "json").strip().lower()
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     cur.execute("""
         SELECT artist, album_id, title_raw, folder, classification, missing_in_plex, missing_on_disk, expected_track_count, actual_track_count, detected_at
@@ -65185,31 +67065,30 @@ def api_library_stats():
             return jsonify({"error": "PostgreSQL unavailable"}), 503
         try:
             with conn.cursor() as cur:
+                # Albums and artists in one pass over files_albums.
                 cur.execute(
                     f"""
-                    SELECT COUNT(*)
+                    SELECT COUNT(*), COUNT(DISTINCT alb.artist_id)
                     FROM files_albums alb
                     WHERE {matched_where}
                     """
                 )
-                albums = int((cur.fetchone() or [0])[0] or 0)
-                cur.execute(
-                    f"""
-                    SELECT COUNT(DISTINCT alb.artist_id)
-                    FROM files_albums alb
-                    WHERE {matched_where}
-                    """
-                )
-                artists = int((cur.fetchone() or [0])[0] or 0)
-                cur.execute(
-                    f"""
-                    SELECT COUNT(*)
-                    FROM files_tracks tr
-                    JOIN files_albums alb ON alb.id = tr.album_id
-                    WHERE {matched_where}
-                    """
-                )
-                tracks = int((cur.fetchone() or [0])[0] or 0)
+                row = cur.fetchone() or (0, 0)
+                albums = int(row[0] or 0)
+                artists = int(row[1] or 0)
+                if include_unmatched:
+                    # No match gate: every indexed track counts, and we already read that total.
+                    tracks = indexed_tracks
+                else:
+                    cur.execute(
+                        f"""
+                        SELECT COUNT(*)
+                        FROM files_tracks tr
+                        JOIN files_albums alb ON alb.id = tr.album_id
+                        WHERE {matched_where}
+                        """
+                    )
+                    tracks = int((cur.fetchone() or [0])[0] or 0)
             payload = {"artists": artists, "albums": albums, "tracks": tracks}
             _files_cache_set_json(cache_key, payload, ttl=30)
             return jsonify(payload)
@@ -66694,7 +68573,6 @@ def api_library_artists():
     if not SECTION_IDS:
         return jsonify({"artists": [], "total": 0, "limit": 100, "offset": 0})
     
-    import sqlite3
     search_query = request.args.get("search", "").strip()
     limit = int(request.args.get("limit", 100))
     offset = int(request.args.get("offset", 0))
@@ -66751,7 +68629,7 @@ def api_library_artists():
     """, section_args + section_args + search_args + [limit, offset])
     
     artists = []
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     cur = con.cursor()
     
     aggregated: dict[str, dict] = {}
@@ -72397,7 +74275,6 @@ def api_library_artist_detail(artist_id):
     if not PLEX_CONFIGURED:
         return jsonify({"error": "Plex not configured"}), 503
     
-    import sqlite3
     db_conn = plex_connect()
     
     # Get artist info
@@ -72488,7 +74365,7 @@ def api_library_artist_detail(artist_id):
     albums = []
     
     # Prefer scan_editions when a completed scan exists (source of truth for format, tags, broken, duplicate group)
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     cur = con.cursor()
     scan_id = get_last_completed_scan_id()
     scan_editions_by_album: dict[int, dict] = {}
@@ -72596,7 +74473,7 @@ def api_library_artist_detail(artist_id):
                 format_str = get_primary_format(folder)
                 if format_str and format_str.upper() in lossless_formats:
                     is_lossless = True
-                first_audio = next((p for p in folder.rglob("*") if AUDIO_RE.search(p.name)), None)
+                first_audio = next((p for p in folder.rglob("*") if _is_audio_name(p.name)), None)
                 if first_audio:
                     meta = extract_tags(first_audio)
                     if is_broken and broken_detail and isinstance(broken_detail.get("missing_indices"), list):
@@ -74055,7 +75932,7 @@ def api_library_missing_tags():
 
     scan_id = get_last_completed_scan_id()
     if scan_id:
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         cur = con.cursor()
         cur.execute("""
             SELECT artist, album_id, title_raw, missing_required_tags
@@ -75069,6 +76946,16 @@ def api_library_track_stream(track_id):
         return jsonify({"error": "Stream failed"}), 502
 
 
+@app.get("/api/plex/album/<int:album_id>/thumb")
+def api_plex_album_thumb(album_id):
+    """Serve a Plex album thumb from the on-disk thumb cache (fetched from Plex on first hit)."""
+    path = cache_cover(album_id)
+    if path is None:
+        return _transparent_png_response(max_age=60)
+    # The URL is the same for every artwork version: revalidate so a new poster replaces the old one.
+    return _serve_image_file_cached(path, max_age=0, revalidate=True)
+
+
 @app.get("/api/library/files/album/<int:album_id>/cover")
 def api_library_files_album_cover(album_id):
     """Serve album cover from files-library index (files mode)."""
@@ -75517,8 +77404,7 @@ def api_lidarr_add_album():
     
     if success:
         # Update database
-        import sqlite3
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+        con = _open_db(str(STATE_DB_FILE), timeout=30)
         cur = con.cursor()
         cur.execute("""
             UPDATE broken_albums SET sent_to_lidarr = 1 
@@ -75548,7 +77434,7 @@ def _run_lidarr_add_incomplete_albums(rows: List[tuple]):
             "failed": 0,
             "result": None,
         }
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     try:
         for i, (artist_name, album_id, mbid, album_title) in enumerate(rows):
             with lock:
@@ -75598,7 +77484,7 @@ def api_lidarr_add_incomplete_albums():
     with lock:
         if state.get("lidarr_add_incomplete") and state["lidarr_add_incomplete"].get("running"):
             return jsonify({"error": "Add incomplete albums already running", "started": False}), 409
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     try:
         cur = con.cursor()
         cur.execute(
@@ -75764,8 +77650,7 @@ def api_lidarr_add_artist():
     
     if success:
         # Update database
-        import sqlite3
-        con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+        con = _open_db(str(STATE_DB_FILE), timeout=30)
         cur = con.cursor()
         cur.execute("""
             INSERT OR REPLACE INTO monitored_artists 
@@ -76253,7 +78138,7 @@ def api_library_artist_similar(artist_id):
                 try:
                     folder = first_part_path(db_conn, album_id)
                     if folder:
-                        first_audio = next((p for p in folder.rglob("*") if AUDIO_RE.search(p.name)), None)
+                        first_audio = next((p for p in folder.rglob("*") if _is_audio_name(p.name)), None)
                         if first_audio:
                             meta = extract_tags(first_audio)
                             mbid = meta.get('musicbrainz_albumartistid') or meta.get('musicbrainz_artistid')
@@ -76364,8 +78249,7 @@ def api_library_artist_monitored(artist_id):
         # files-library artist IDs are internal to the index and may change after rebuilds;
         # keep this endpoint deterministic in files mode.
         return jsonify({"monitored": False})
-    import sqlite3
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     cur = con.cursor()
     cur.execute("SELECT 1 FROM monitored_artists WHERE artist_id = ?", (artist_id,))
     is_monitored = cur.fetchone() is not None
@@ -78069,7 +79953,7 @@ def api_library_artist_images(artist_id):
         album_id = album_rows[0][0]
         folder = first_part_path(db_conn, album_id)
         if folder:
-            first_audio = next((p for p in folder.rglob("*") if AUDIO_RE.search(p.name)), None)
+            first_audio = next((p for p in folder.rglob("*") if _is_audio_name(p.name)), None)
             if first_audio:
                 meta = extract_tags(first_audio)
                 mbid = meta.get('musicbrainz_albumartistid') or meta.get('musicbrainz_artistid')
@@ -78133,7 +80017,7 @@ def api_library_album_tags(album_id):
             except (TypeError, ValueError):
                 current_tags = {}
             if not current_tags:
-                first_audio = next((p for p in folder_path.rglob("*") if AUDIO_RE.search(p.name)), None)
+                first_audio = next((p for p in folder_path.rglob("*") if _is_audio_name(p.name)), None)
                 current_tags = extract_tags(first_audio) if first_audio else {}
             thumb_url_files = (
                 f"{request.url_root.rstrip('/')}/api/library/files/album/{album_id}/cover"
@@ -78184,7 +80068,7 @@ def api_library_album_tags(album_id):
         return jsonify({"error": "Album folder not found"}), 404
     
     # Get tags from first audio file
-    first_audio = next((p for p in folder.rglob("*") if AUDIO_RE.search(p.name)), None)
+    first_audio = next((p for p in folder.rglob("*") if _is_audio_name(p.name)), None)
     current_tags = extract_tags(first_audio) if first_audio else {}
     
     # Try to find MusicBrainz release-group info
@@ -80237,7 +82121,7 @@ def _improve_single_album(album_id: int, db_conn, known_release_group_id: Option
         skip_mb_for_live = True
         steps.append("Skipped MusicBrainz for live album; trying Discogs/Bandcamp for tags and cover")
 
-    audio_files = [p for p in folder.rglob("*") if AUDIO_RE.search(p.name)]
+    audio_files = [p for p in folder.rglob("*") if _is_audio_name(p.name)]
     if not audio_files:
         return {"steps": ["No audio files in album folder"], "summary": "No audio files found.", "tags_updated": False, "cover_saved": False, "provider_used": None}
 
@@ -81420,7 +83304,7 @@ def _improve_folder_by_path(folder_path: Path) -> dict:
     if not folder_path.is_dir():
         return {"steps": ["Not a directory"], "summary": "Invalid path.", "tags_updated": False, "cover_saved": False, "provider_used": None, "dupes_in_folder": [], "files_updated": 0}
 
-    audio_files = sorted([p for p in folder_path.rglob("*") if AUDIO_RE.search(p.name)])
+    audio_files = sorted([p for p in folder_path.rglob("*") if _is_audio_name(p.name)])
     if not audio_files:
         return {"steps": ["No audio files"], "summary": "No audio files found.", "tags_updated": False, "cover_saved": False, "provider_used": None, "dupes_in_folder": [], "files_updated": 0}
 
@@ -84338,7 +86222,7 @@ def _scan_collect_profile_enrich_targets(scan_id: int | None) -> list[dict]:
     rows: list[dict] = []
     duplicate_loser_album_ids: set[int] = set()
     try:
-        con = sqlite3.connect(str(STATE_DB_FILE))
+        con = _open_db(str(STATE_DB_FILE))
         cur = con.cursor()
         try:
             cur.execute("PRAGMA table_info(duplicates_loser)")
@@ -84861,7 +86745,7 @@ def api_library_improve_all():
         # even when there is no MusicBrainz ID yet (e.g. Bandcamp/Last.fm-only matches, or new REQUIRED_TAGS like "genre").
         scan_id = get_last_completed_scan_id()
         if scan_id is not None:
-            con = sqlite3.connect(str(STATE_DB_FILE))
+            con = _open_db(str(STATE_DB_FILE))
             cur = con.cursor()
             try:
                 # 1) Albums avec MBID (comportement historique)
@@ -84971,7 +86855,6 @@ def api_musicbrainz_fix_artist_tags():
     if not artist_id:
         return jsonify({"error": "Missing artist_id"}), 400
     
-    import sqlite3
     db_conn = plex_connect()
     
     # Get artist info
@@ -84999,7 +86882,7 @@ def api_musicbrainz_fix_artist_tags():
         album_id = album_rows[0][0]
         folder = first_part_path(db_conn, album_id)
         if folder:
-            first_audio = next((p for p in folder.rglob("*") if AUDIO_RE.search(p.name)), None)
+            first_audio = next((p for p in folder.rglob("*") if _is_audio_name(p.name)), None)
             if first_audio:
                 meta = extract_tags(first_audio)
                 mbid = meta.get('musicbrainz_albumartistid') or meta.get('musicbrainz_artistid')
@@ -85041,7 +86924,7 @@ def api_musicbrainz_fix_artist_tags():
                 continue
             
             # Get all audio files in album
-            audio_files = [p for p in folder.rglob("*") if AUDIO_RE.search(p.name)]
+            audio_files = [p for p in folder.rglob("*") if _is_audio_name(p.name)]
             if not audio_files:
                 continue
             
@@ -85191,7 +87074,7 @@ def api_musicbrainz_fix_album_tags():
         genre_val = (tags_to_apply.get("genre") or "").strip()
         from mutagen import File as MutagenFile
 
-        audio_files = [p for p in folder_path.rglob("*") if AUDIO_RE.search(p.name)]
+        audio_files = [p for p in folder_path.rglob("*") if _is_audio_name(p.name)]
         updated = 0
         errors = []
         for p in audio_files:
@@ -85241,8 +87124,7 @@ def api_musicbrainz_fix_album_tags():
 @app.get("/api/scan-history/<int:scan_id>")
 def api_scan_history_detail(scan_id):
     """Return details of a specific scan or dedupe entry."""
-    import sqlite3
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     cur.execute("PRAGMA table_info(scan_history)")
     cols_info = [r[1] for r in cur.fetchall()]
@@ -85483,7 +87365,7 @@ def api_scan_history_pipeline_trace(scan_id: int):
     outcome = str(request.args.get("outcome") or "").strip()
     where_sql, params = _scan_pipeline_trace_filtered_query(scan_id, q=q, provider=provider, outcome=outcome)
     offset = (page - 1) * page_size
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     con.row_factory = sqlite3.Row
     try:
         cur = con.cursor()
@@ -85578,7 +87460,7 @@ def api_scan_history_pipeline_trace_export(scan_id: int):
     provider = str(request.args.get("provider") or "").strip()
     outcome = str(request.args.get("outcome") or "").strip()
     where_sql, params = _scan_pipeline_trace_filtered_query(scan_id, q=q, provider=provider, outcome=outcome)
-    con = sqlite3.connect(str(STATE_DB_FILE), timeout=30)
+    con = _open_db(str(STATE_DB_FILE), timeout=30)
     con.row_factory = sqlite3.Row
     try:
         cur = con.cursor()
@@ -85783,7 +87665,7 @@ def _scan_move_artwork_source_path(move_id: int, *, target: str = "moved") -> Op
     target_key = str(target or "moved").strip().lower() or "moved"
     import sqlite3
 
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     con.row_factory = sqlite3.Row
     try:
         cur = con.cursor()
@@ -85985,7 +87867,7 @@ def _scan_move_expected_tracks(
 def _scan_move_detail_payload(move_id: int) -> Optional[dict[str, Any]]:
     import sqlite3
 
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     con.row_factory = sqlite3.Row
     try:
         cur = con.cursor()
@@ -86124,7 +88006,7 @@ def api_scan_history_moves(scan_id):
         reason_filter = ""
 
     import sqlite3
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     con.row_factory = sqlite3.Row
     cur = con.cursor()
     move_cols = _scan_moves_columns(cur)
@@ -86232,7 +88114,7 @@ def api_scan_history_moves(scan_id):
 def api_scan_history_moves_summary(scan_id: int):
     import sqlite3
 
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     con.row_factory = sqlite3.Row
     cur = con.cursor()
     cur.execute("PRAGMA table_info(scan_moves)")
@@ -86324,8 +88206,7 @@ def api_scan_history_restore(scan_id):
     move_ids = data.get("move_ids", [])
     restore_all = data.get("all", False)
     
-    import sqlite3
-    con = sqlite3.connect(str(STATE_DB_FILE))
+    con = _open_db(str(STATE_DB_FILE))
     cur = con.cursor()
     
     if restore_all:
@@ -86378,13 +88259,7 @@ def api_scan_history_restore(scan_id):
     con.close()
     
     # Refresh Plex for affected artists
-    for artist in artists_to_refresh:
-        letter = quote_plus(artist[0].upper())
-        art_enc = quote_plus(artist)
-        try:
-            plex_api(f"/library/sections/{SECTION_ID}/refresh?path=/music/matched/{letter}/{art_enc}", method="GET")
-        except Exception as e:
-            logging.warning(f"Restore: plex refresh failed for {artist}: {e}")
+    _plex_refresh_artists(artists_to_refresh, empty_trash=False, caller="Restore")
     
     return jsonify({
         "restored": restored_count,
@@ -86427,7 +88302,8 @@ def api_dedupe():
         remaining = total - progress
         eta_seconds = max(0, int(remaining * avg_per_group))
 
-    return jsonify(
+    # Idle polls see an identical payload every time, so let the ETag turn them into 304s.
+    return _conditional_json(dict(
         deduping=deduping,
         progress=progress,
         total=total,
@@ -86438,7 +88314,90 @@ def api_dedupe():
         eta_seconds=eta_seconds,
         current_group=current_group,
         last_write=last_write,
-    )
+    ))
+
+# Each open /api/events stream pins one waitress worker; past this many, clients keep polling.
+_PROGRESS_EVENT_STREAMS_MAX = max(1, WEBUI_HTTP_THREADS // 4)
+_progress_event_streams = threading.BoundedSemaphore(_PROGRESS_EVENT_STREAMS_MAX)
+
+
+def _progress_event_snapshot() -> dict:
+    """Counters pushed by /api/events; clients refetch /api/progress or /api/dedupe when they move."""
+    with lock:
+        return {
+            "scanning": bool(state.get("scanning")),
+            "scan_paused": bool(scan_is_paused.is_set()),
+            "scan_progress": int(state.get("scan_progress") or 0),
+            "scan_total": int(state.get("scan_total") or 0),
+            "scan_step_progress": int(state.get("scan_step_progress") or 0),
+            "scan_artists_processed": int(state.get("scan_artists_processed") or 0),
+            "deduping": bool(state.get("deduping")),
+            "dedupe_progress": int(state.get("dedupe_progress") or 0),
+            "dedupe_total": int(state.get("dedupe_total") or 0),
+        }
+
+
+@app.get("/api/events")
+def api_events():
+    """
+    Server-Sent Events stream of scan/dedupe progress: one event whenever the counters or the
+    scanning/deduping flags change, instead of the UI polling /api/progress and /api/dedupe.
+    Background jobs wake the stream via _notify_progress_event(); stages that only touch other
+    fields are picked up by a short re-check while a job runs. Returns 503 when all stream slots
+    are taken so the client falls back to polling.
+
+    Duplicate groups found by the running scan follow as named "duplicates" events
+    ({"seq", "reset", "cards"}), starting with every group of the scan so far. "reset" is true
+    when groups fell out of the bounded feed before this stream sent them; the client then
+    reloads /api/duplicates instead.
+    """
+    if not _progress_event_streams.acquire(blocking=False):
+        return jsonify({"error": "Too many event streams"}), 503
+
+    def gen():
+        last = None
+        last_sent = 0.0
+        group_seq = 0
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                with _progress_event_cond:
+                    seen_generation = _progress_event_generation
+                snap = _progress_event_snapshot()
+                now = time.time()
+                if snap != last:
+                    yield f"data: {json.dumps(snap)}\n\n"
+                    last, last_sent = snap, now
+                elif now - last_sent >= 15.0:
+                    # Comment line: keeps proxies from timing out and surfaces closed sockets.
+                    yield ": keep-alive\n\n"
+                    last_sent = now
+                feed = [ev for ev in list(_SCAN_GROUP_EVENTS) if ev[0] > group_seq]
+                if feed:
+                    reset = bool(group_seq and feed[0][0] > group_seq + 1)
+                    snapshot: dict[str, list] = {}
+                    with lock:
+                        for _seq, artist_name, groups in feed:
+                            snapshot[artist_name] = list(groups)
+                    group_seq = feed[-1][0]
+                    cards = [] if reset else _build_card_list(snapshot)
+                    payload = {"seq": group_seq, "reset": reset, "cards": cards}
+                    yield f"event: duplicates\ndata: {json.dumps(payload, default=str)}\n\n"
+                    last_sent = now
+                busy = snap["scanning"] or snap["deduping"]
+                with _progress_event_cond:
+                    _progress_event_cond.wait_for(
+                        lambda: _progress_event_generation != seen_generation,
+                        timeout=1.0 if busy else 15.0,
+                    )
+        finally:
+            _progress_event_streams.release()
+
+    resp = Response(gen(), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
 
 @app.get("/details/<artist>/<int:album_id>")
 def details(artist, album_id):
@@ -86487,11 +88446,14 @@ def details(artist, album_id):
         for i, e in enumerate(editions):
             folder_path = path_for_fs_access(Path(e["folder"])) if e.get("folder") else None
             is_best = i == 0
-            # Size: losers have size_mb in DB; best we compute (frontend expects bytes)
-            if is_best:
+            # Size: best carries size_mb and losers size from the DB (frontend expects bytes). Only walk
+            # the folder when neither is known, and remember the result so reopening the modal is free.
+            size_mb = e.get("size_mb") if is_best else e.get("size")
+            if not size_mb:
                 size_mb = safe_folder_size(folder_path) // (1024 * 1024) if folder_path else 0
-            else:
-                size_mb = e.get("size", 0) or (safe_folder_size(folder_path) // (1024 * 1024) if folder_path else 0)
+                if size_mb:
+                    e["size_mb" if is_best else "size"] = size_mb
+            size_mb = int(size_mb)
             size_bytes = size_mb * (1024 * 1024)
 
             track_list = []
@@ -86549,12 +88511,19 @@ def details(artist, album_id):
                 except Exception:
                     pass
 
-            thumb_data = _duplicate_cover_data_for_edition(e)
+            # Editions the Files index knows get a cover URL (browser-cached, no base64 in the JSON);
+            # only editions outside the index fall back to an inline data URI.
+            thumb_data = None
             thumb_url = ""
-            try:
-                thumb_url = _duplicate_album_thumb_url(int(e.get("album_id") or 0), folder_path)
-            except Exception:
-                thumb_url = ""
+            files_album_id = _files_album_id_for_folder(folder_path) if folder_path is not None else 0
+            if files_album_id > 0:
+                thumb_url = _duplicate_album_thumb_url(files_album_id, size=512)
+            else:
+                thumb_data = _duplicate_cover_data_for_edition(e)
+                try:
+                    thumb_url = _duplicate_album_thumb_url(int(e.get("album_id") or 0), folder_path)
+                except Exception:
+                    thumb_url = ""
             path_str = str(folder_path) if folder_path is not None else ""
             out.append({
                 "thumb_data": thumb_data,
@@ -86618,36 +88587,27 @@ def _run_dedupe_artist_one(art: str, album_id: int, keep_edition_album_id: Optio
         state["deduping"] = True
         state["dedupe_progress"] = 0
         state["dedupe_total"] = 1
+    _notify_progress_event()
     try:
         moved_list = perform_dedupe(group_copy, manual_override=True)
         removed_count = len(moved_list)
         total_mb = sum(item["size"] for item in moved_list)
-        increment_stat("removed_dupes", removed_count)
-        increment_stat("space_saved", total_mb)
+        increment_stats({"removed_dupes": removed_count, "space_saved": total_mb})
         logging.debug(f"dedupe_artist(): removed {removed_count} dupes, freed {total_mb} MB")
 
-        letter = quote_plus(art[0].upper())
-        art_enc = quote_plus(art)
-        try:
-            plex_api(f"/library/sections/{SECTION_ID}/refresh?path=/music/matched/{letter}/{art_enc}", method="GET")
-            plex_api(f"/library/sections/{SECTION_ID}/emptyTrash", method="PUT")
-        except Exception as e:
-            logging.warning(f"dedupe_artist(): plex refresh/emptyTrash failed: {e}")
+        _plex_refresh_artists([art], caller="dedupe_artist()")
 
         with lock:
             groups = state["duplicates"].get(art, [])
             groups[:] = [gr for gr in groups if not _group_contains_album_id(gr, album_id)]
             if not groups:
                 state["duplicates"].pop(art, None)
-            con = sqlite3.connect(str(STATE_DB_FILE))
-            cur = con.cursor()
-            cur.execute("DELETE FROM duplicates_best WHERE artist = ? AND album_id = ?", (art, group_copy.get("album_id")))
-            cur.execute("DELETE FROM duplicates_loser WHERE artist = ? AND album_id = ?", (art, group_copy.get("album_id")))
-            con.commit()
-            con.close()
+            _bump_duplicates_version()
             sid = state.get("scan_id")
             state["dedupe_progress"] = 1
             state["deduping"] = False
+        _notify_progress_event()
+        _remove_dedupe_groups_from_db([(art, int(group_copy.get("album_id") or 0))])
         if sid is not None:
             update_dedupe_scan_summary(sid, total_mb, removed_count)
     except Exception as e:
@@ -86656,6 +88616,7 @@ def _run_dedupe_artist_one(art: str, album_id: int, keep_edition_album_id: Optio
             state["deduping"] = False
             state["dedupe_progress"] = 0
             state["dedupe_total"] = 0
+        _notify_progress_event()
 
 
 @app.post("/dedupe/artist/<artist>")
@@ -86924,49 +88885,56 @@ def dedupe_selected():
     total_moved = 0
     removed_count = 0
     artists_to_refresh = set()
+    # Deduped groups are dropped from the DB (one transaction) and from state["duplicates"]
+    # (one lock acquisition, one pass per artist) together after the loop.
+    removed_groups: List[Tuple[str, int]] = []
+    removed_by_artist: Dict[str, set[int]] = defaultdict(set)
+    # Selection keys actually deduped, echoed back so the UI can drop those cards without a refetch.
+    removed_keys: List[str] = []
 
-    for sel in selected:
-        try:
-            art_key, aid_str = sel.split("||", 1)
-            art = art_key.replace("_", " ").strip()
-            album_id = int(aid_str)
-        except Exception:
-            continue
-        g = _find_duplicate_group_by_artist_album(art, album_id, allow_library_build=True)
-        if not g:
-            logging.debug("dedupe_selected(): group not found for %s", sel)
-            continue
-        if bool(g.get("same_folder")):
-            logging.debug("dedupe_selected(): skipping same-folder group for %s", sel)
-            continue
-        logging.debug("dedupe_selected(): processing group for artist '%s', album_id=%s", art, album_id)
-        moved = perform_dedupe(g, manual_override=True)
-        moved_list.extend(moved)
-        total_moved += sum(item["size"] for item in moved)
-        removed_count += len(moved)
-        artists_to_refresh.add(art)
-        best_album_id = int(g.get("album_id") or g.get("best", {}).get("album_id") or 0)
-        loser_album_ids = [int((e or {}).get("album_id") or 0) for e in (g.get("losers") or [])]
-        loser_album_ids = [aid for aid in loser_album_ids if aid]
-        if best_album_id:
-            _remove_dedupe_group_from_db(art, best_album_id, loser_album_ids)
-        with lock:
-            groups = state["duplicates"].get(art, [])
-            groups[:] = [gr for gr in groups if not _group_contains_album_id(gr, album_id)]
-            if not groups and art in state["duplicates"]:
-                del state["duplicates"][art]
+    try:
+        for sel in dict.fromkeys(selected):
+            try:
+                art_key, aid_str = sel.split("||", 1)
+                art = art_key.replace("_", " ").strip()
+                album_id = int(aid_str)
+            except Exception:
+                continue
+            g = _find_duplicate_group_by_artist_album(art, album_id, allow_library_build=True)
+            if not g:
+                logging.debug("dedupe_selected(): group not found for %s", sel)
+                continue
+            if bool(g.get("same_folder")):
+                logging.debug("dedupe_selected(): skipping same-folder group for %s", sel)
+                continue
+            logging.debug("dedupe_selected(): processing group for artist '%s', album_id=%s", art, album_id)
+            moved = perform_dedupe(g, manual_override=True)
+            moved_list.extend(moved)
+            total_moved += sum(item["size"] for item in moved)
+            removed_count += len(moved)
+            artists_to_refresh.add(art)
+            best_album_id = int(g.get("album_id") or g.get("best", {}).get("album_id") or 0)
+            if best_album_id:
+                removed_groups.append((art, best_album_id))
+            removed_by_artist[art].add(album_id)
+            removed_keys.append(sel)
+    finally:
+        _remove_dedupe_groups_from_db(removed_groups)
+        if removed_by_artist:
+            with lock:
+                for art, album_ids in removed_by_artist.items():
+                    groups = state["duplicates"].get(art, [])
+                    groups[:] = [
+                        gr for gr in groups
+                        if not any(_group_contains_album_id(gr, aid) for aid in album_ids)
+                    ]
+                    if not groups and art in state["duplicates"]:
+                        del state["duplicates"][art]
+                _bump_duplicates_version()
 
-    for art in artists_to_refresh:
-        letter  = quote_plus(art[0].upper())
-        art_enc = quote_plus(art)
-        try:
-            plex_api(f"/library/sections/{SECTION_ID}/refresh?path=/music/matched/{letter}/{art_enc}", method="GET")
-            plex_api(f"/library/sections/{SECTION_ID}/emptyTrash", method="PUT")
-        except Exception as e:
-            logging.warning(f"dedupe_selected(): plex refresh/emptyTrash failed for {art}: {e}")
+    _plex_refresh_artists(artists_to_refresh, caller="dedupe_selected()")
 
-    increment_stat("removed_dupes", removed_count)
-    increment_stat("space_saved", total_moved)
+    increment_stats({"removed_dupes": removed_count, "space_saved": total_moved})
     logging.debug(f"dedupe_selected(): removed {removed_count} dupes, freed {total_moved} MB")
 
     with lock:
@@ -86974,7 +88942,7 @@ def dedupe_selected():
     if sid is not None:
         update_dedupe_scan_summary(sid, total_moved, removed_count)
 
-    return jsonify(moved=moved_list), 200
+    return jsonify(moved=moved_list, removed=removed_keys), 200
 
 
 # ─────────────────────────────── Assistant API ───────────────────────────────
@@ -87717,19 +89685,25 @@ def api_library_entity_discover():
 
 # ─── Integrated frontend (self-hosted: serve SPA from same container) ─────────────
 if _HAS_STATIC_UI:
-    def _ui_build_payload():
-        """Return the current Vite asset paths from dist/index.html.
+    _index_html_cache: dict[str, Any] = {"mtime": None, "html": None, "build": None}
+    _index_html_cache_lock = threading.Lock()
 
-        This is used by the frontend to detect stale SPA tabs after a deploy and prompt reload.
-        """
-        import re
+    def _index_html_cached() -> tuple[Optional[str], Optional[float], Optional[dict]]:
+        """Return (index.html text, mtime, parsed build payload), re-reading only when the file changes.
 
+        The SPA shell is requested on every page load and the build payload on every stale-tab
+        poll; one stat() per call replaces reading and regex-scanning the file each time.
+        """
         index_path = os.path.join(_FRONTEND_DIST, "index.html")
         try:
-            with open(index_path, "r", encoding="utf-8") as f:
-                html = f.read()
-        except Exception as e:
-            return {"ok": False, "error": f"Failed to read index.html: {e}"}
+            mtime = os.path.getmtime(index_path)
+        except OSError:
+            mtime = None
+        with _index_html_cache_lock:
+            if mtime is not None and _index_html_cache["mtime"] == mtime and _index_html_cache["html"] is not None:
+                return _index_html_cache["html"], mtime, _index_html_cache["build"]
+        with open(index_path, "r", encoding="utf-8") as f:
+            html = f.read()
 
         js_matches = re.findall(r'src="(/assets/[^"]+\.js)"', html)
         css_matches = re.findall(r'href="(/assets/[^"]+\.css)"', html)
@@ -87738,17 +89712,26 @@ if _HAS_STATIC_UI:
         asset_js = next((p for p in js_matches if "/assets/index-" in p), js_matches[0] if js_matches else None)
         asset_css = next((p for p in css_matches if "/assets/index-" in p), css_matches[0] if css_matches else None)
 
-        try:
-            index_mtime = os.path.getmtime(index_path)
-        except Exception:
-            index_mtime = None
-
-        return {
+        build = {
             "ok": True,
-            "index_mtime": index_mtime,
+            "index_mtime": mtime,
             "asset_js": asset_js,
             "asset_css": asset_css,
         }
+        with _index_html_cache_lock:
+            _index_html_cache.update({"mtime": mtime, "html": html, "build": build})
+        return html, mtime, build
+
+    def _ui_build_payload():
+        """Return the current Vite asset paths from dist/index.html.
+
+        This is used by the frontend to detect stale SPA tabs after a deploy and prompt reload.
+        """
+        try:
+            _html, _mtime, build = _index_html_cached()
+        except Exception as e:
+            return {"ok": False, "error": f"Failed to read index.html: {e}"}
+        return dict(build or {})
 
     @app.get("/api/ui/build")
     def api_ui_build():
@@ -87760,7 +89743,11 @@ if _HAS_STATIC_UI:
         return resp
 
     def _send_index_no_cache():
-        resp = send_from_directory(_FRONTEND_DIST, "index.html")
+        try:
+            html, _mtime, _build = _index_html_cached()
+            resp = Response(html, mimetype="text/html")
+        except Exception:
+            resp = send_from_directory(_FRONTEND_DIST, "index.html")
         # Prevent stale SPA shell after deploys; assets remain hash-versioned.
         resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
         resp.headers["Pragma"] = "no-cache"
@@ -87792,7 +89779,11 @@ import os
 if __name__ == "__main__":
     # Web UI only: start server first so UI is available immediately, then run startup checks (cross-check in background).
     def run_server():
-        app.run(host="0.0.0.0", port=WEBUI_PORT, threaded=True, use_reloader=False)
+        if waitress_serve is not None:
+            # Single process on purpose: scan/dedupe state lives in this interpreter.
+            waitress_serve(app, host="0.0.0.0", port=WEBUI_PORT, threads=WEBUI_HTTP_THREADS, ident="PMDA")
+        else:
+            app.run(host="0.0.0.0", port=WEBUI_PORT, threaded=True, use_reloader=False)
 
     # Fast checks before server (must never hard-exit files mode).
     if PLEX_CONFIGURED:
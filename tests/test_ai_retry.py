@@ -0,0 +1,86 @@
+import sys
+import time
+import types
+import unittest
+from unittest import mock
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class APITimeoutError(Exception):
+    pass
+
+
+class AIRetryDeadlineTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.errors = []
+
+        def fake_once(*args, **kwargs):
+            self.calls.append(kwargs.get("request_timeout_sec"))
+            if self.errors:
+                raise self.errors.pop(0)
+            return "ok"
+
+        self._patches = [
+            mock.patch.object(pmda, "_call_ai_provider_once", fake_once),
+            mock.patch.object(pmda, "AI_RATE_LIMIT_MAX_RETRIES", 3, create=True),
+            mock.patch.object(pmda, "AI_MAX_REQUESTS_PER_MINUTE", 0, create=True),
+            mock.patch.object(pmda, "AI_MAX_TOKENS_PER_MINUTE", 0, create=True),
+            mock.patch.object(pmda, "_ai_pacing_next_at", 0.0),
+            mock.patch.object(pmda.time, "sleep", lambda seconds: None),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in reversed(self._patches):
+            patcher.stop()
+
+    def _call(self, **kwargs):
+        return pmda.call_ai_provider("openai", "m", "sys", "user", 16, analysis_type="test", **kwargs)
+
+    def test_rate_limits_are_retried_without_deadline(self):
+        self.errors = [RateLimitError("429"), RateLimitError("429")]
+        self.assertEqual(self._call(), "ok")
+        self.assertEqual(len(self.calls), 3)
+
+    def test_timeouts_are_not_retried(self):
+        self.errors = [APITimeoutError("timed out")]
+        with self.assertRaises(APITimeoutError):
+            self._call()
+        self.assertEqual(len(self.calls), 1)
+
+    def test_no_retry_once_backoff_would_pass_the_deadline(self):
+        self.errors = [RateLimitError("429")]
+        with self.assertRaises(RateLimitError):
+            self._call(deadline=time.monotonic() + 0.5)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_pacing_backlog_past_the_deadline_sends_nothing(self):
+        with mock.patch.object(pmda, "AI_MAX_REQUESTS_PER_MINUTE", 60, create=True), \
+                mock.patch.object(pmda, "_ai_pacing_next_at", time.monotonic() + 30.0):
+            with self.assertRaises(TimeoutError):
+                self._call(request_timeout_sec=5.0)
+            self.assertEqual(self.calls, [])
+            self.assertLess(pmda._ai_pacing_next_at, time.monotonic() + 31.0)
+
+    def test_attempt_timeout_is_capped_by_the_deadline(self):
+        self._call(request_timeout_sec=30.0, deadline=time.monotonic() + 10.0)
+        self.assertLessEqual(self.calls[0], 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+class FolderMetaCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="pmda-cache-sig-")
+        self.root = Path(self._tmp.name)
+        self._orig_cache_db = pmda.CACHE_DB_FILE
+        pmda.CACHE_DB_FILE = self.root / "cache.db"
+        pmda.init_cache_db()
+        self.album = self.root / "Artist" / "Album"
+        (self.album / "CD1").mkdir(parents=True)
+        (self.album / "CD1" / "01.flac").write_bytes(b"a" * 100)
+        (self.album / "cover.jpg").write_bytes(b"c" * 10)
+
+    def tearDown(self):
+        pmda.CACHE_DB_FILE = self._orig_cache_db
+        self._tmp.cleanup()
+
+    def _rows(self):
+        return pmda._cache_db_conn().execute("SELECT path FROM folder_meta").fetchall()
+
+    def test_scan_walk_fills_row_so_lookups_skip_the_walk(self):
+        audio = pmda._list_audio_files_recording_meta(self.album)
+        self.assertEqual(audio, [self.album / "CD1" / "01.flac"])
+        with mock.patch.object(pmda, "_walk_folder_meta", side_effect=AssertionError("walked")):
+            self.assertEqual(pmda.cached_folder_meta(self.album), (110, "FLAC"))
+
+    def test_change_deep_in_the_tree_invalidates_cached_size(self):
+        deep = self.album / "CD1" / "Bonus" / "Extra"
+        deep.mkdir(parents=True)
+        self.assertEqual(pmda.cached_folder_meta(self.album), (110, "FLAC"))
+        (deep / "02.flac").write_bytes(b"d" * 40)
+        st = os.stat(deep)
+        os.utime(deep, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(pmda.cached_folder_meta(self.album), (150, "FLAC"))
+
+    def test_unchanged_folder_is_served_from_cache(self):
+        self.assertEqual(pmda.cached_folder_meta(self.album), (110, "FLAC"))
+        pmda._cache_db_conn().execute("UPDATE folder_meta SET size_bytes = 7")
+        self.assertEqual(pmda.cached_folder_meta(self.album), (7, "FLAC"))
+
+    def test_prune_drops_rows_for_missing_folders(self):
+        other = self.root / "Artist" / "Other"
+        other.mkdir()
+        (other / "01.mp3").write_bytes(b"m")
+        pmda.cached_folder_meta(self.album)
+        pmda.cached_folder_meta(other)
+        shutil.rmtree(other)
+        self.assertEqual(pmda.prune_folder_meta(), 1)
+        self.assertEqual(self._rows(), [(str(self.album),)])
+
+
+def _id3v2_header(tag_size: int) -> bytes:
+    syncsafe = bytes(((tag_size >> shift) & 0x7F) for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + syncsafe
+
+
+class AudioHeadHashTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="pmda-head-hash-")
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = self.root / name
+        path.write_bytes(data)
+        return str(path)
+
+    def test_mp3_frames_after_large_id3_tag_are_part_of_the_hash(self):
+        # 200 KiB of embedded art: the first MPEG frame starts well past the 64 KiB head.
+        tag = _id3v2_header(200 * 1024) + b"\x00" * (200 * 1024)
+        tail = b"\x55" * (100 * 1024)
+        a = self._write("a.mp3", tag + b"\xff\xfb\x90\x64" + b"\x00" * 4092 + tail)
+        b = self._write("b.mp3", tag + b"\xff\xfb\xb0\x64" + b"\x00" * 4092 + tail)
+        self.assertNotEqual(pmda._file_head_hash(a), pmda._file_head_hash(b))
+
+    def test_m4a_moov_after_mdat_is_part_of_the_hash(self):
+        ftyp = (16).to_bytes(4, "big") + b"ftypM4A \x00\x00\x00\x00"
+        mdat = (8 + 300 * 1024).to_bytes(4, "big") + b"mdat" + b"\x00" * (300 * 1024)
+        moov_body = b"\x01" * 1024
+        moov = (8 + len(moov_body) + 200 * 1024).to_bytes(4, "big") + b"moov" + moov_body + b"\x02" * (200 * 1024)
+        changed = moov.replace(moov_body, b"\x03" * 1024)
+        a = self._write("a.m4a", ftyp + mdat + moov)
+        b = self._write("b.m4a", ftyp + mdat + changed)
+        self.assertNotEqual(pmda._file_head_hash(a), pmda._file_head_hash(b))
+
+    def test_size_change_and_identical_copies(self):
+        data = b"fLaC" + os.urandom(1000)
+        a = self._write("a.flac", data)
+        b = self._write("b.flac", data)
+        c = self._write("c.flac", data + b"\x00")
+        self.assertEqual(pmda._file_head_hash(a), pmda._file_head_hash(b))
+        self.assertNotEqual(pmda._file_head_hash(a), pmda._file_head_hash(c))
+        self.assertIsNone(pmda._file_head_hash(str(self.root / "missing.flac")))
+
+
+if __name__ == "__main__":
+    unittest.main()
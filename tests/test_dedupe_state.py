@@ -0,0 +1,84 @@
+import copy
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+def _group(artist: str, best_id: int, loser_id: int) -> dict:
+    return {
+        "artist": artist,
+        "album_id": best_id,
+        "best": {"album_id": best_id, "title_raw": f"Album {best_id}", "folder": f"/music/{artist}/{best_id}"},
+        "losers": [{"album_id": loser_id, "title_raw": f"Album {best_id}", "folder": f"/music/{artist}/{loser_id}"}],
+    }
+
+
+class BackgroundDedupeStateTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="pmda-dedupe-state-")
+        self._orig_dupes = pmda.state.get("duplicates")
+        self._patches = [
+            mock.patch.object(pmda, "ensure_dedupe_scan_id", lambda: None),
+            mock.patch.object(pmda, "update_dedupe_scan_summary", lambda *args, **kwargs: None),
+            mock.patch.object(pmda, "increment_stats", lambda *args, **kwargs: None),
+            mock.patch.object(pmda, "notify_discord", lambda *args, **kwargs: None),
+            mock.patch.object(pmda, "_remove_dedupe_groups_from_db", lambda groups: None),
+            mock.patch.object(pmda, "SECTION_IDS", [], create=True),
+            mock.patch.object(pmda, "DUPE_ROOT", Path(self._tmp.name), create=True),
+            mock.patch.object(
+                pmda,
+                "perform_dedupe",
+                lambda group, best_folders=None, manual_override=False: [
+                    {"size": 1} for _ in group.get("losers", [])
+                ],
+            ),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        with pmda.lock:
+            pmda.state["duplicates"] = self._orig_dupes if self._orig_dupes is not None else {}
+            pmda.state["deduping"] = False
+        self._tmp.cleanup()
+
+    def test_copied_groups_are_removed_from_state(self):
+        kept = _group("Artist A", 3, 4)
+        with pmda.lock:
+            pmda.state["duplicates"] = {
+                "Artist A": [_group("Artist A", 1, 2), kept],
+                "Artist B": [_group("Artist B", 5, 6)],
+            }
+            # Same shape as load_scan_from_db() / the pipeline auto-dedupe: copies, not the state objects.
+            submitted = [copy.deepcopy(pmda.state["duplicates"]["Artist A"][0])]
+            submitted += copy.deepcopy(pmda.state["duplicates"]["Artist B"])
+            version_before = int(pmda.state.get("duplicates_version") or 0)
+
+        pmda.background_dedupe(submitted)
+
+        with pmda.lock:
+            remaining = pmda.state["duplicates"]
+            self.assertEqual(list(remaining), ["Artist A"])
+            self.assertEqual(len(remaining["Artist A"]), 1)
+            self.assertIs(remaining["Artist A"][0], kept)
+            self.assertGreater(int(pmda.state.get("duplicates_version") or 0), version_before)
+            self.assertFalse(pmda.state["deduping"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import sys
+import types
+import unittest
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+@unittest.skipIf(pmda.rapidfuzz_process is None, "rapidfuzz not installed")
+class DupeFuzzyTitleClusterTests(unittest.TestCase):
+    def test_near_identical_titles_cluster_and_distinct_titles_do_not(self):
+        editions = [
+            {"album_id": 1, "_dupe_title_norm_loose": "the dark side of the moon"},
+            {"album_id": 2, "_dupe_title_norm_loose": "dark side of the moon the"},
+            {"album_id": 3, "_dupe_title_norm_loose": "the dark side of the mooon"},
+            {"album_id": 4, "_dupe_title_norm_loose": "wish you were here"},
+        ]
+
+        clusters = pmda._dupe_fuzzy_title_clusters(editions)
+
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(sorted(e["album_id"] for e in clusters[0]), [1, 2, 3])
+
+    def test_untitled_keys_are_ignored(self):
+        editions = [
+            {"album_id": 1, "_dupe_title_norm_loose": "", "album_norm": "__untitled__1"},
+            {"album_id": 2, "_dupe_title_norm_loose": "", "album_norm": "__untitled__2"},
+        ]
+
+        self.assertEqual(pmda._dupe_fuzzy_title_clusters(editions), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+class PlexAlbumThumbRouteTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="pmda-plex-thumb-")
+        self.thumb = Path(self._tmp.name) / "thumb.jpg"
+        self.thumb.write_bytes(b"\xff\xd8old")
+        self._patches = [
+            mock.patch.object(pmda, "AUTH_DISABLE", True),
+            mock.patch.object(pmda, "cache_cover", lambda album_id: self.thumb),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+        self.client = pmda.app.test_client()
+
+    def tearDown(self):
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        self._tmp.cleanup()
+
+    def test_thumb_is_revalidated_so_new_artwork_replaces_the_cached_one(self):
+        first = self.client.get("/api/plex/album/42/thumb")
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("must-revalidate", first.headers["Cache-Control"])
+        etag = first.headers["ETag"]
+        self.assertEqual(
+            self.client.get("/api/plex/album/42/thumb", headers={"If-None-Match": etag}).status_code, 304
+        )
+
+        self.thumb = Path(self._tmp.name) / "thumb-v2.jpg"
+        self.thumb.write_bytes(b"\xff\xd8new poster")
+        again = self.client.get("/api/plex/album/42/thumb", headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.data, b"\xff\xd8new poster")
+
+
+if __name__ == "__main__":
+    unittest.main()
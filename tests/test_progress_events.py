@@ -0,0 +1,127 @@
+import json
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+def _next_data_event(chunks, event: str | None = None) -> dict:
+    prefix = f"event: {event}\ndata: " if event else "data: "
+    for chunk in chunks:
+        text = chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+        if text.startswith(prefix):
+            return json.loads(text[len(prefix):])
+    raise AssertionError("event stream ended without a data event")
+
+
+class ProgressEventsStreamTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="pmda-progress-events-")
+        tmp_path = Path(self._tmp.name)
+        self._orig = {
+            "CONFIG_DIR": pmda.CONFIG_DIR,
+            "STATE_DB_FILE": pmda.STATE_DB_FILE,
+            "SETTINGS_DB_FILE": pmda.SETTINGS_DB_FILE,
+            "CACHE_DB_FILE": pmda.CACHE_DB_FILE,
+            "AUTH_DISABLE": pmda.AUTH_DISABLE,
+        }
+        pmda.CONFIG_DIR = tmp_path
+        pmda.STATE_DB_FILE = tmp_path / "state.db"
+        pmda.SETTINGS_DB_FILE = tmp_path / "settings.db"
+        pmda.CACHE_DB_FILE = tmp_path / "cache.db"
+        pmda.AUTH_DISABLE = True
+        pmda.init_state_db()
+        pmda.init_settings_db()
+        pmda.init_cache_db()
+        self._slots = mock.patch.object(pmda, "_progress_event_streams", threading.BoundedSemaphore(1))
+        self._slots.start()
+        self.client = pmda.app.test_client()
+
+    def tearDown(self):
+        self._slots.stop()
+        with pmda.lock:
+            pmda.state["deduping"] = False
+            pmda.state["dedupe_progress"] = 0
+            pmda.state["dedupe_total"] = 0
+        for key, value in self._orig.items():
+            setattr(pmda, key, value)
+        self._tmp.cleanup()
+
+    def test_first_event_is_the_current_snapshot_and_changes_are_pushed(self):
+        with pmda.lock:
+            pmda.state["deduping"] = True
+            pmda.state["dedupe_progress"] = 2
+            pmda.state["dedupe_total"] = 5
+        resp = self.client.get("/api/events", buffered=False)
+        try:
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.mimetype, "text/event-stream")
+            chunks = iter(resp.response)
+            first = _next_data_event(chunks)
+            self.assertTrue(first["deduping"])
+            self.assertEqual((first["dedupe_progress"], first["dedupe_total"]), (2, 5))
+
+            with pmda.lock:
+                pmda.state["dedupe_progress"] = 3
+            pmda._notify_progress_event()
+            self.assertEqual(_next_data_event(chunks)["dedupe_progress"], 3)
+        finally:
+            resp.close()
+
+    def test_scan_duplicate_groups_are_streamed_as_card_deltas(self):
+        group = {"artist": "Artist A", "best": {"album_id": 1}, "losers": [{"album_id": 2}]}
+        build_cards = lambda snapshot: [
+            {"artist": artist, "album_id": str(g["best"]["album_id"])}
+            for artist, groups in snapshot.items()
+            for g in groups
+        ]
+        pmda._clear_scan_group_events()
+        self.addCleanup(pmda._clear_scan_group_events)
+        with mock.patch.object(pmda, "_build_card_list", build_cards):
+            pmda._publish_scan_group_event("Artist A", [group])
+            resp = self.client.get("/api/events", buffered=False)
+            try:
+                chunks = iter(resp.response)
+                first = _next_data_event(chunks, "duplicates")
+                self.assertFalse(first["reset"])
+                self.assertEqual(first["cards"], [{"artist": "Artist A", "album_id": "1"}])
+
+                pmda._publish_scan_group_event("Artist B", [dict(group, best={"album_id": 7})])
+                pmda._notify_progress_event()
+                second = _next_data_event(chunks, "duplicates")
+                self.assertGreater(second["seq"], first["seq"])
+                self.assertEqual(second["cards"], [{"artist": "Artist B", "album_id": "7"}])
+            finally:
+                resp.close()
+
+    def test_returns_503_when_stream_slots_are_taken_and_frees_them_on_close(self):
+        first = self.client.get("/api/events", buffered=False)
+        try:
+            self.assertEqual(first.status_code, 200)
+            next(iter(first.response))
+            busy = self.client.get("/api/events", buffered=False)
+            self.assertEqual(busy.status_code, 503)
+        finally:
+            first.close()
+        again = self.client.get("/api/events", buffered=False)
+        try:
+            self.assertEqual(again.status_code, 200)
+        finally:
+            again.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import errno
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.modules.setdefault(
+    "musicbrainzngs",
+    types.SimpleNamespace(
+        set_rate_limit=lambda *args, **kwargs: None,
+        set_useragent=lambda *args, **kwargs: None,
+    ),
+)
+
+import pmda
+
+
+def _cross_device_replace(src, dst):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+class SafeMoveCopyFallbackTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="pmda-safe-move-")
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "src" / "Album"
+        self.src.mkdir(parents=True)
+        self.payload = os.urandom(256 * 1024)
+        (self.src / "01.flac").write_bytes(self.payload)
+        (self.src / "cover.jpg").write_bytes(b"jpeg")
+        self.dst = self.root / "dupes" / "Album"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_copy_file_range_returning_zero_falls_back_to_full_copy(self):
+        with mock.patch.object(pmda.os, "replace", _cross_device_replace), \
+                mock.patch.object(pmda.os, "copy_file_range", lambda *args: 0, create=True):
+            pmda.safe_move(str(self.src), str(self.dst))
+
+        self.assertEqual((self.dst / "01.flac").read_bytes(), self.payload)
+        self.assertEqual((self.dst / "cover.jpg").read_bytes(), b"jpeg")
+        self.assertFalse(self.src.exists())
+
+    def test_short_copy_raises_and_keeps_source(self):
+        calls = {"n": 0}
+
+        def partial_copy(fd_in, fd_out, count):
+            calls["n"] += 1
+            if calls["n"] > 1:
+                return 0
+            chunk = os.read(fd_in, min(count, 1024))
+            os.write(fd_out, chunk)
+            return len(chunk)
+
+        with mock.patch.object(pmda.os, "replace", _cross_device_replace), \
+                mock.patch.object(pmda.os, "copy_file_range", partial_copy, create=True):
+            with self.assertRaises(OSError):
+                pmda.safe_move(str(self.src / "01.flac"), str(self.root / "dupes" / "01.flac"))
+
+        self.assertEqual((self.src / "01.flac").read_bytes(), self.payload)
+
+
+if __name__ == "__main__":
+    unittest.main()